@@ -30,10 +30,12 @@ Safety Features:
 """
 
 import os
+import re
 import sys
 import shutil
 import logging
 import tempfile
+import time
 from pathlib import Path
 from typing import Optional, Callable, Dict, List, Tuple
 from datetime import datetime
@@ -44,6 +46,18 @@ logger = logging.getLogger(__name__)
 # Platform detection
 IS_WINDOWS = sys.platform == "win32"
 
+# KeyManager emits hex-encoded keys; anything else is rejected before PRAGMA key
+_HEX_KEY_PATTERN = re.compile(r"[0-9a-fA-F]+")
+
+# Magic bytes at the start of every unencrypted SQLite 3 database file
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+# Size of each executescript() batch when copying via iterdump()
+DUMP_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Minimum seconds between copy_data progress callbacks
+PROGRESS_MIN_INTERVAL = 0.1
+
 # Import database modules
 try:
     import pysqlcipher3.dbapi2 as sqlite3_encrypted
@@ -117,6 +131,7 @@ class MigrationProgress:
         self._tables_completed = 0
         self._row_count = 0
         self._rows_completed = 0
+        self._last_emit_monotonic = 0.0
 
     def set_table_count(self, count: int):
         """Set total number of tables to migrate."""
@@ -149,6 +164,10 @@ class MigrationProgress:
         """
         Update progress for current table.
 
+        Called once per copied batch. Rows are accumulated silently and the
+        callback only fires when the integer percentage advances, at most
+        every PROGRESS_MIN_INTERVAL seconds (the final update always fires).
+
         Args:
             table_name: Name of table being copied
             rows_copied: Number of rows copied in this table
@@ -159,6 +178,15 @@ class MigrationProgress:
         if self._row_count > 0:
             data_progress = (self._rows_completed / self._row_count)
             percentage = 20 + int(data_progress * 70)  # 20-90% range
+            if percentage == self._percentage:
+                return
+
+            now = time.monotonic()
+            finished = self._rows_completed >= self._row_count
+            if not finished and now - self._last_emit_monotonic < PROGRESS_MIN_INTERVAL:
+                return
+
+            self._last_emit_monotonic = now
             self.update_stage("copy_data", percentage)
 
     def complete_table(self, table_name: str):
@@ -238,94 +266,17 @@ def migrate_to_encrypted(
         except KeyManagementError as e:
             return False, f"Key management error: {e}"
 
-    # Create backup
-    progress.update_stage("backup", 5)
-    try:
-        if backup_path is None:
-            backup_path = _create_backup_path(db_path)
-
-        logger.info(f"Creating backup: {backup_path}")
-        shutil.copy2(db_path, backup_path)
-        progress.update_stage("backup", 10)
-    except Exception as e:
-        logger.error(f"Backup creation failed: {e}", exc_info=True)
-        return False, f"Failed to create backup: {e}"
-
-    # Create temporary encrypted database
-    temp_encrypted_path = None
-    try:
-        # Create temp file for encrypted database
-        temp_fd, temp_encrypted_path = tempfile.mkstemp(suffix=".db", prefix="mailmind_encrypted_")
-        os.close(temp_fd)  # Close file descriptor, we'll use path
-
-        logger.info(f"Creating encrypted database: {temp_encrypted_path}")
-
-        # Open source (unencrypted) and target (encrypted) connections
-        source_conn = sqlite3_plain.connect(db_path)
-        target_conn = sqlite3_encrypted.connect(temp_encrypted_path)
-
-        # Set encryption key on target
-        target_conn.execute(f"PRAGMA key = '{encryption_key}'")
-
-        # Copy schema and data
-        progress.update_stage("create_schema", 15)
-        _copy_database_schema(source_conn, target_conn, progress)
-
-        progress.update_stage("copy_data", 20)
-        _copy_database_data(source_conn, target_conn, progress)
-
-        # Verify integrity
-        progress.update_stage("verify", 90)
-        is_valid, verify_msg = _verify_migration(source_conn, target_conn)
-
-        if not is_valid:
-            raise MigrationValidationError(f"Migration verification failed: {verify_msg}")
-
-        progress.update_stage("verify", 95)
-
-        # Close connections
-        source_conn.close()
-        target_conn.close()
-
-        # Replace original with encrypted database
-        progress.update_stage("finalize", 97)
-        logger.info(f"Replacing original database with encrypted version")
-
-        # Atomic replacement
-        shutil.move(temp_encrypted_path, db_path)
-        temp_encrypted_path = None  # Marked as moved
-
-        progress.update_stage("complete", 100)
-
-        success_msg = f"Database successfully migrated to encrypted format. Backup saved to: {backup_path}"
-        logger.info(success_msg)
-        return True, success_msg
-
-    except Exception as e:
-        # Rollback: restore from backup
-        logger.error(f"Migration failed: {e}", exc_info=True)
-
-        try:
-            logger.warning(f"Rolling back migration - restoring from backup: {backup_path}")
-            shutil.copy2(backup_path, db_path)
-            logger.info("Rollback successful - original database restored")
-        except Exception as rollback_error:
-            logger.critical(f"Rollback failed: {rollback_error}", exc_info=True)
-            raise MigrationRollbackError(
-                f"Migration failed AND rollback failed. "
-                f"Original backup at: {backup_path}. "
-                f"Migration error: {e}. "
-                f"Rollback error: {rollback_error}"
-            )
-
-        # Clean up temp file if it exists
-        if temp_encrypted_path and os.path.exists(temp_encrypted_path):
-            try:
-                os.remove(temp_encrypted_path)
-            except Exception:
-                pass
-
-        return False, f"Migration failed (restored from backup): {e}"
+    return _migrate_between(
+        db_path,
+        backup_path,
+        progress,
+        # SQLCipher without a key reads plain databases and provides sqlcipher_export
+        open_source=sqlite3_encrypted.connect,
+        open_target=lambda path: _open_encrypted(path, encryption_key),
+        target_key=encryption_key,
+        target_label="encrypted",
+        log_success=logger.info,
+    )
 
 
 def migrate_to_unencrypted(
@@ -365,6 +316,51 @@ def migrate_to_unencrypted(
     if not encryption_key:
         return False, "Encryption key required to read encrypted database"
 
+    return _migrate_between(
+        db_path,
+        backup_path,
+        progress,
+        open_source=lambda path: _open_encrypted(path, encryption_key),
+        open_target=sqlite3_plain.connect,
+        target_key="",
+        target_label="unencrypted",
+        log_success=logger.warning,  # Warning level since this reduces security
+    )
+
+
+def _migrate_between(
+    db_path: str,
+    backup_path: Optional[str],
+    progress: MigrationProgress,
+    open_source: Callable[[str], object],
+    open_target: Callable[[str], object],
+    target_key: str,
+    target_label: str,
+    log_success: Callable[[str], None]
+) -> Tuple[bool, str]:
+    """
+    Shared migration flow for both encryption directions.
+
+    Creates the backup, copies schema and data into a temporary database
+    opened via open_target, verifies it and atomically swaps it into place.
+    On failure the original database is restored from the backup.
+
+    Args:
+        db_path: Path to source database
+        backup_path: Optional custom backup path (if None, auto-generates)
+        progress: Progress tracker
+        open_source: Callable(path) returning a ready-to-read source connection
+        open_target: Callable(path) returning a ready-to-write target connection
+        target_key: Key for the target database ("" for unencrypted)
+        target_label: "encrypted" or "unencrypted" (used in file names and messages)
+        log_success: Logger method used for the success message
+
+    Returns:
+        Tuple[bool, str]: (success, message)
+
+    Raises:
+        MigrationRollbackError: If migration fails and rollback also fails
+    """
     # Create backup
     progress.update_stage("backup", 5)
     try:
@@ -378,27 +374,23 @@ def migrate_to_unencrypted(
         logger.error(f"Backup creation failed: {e}", exc_info=True)
         return False, f"Failed to create backup: {e}"
 
-    # Create temporary unencrypted database
-    temp_unencrypted_path = None
+    # Create temporary target database
+    temp_path = None
     try:
-        # Create temp file for unencrypted database
-        temp_fd, temp_unencrypted_path = tempfile.mkstemp(suffix=".db", prefix="mailmind_unencrypted_")
-        os.close(temp_fd)
-
-        logger.info(f"Creating unencrypted database: {temp_unencrypted_path}")
+        # Same directory as db_path so the final os.replace is a same-filesystem rename
+        temp_fd, temp_path = tempfile.mkstemp(
+            suffix=".db",
+            prefix=f"mailmind_{target_label}_",
+            dir=os.path.dirname(os.path.abspath(db_path))
+        )
+        os.close(temp_fd)  # Close file descriptor, we'll use path
 
-        # Open source (encrypted) and target (unencrypted) connections
-        source_conn = sqlite3_encrypted.connect(db_path)
-        source_conn.execute(f"PRAGMA key = '{encryption_key}'")
+        logger.info(f"Creating {target_label} database: {temp_path}")
 
-        target_conn = sqlite3_plain.connect(temp_unencrypted_path)
+        source_conn = open_source(db_path)
 
         # Copy schema and data
-        progress.update_stage("create_schema", 15)
-        _copy_database_schema(source_conn, target_conn, progress)
-
-        progress.update_stage("copy_data", 20)
-        _copy_database_data(source_conn, target_conn, progress)
+        target_conn = _copy_database(source_conn, temp_path, open_target, target_key, progress)
 
         # Verify integrity
         progress.update_stage("verify", 90)
@@ -413,18 +405,20 @@ def migrate_to_unencrypted(
         source_conn.close()
         target_conn.close()
 
-        # Replace original with unencrypted database
+        # Replace original with migrated database
         progress.update_stage("finalize", 97)
-        logger.info(f"Replacing original database with unencrypted version")
+        logger.info(f"Replacing original database with {target_label} version")
 
-        # Atomic replacement
-        shutil.move(temp_unencrypted_path, db_path)
-        temp_unencrypted_path = None
+        # Atomic replacement - flush data before the rename, then the rename itself
+        _fsync_path(temp_path)
+        os.replace(temp_path, db_path)
+        temp_path = None  # Marked as moved
+        _fsync_directory(os.path.dirname(os.path.abspath(db_path)))
 
         progress.update_stage("complete", 100)
 
-        success_msg = f"Database successfully migrated to unencrypted format. Backup saved to: {backup_path}"
-        logger.warning(success_msg)  # Warning level since this reduces security
+        success_msg = f"Database successfully migrated to {target_label} format. Backup saved to: {backup_path}"
+        log_success(success_msg)
         return True, success_msg
 
     except Exception as e:
@@ -444,10 +438,10 @@ def migrate_to_unencrypted(
                 f"Rollback error: {rollback_error}"
             )
 
-        # Clean up temp file
-        if temp_unencrypted_path and os.path.exists(temp_unencrypted_path):
+        # Clean up temp file if it exists
+        if temp_path and os.path.exists(temp_path):
             try:
-                os.remove(temp_unencrypted_path)
+                os.remove(temp_path)
             except Exception:
                 pass
 
@@ -478,6 +472,215 @@ def _create_backup_path(db_path: str) -> str:
     return os.path.join(db_dir, backup_name)
 
 
+def _fsync_path(path: str) -> None:
+    """
+    Flush a file's contents to disk.
+
+    Opened read-write: on Windows os.fsync() is FlushFileBuffers, which
+    fails with EBADF on a read-only descriptor.
+
+    Args:
+        path: File to flush
+    """
+    fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(dir_path: str) -> None:
+    """
+    Flush a directory entry so a preceding rename survives power loss.
+
+    No-op on Windows, where directories cannot be opened for fsync.
+
+    Args:
+        dir_path: Directory containing the renamed file
+    """
+    if IS_WINDOWS:
+        return
+
+    try:
+        fd = os.open(dir_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError as e:
+        logger.warning(f"Could not open directory for fsync: {e}")
+        return
+
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.warning(f"Directory fsync failed: {e}")
+    finally:
+        os.close(fd)
+
+
+def _apply_key(conn, encryption_key: str) -> None:
+    """
+    Apply a SQLCipher key to an open connection.
+
+    PRAGMA statements cannot take bound parameters, so the key is validated
+    as hex before being interpolated. The passphrase form is kept (rather
+    than SQLCipher's x'...' raw-key form) because DatabaseManager opens the
+    same files with it - switching forms would derive a different page key.
+
+    Args:
+        conn: SQLCipher connection
+        encryption_key: Hex-encoded encryption key (from KeyManager)
+
+    Raises:
+        MigrationError: If the key is not a hex string
+    """
+    if not _HEX_KEY_PATTERN.fullmatch(encryption_key):
+        raise MigrationError("Encryption key must be hex-encoded")
+    conn.execute(f"PRAGMA key = '{encryption_key}'")
+
+
+def _open_encrypted(db_path: str, encryption_key: str):
+    """
+    Open a SQLCipher connection for migration and apply the encryption key.
+
+    The connection is short-lived, so SQLCipher's secure allocator
+    (cipher_memory_security) is disabled to avoid zeroing every page buffer.
+    Callers should pass a key pre-derived by KeyManager.
+
+    Args:
+        db_path: Path to encrypted database
+        encryption_key: Hex-encoded encryption key
+
+    Returns:
+        SQLCipher connection with key applied
+    """
+    conn = sqlite3_encrypted.connect(db_path)
+    _apply_key(conn, encryption_key)
+    conn.execute("PRAGMA cipher_memory_security = OFF")
+    return conn
+
+
+def _q(identifier: str) -> str:
+    """Quote an SQLite identifier (table or column name) for interpolation."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _copy_database(
+    source_conn,
+    target_path: str,
+    open_target: Callable[[str], object],
+    target_key: str,
+    progress: MigrationProgress
+):
+    """
+    Copy schema and data into the target database using the fastest available path.
+
+    Strategy (first that works wins):
+    1. ATTACH target + sqlcipher_export() - whole copy inside SQLCipher
+    2. iterdump() piped into executescript() in ~8MB chunks - stays in the SQLite C layer
+    3. Schema copy + batched row copy in Python (last resort)
+
+    Args:
+        source_conn: Source database connection
+        target_path: Path to the (empty) target database file
+        open_target: Callable(path) returning a ready-to-write target connection
+        target_key: Key for the target database ("" for unencrypted)
+        progress: Progress tracker
+
+    Returns:
+        Open target connection containing the copied database
+    """
+    progress.update_stage("create_schema", 15)
+
+    if _export_with_sqlcipher(source_conn, target_path, target_key):
+        progress.update_stage("copy_data", 20)
+        return open_target(target_path)
+
+    target_conn = open_target(target_path)
+    progress.update_stage("copy_data", 20)
+    try:
+        _copy_via_dump(source_conn, target_conn)
+        return target_conn
+    except Exception as e:
+        logger.warning(f"SQL dump copy failed ({e}) - falling back to row-by-row copy")
+
+    # Start over from an empty target file
+    target_conn.close()
+    open(target_path, "wb").close()
+    target_conn = open_target(target_path)
+
+    _copy_database_schema(source_conn, target_conn, progress)
+    _copy_database_data(source_conn, target_conn, progress)
+    return target_conn
+
+
+def _export_with_sqlcipher(source_conn, target_path: str, target_key: str) -> bool:
+    """
+    Copy the source database into target_path with SQLCipher's sqlcipher_export().
+
+    Args:
+        source_conn: Source connection (must be a SQLCipher connection to succeed)
+        target_path: Path to the (empty) target database file
+        target_key: Key for the target database ("" for unencrypted)
+
+    Returns:
+        bool: True if the export completed, False if it is unavailable or failed
+    """
+    try:
+        source_conn.execute("ATTACH DATABASE ? AS migrated KEY ?", (target_path, target_key))
+    except Exception as e:
+        logger.info(f"sqlcipher_export unavailable ({e}) - using SQL dump copy")
+        return False
+
+    try:
+        source_conn.execute("SELECT sqlcipher_export('migrated')")
+        logger.info("Copied database with sqlcipher_export")
+        return True
+    except Exception as e:
+        logger.info(f"sqlcipher_export unavailable ({e}) - using SQL dump copy")
+        return False
+    finally:
+        source_conn.execute("DETACH DATABASE migrated")
+
+
+def _copy_via_dump(source_conn, target_conn) -> None:
+    """
+    Replay source_conn.iterdump() into the target with chunked executescript().
+
+    Each chunk runs in its own transaction. sqlite_sequence statements are
+    deferred to the end since that table only exists once an AUTOINCREMENT
+    table has been created.
+
+    Args:
+        source_conn: Source database connection
+        target_conn: Target database connection
+    """
+    logger.info("Copying database via SQL dump")
+
+    def run(statements: List[str]) -> None:
+        target_conn.executescript("BEGIN;\n" + "\n".join(statements) + "\nCOMMIT;")
+
+    chunk: List[str] = []
+    chunk_bytes = 0
+    sequence_statements: List[str] = []
+
+    for statement in source_conn.iterdump():
+        if statement in ("BEGIN TRANSACTION;", "COMMIT;"):
+            continue
+        if '"sqlite_sequence"' in statement[:32]:
+            sequence_statements.append(statement)
+            continue
+
+        chunk.append(statement)
+        chunk_bytes += len(statement)
+        if chunk_bytes >= DUMP_CHUNK_BYTES:
+            run(chunk)
+            chunk = []
+            chunk_bytes = 0
+
+    if chunk:
+        run(chunk)
+    if sequence_statements:
+        run(sequence_statements)
+
+
 def _copy_database_schema(
     source_conn,
     target_conn,
@@ -576,7 +779,7 @@ def _copy_database_data(
     # Count total rows for progress tracking
     total_rows = 0
     for table_name in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+        cursor.execute(f"SELECT COUNT(*) FROM {_q(table_name)}")
         count = cursor.fetchone()[0]
         total_rows += count
 
@@ -614,13 +817,17 @@ def _copy_table_data(
     """
     # Get column names
     source_cursor = source_conn.cursor()
-    source_cursor.execute(f"PRAGMA table_info({table_name})")
+    source_cursor.execute(f"PRAGMA table_info({_q(table_name)})")
     columns = [row[1] for row in source_cursor.fetchall()]
-    column_names = ", ".join(columns)
+    column_names = ", ".join(_q(column) for column in columns)
     placeholders = ", ".join(["?"] * len(columns))
 
+    # Build statements once per table
+    select_sql = f"SELECT {column_names} FROM {_q(table_name)}"
+    insert_sql = f"INSERT INTO {_q(table_name)} ({column_names}) VALUES ({placeholders})"
+
     # Count rows
-    source_cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+    source_cursor.execute(f"SELECT COUNT(*) FROM {_q(table_name)}")
     row_count = source_cursor.fetchone()[0]
 
     if row_count == 0:
@@ -629,32 +836,17 @@ def _copy_table_data(
 
     logger.debug(f"Copying table {table_name}: {row_count} rows")
 
-    # Copy data in batches
-    source_cursor.execute(f"SELECT {column_names} FROM {table_name}")
+    # Copy data in batches - fetchmany pulls a whole batch across the C
+    # boundary per call; plain tuples avoid per-column Row lookups
+    source_cursor.row_factory = None
+    source_cursor.arraysize = batch_size
+    source_cursor.execute(select_sql)
     target_cursor = target_conn.cursor()
 
     rows_copied = 0
-    batch = []
-
-    for row in source_cursor:
-        batch.append(row)
 
-        if len(batch) >= batch_size:
-            # Insert batch
-            target_cursor.executemany(
-                f"INSERT INTO {table_name} ({column_names}) VALUES ({placeholders})",
-                batch
-            )
-            rows_copied += len(batch)
-            progress.update_table_progress(table_name, len(batch))
-            batch = []
-
-    # Insert remaining rows
-    if batch:
-        target_cursor.executemany(
-            f"INSERT INTO {table_name} ({column_names}) VALUES ({placeholders})",
-            batch
-        )
+    while (batch := source_cursor.fetchmany()):
+        target_cursor.executemany(insert_sql, batch)
         rows_copied += len(batch)
         progress.update_table_progress(table_name, len(batch))
 
@@ -710,10 +902,10 @@ def _verify_migration(source_conn, target_conn) -> Tuple[bool, str]:
 
         # Verify row counts for each table
         for table_name in source_tables:
-            source_cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            source_cursor.execute(f"SELECT COUNT(*) FROM {_q(table_name)}")
             source_count = source_cursor.fetchone()[0]
 
-            target_cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            target_cursor.execute(f"SELECT COUNT(*) FROM {_q(table_name)}")
             target_count = target_cursor.fetchone()[0]
 
             if source_count != target_count:
@@ -736,8 +928,10 @@ def is_database_encrypted(db_path: str) -> Tuple[bool, str]:
     Check if database is encrypted.
 
     Strategy:
-    1. Try to open with plain sqlite3 - if succeeds, it's unencrypted
-    2. If fails with "file is not a database", likely encrypted
+    1. Read the 16-byte file header - plain SQLite files always start with
+       "SQLite format 3\0", while SQLCipher files start with ciphertext
+    2. If the header is missing (empty/truncated file), fall back to opening
+       with plain sqlite3 and querying sqlite_master
 
     Args:
         db_path: Path to database file
@@ -748,6 +942,18 @@ def is_database_encrypted(db_path: str) -> Tuple[bool, str]:
     if not os.path.exists(db_path):
         return False, f"Database not found: {db_path}"
 
+    try:
+        with open(db_path, "rb") as f:
+            header = f.read(len(SQLITE_HEADER))
+    except Exception as e:
+        return False, f"Error checking database: {e}"
+
+    if header == SQLITE_HEADER:
+        return False, "Database is unencrypted"
+    if len(header) == len(SQLITE_HEADER):
+        return True, "Database appears to be encrypted"
+
+    # Header is ambiguous (empty or truncated file) - ask SQLite
     try:
         # Try to open with plain sqlite3
         conn = sqlite3_plain.connect(db_path)
@@ -770,13 +976,22 @@ def is_database_encrypted(db_path: str) -> Tuple[bool, str]:
         return False, f"Error checking database: {e}"
 
 
-def get_database_info(db_path: str, encryption_key: Optional[str] = None) -> Dict:
+def get_database_info(
+    db_path: str,
+    encryption_key: Optional[str] = None,
+    exact: bool = False
+) -> Dict:
     """
     Get database information (table count, row count, size).
 
+    By default row counts come from sqlite_stat1 (populated by ANALYZE) where
+    available, which avoids scanning - and for encrypted databases decrypting -
+    every table. Tables without statistics are counted exactly.
+
     Args:
         db_path: Path to database
         encryption_key: Optional encryption key if database is encrypted
+        exact: If True, always use SELECT COUNT(*) per table
 
     Returns:
         Dict with keys: table_count, row_count, size_bytes, encrypted
@@ -793,20 +1008,18 @@ def get_database_info(db_path: str, encryption_key: Optional[str] = None) -> Dic
         "tables": []
     }
 
-    try:
-        # Try unencrypted first
+    encrypted, _ = is_database_encrypted(db_path)
+    if not encrypted:
         conn = sqlite3_plain.connect(db_path)
-    except sqlite3_plain.DatabaseError:
-        # Try encrypted
-        if encryption_key and SQLCIPHER_AVAILABLE:
-            try:
-                conn = sqlite3_encrypted.connect(db_path)
-                conn.execute(f"PRAGMA key = '{encryption_key}'")
-                info["encrypted"] = True
-            except Exception as e:
-                return {"error": f"Cannot open database: {e}"}
-        else:
-            return {"error": "Database appears encrypted but no key provided"}
+    elif encryption_key and SQLCIPHER_AVAILABLE:
+        try:
+            conn = sqlite3_encrypted.connect(db_path)
+            _apply_key(conn, encryption_key)
+            info["encrypted"] = True
+        except Exception as e:
+            return {"error": f"Cannot open database: {e}"}
+    else:
+        return {"error": "Database appears encrypted but no key provided"}
 
     try:
         cursor = conn.cursor()
@@ -821,12 +1034,16 @@ def get_database_info(db_path: str, encryption_key: Optional[str] = None) -> Dic
         tables = [row[0] for row in cursor.fetchall()]
         info["table_count"] = len(tables)
 
+        estimates = {} if exact else _estimate_row_counts(cursor)
+
         # Count rows in each table
         total_rows = 0
         table_info = []
         for table_name in tables:
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
+            count = estimates.get(table_name)
+            if count is None:
+                cursor.execute(f"SELECT COUNT(*) FROM {_q(table_name)}")
+                count = cursor.fetchone()[0]
             total_rows += count
             table_info.append({"name": table_name, "row_count": count})
 
@@ -838,3 +1055,29 @@ def get_database_info(db_path: str, encryption_key: Optional[str] = None) -> Dic
 
     except Exception as e:
         return {"error": f"Error reading database: {e}"}
+
+
+def _estimate_row_counts(cursor) -> Dict[str, int]:
+    """
+    Read approximate per-table row counts from sqlite_stat1.
+
+    The first integer of each stat entry is the row count ANALYZE observed,
+    so a single query over the statistics table covers every analyzed table.
+
+    Args:
+        cursor: Database cursor
+
+    Returns:
+        Dict mapping table name to estimated row count (empty if ANALYZE never ran)
+    """
+    try:
+        cursor.execute("""
+            SELECT tbl, MAX(CAST(stat AS INTEGER))
+            FROM sqlite_stat1
+            GROUP BY tbl
+        """)
+    except Exception:
+        # sqlite_stat1 only exists once ANALYZE has been run
+        return {}
+
+    return {table_name: count for table_name, count in cursor.fetchall()}
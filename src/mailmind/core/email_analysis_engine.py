@@ -10,7 +10,7 @@ Key Features:
 - Topic/tag extraction (up to 5 tags)
 - Sentiment analysis (positive/neutral/negative/urgent)
 - Action item and deadline extraction
-- Result caching in SQLite (<100ms cache hits)
+- Result caching in SQLite with an in-memory LRU in front (<100ms cache hits)
 - Batch processing queue (10-15 emails/minute)
 - Performance monitoring and metrics
 
@@ -22,26 +22,241 @@ Integration:
 
 import re
 import time
+import queue
+import threading
 import json
 import logging
+import weakref
 from typing import Dict, Any, List, Optional, Callable, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
 from src.mailmind.core.ollama_manager import OllamaManager
 from src.mailmind.core.email_preprocessor import EmailPreprocessor
-from mailmind.database import DatabaseManager
+from mailmind.database import DatabaseManager, DatabaseError, StorageWorker
 from mailmind.core.exceptions import SecurityException
 
 
 logger = logging.getLogger(__name__)
 
+# Fallback parser patterns, compiled once at import
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+_TAGS_RE = re.compile(r'tags?:?\s*([a-z0-9,\s-]+)')
+
+# Analysis prompt: per-email header (filled with format_map) + constant instructions
+_PROMPT_HEADER = """Analyze this email and provide structured output in JSON format.
+
+Email Metadata:
+From: {sender}
+Subject: {subject}
+Date: {date}{thread_info}{attachments_info}
+
+Email Body:
+{body}
+
+"""
+
+_PROMPT_TAIL = """Provide analysis as valid JSON with these exact fields:
+{
+  "priority": "High|Medium|Low",
+  "confidence": 0.92,
+  "summary": "2-3 sentence summary capturing key points and main purpose",
+  "tags": ["tag1", "tag2", "tag3"],
+  "sentiment": "positive|neutral|negative|urgent",
+  "action_items": ["Action 1 with deadline", "Action 2"]
+}
+
+Guidelines:
+- Priority: High for urgent/time-sensitive, Medium for standard, Low for FYI
+- Confidence: 0.0-1.0, higher for clear priority signals
+- Summary: Concise, preserve key details (names, dates, amounts)
+- Tags: Up to 5 relevant topics (lowercase, 1-3 words each)
+- Sentiment: urgent if time-sensitive, otherwise positive/neutral/negative
+- Action items: Extract clear actions with deadlines, or empty array if none
+
+Return ONLY the JSON object, no additional text:"""
+
+# Shorter instructions for common email shapes (see _classify_shape). Same
+# JSON fields as the general prompt, so parsing and caching are unchanged
+_JSON_FIELDS = """{
+  "priority": "High|Medium|Low",
+  "confidence": 0.92,
+  "summary": "...",
+  "tags": ["tag1"],
+  "sentiment": "positive|neutral|negative|urgent",
+  "action_items": ["..."]
+}"""
+
+_SHAPE_PROMPT_TAILS = {
+    'reply': "This is a reply. Return valid JSON only:\n" + _JSON_FIELDS + """
+Summary: 1 sentence on what the reply adds. Priority: High only if it asks
+for something urgent. Tags: up to 3, lowercase. Action items: requests made
+of the recipient, or []. JSON only:""",
+    'newsletter': "This is a newsletter or bulk mailing. Return valid JSON only:\n" + _JSON_FIELDS + """
+Priority: Low unless it needs action (account, billing, security, deadline).
+Summary: 1 sentence. Tags: up to 3, lowercase. Action items: usually []. JSON only:""",
+    'calendar': "This is a calendar invitation or response. Return valid JSON only:\n" + _JSON_FIELDS + """
+Summary: 1 sentence with event, date/time and organizer. Priority: High if
+today/tomorrow or needs a reply. Tags: up to 3, lowercase, include "meeting".
+Action items: e.g. accept/decline, or []. JSON only:""",
+}
+
+# Output token budget per shape; shapes ask for 1-sentence summaries
+_SHAPE_NUM_PREDICT = {'reply': 300, 'newsletter': 250, 'calendar': 250}
+
+_CALENDAR_SUBJECT_RE = re.compile(
+    r'^(invitation|updated invitation|accepted|declined|tentative|canceled event|cancelled event)\b',
+    re.IGNORECASE
+)
+_UNSUBSCRIBE_RE = re.compile(r'unsubscribe', re.IGNORECASE)
+
+# Rough token estimate for budgeting the context window
+_CHARS_PER_TOKEN = 4
+_PROMPT_OVERHEAD_TOKENS = (len(_PROMPT_HEADER) + len(_PROMPT_TAIL)) // _CHARS_PER_TOKEN + 100
+
 
 class EmailAnalysisError(Exception):
     """Base exception for email analysis errors."""
     pass
 
 
+class _JsonObjectScanner:
+    """
+    Incremental brace-depth scanner for the first JSON object in a text stream.
+
+    Characters before the first '{' are skipped; after it, braces inside
+    string literals (including escaped quotes) are ignored. Text can be fed
+    in pieces, e.g. streamed LLM tokens.
+    """
+
+    __slots__ = ('depth', 'started', 'in_string', 'escaped')
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str, start: int = 0) -> int:
+        """
+        Scan text[start:] and continue from the state left by earlier calls.
+
+        Returns:
+            Index just past the closing brace of the object, or -1 if it is
+            still open at the end of text
+        """
+        for i in range(start, len(text)):
+            ch = text[i]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '{':
+                self.started = True
+                self.depth += 1
+            elif not self.started:
+                continue
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+def _find_json(text: str) -> Optional[str]:
+    """
+    Find the first balanced JSON object in text.
+
+    Single pass from the first '{', tracking brace depth outside of string
+    literals. Also covers ```json fenced responses, since the fence text
+    before the object is skipped.
+
+    Args:
+        text: LLM response text
+
+    Returns:
+        The JSON object substring, or None if no balanced object is found
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    end = _JsonObjectScanner().feed(text, start)
+    return text[start:end] if end != -1 else None
+
+
+# simdjson parsers reuse internal buffers and are not thread-safe: one per thread
+_simdjson_local = threading.local()
+
+
+def _loads_json_simd(json_str: str) -> Any:
+    """Parse JSON with a per-thread simdjson parser, returning plain Python objects."""
+    parser = getattr(_simdjson_local, 'parser', None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    doc = parser.parse(json_str.encode('utf-8'))
+    # Convert before the next parse() on this thread invalidates the document
+    if isinstance(doc, simdjson.Object):
+        return doc.as_dict()
+    if isinstance(doc, simdjson.Array):
+        return doc.as_list()
+    return doc
+
+
+def _loads_json(json_str: str) -> Any:
+    """
+    Parse JSON with the fastest available parser: orjson, then simdjson, then the stdlib.
+
+    The stdlib parser is retried on errors from the others because it is more
+    lenient (e.g. NaN/Infinity literals).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    elif SIMDJSON_AVAILABLE:
+        try:
+            return _loads_json_simd(json_str)
+        except ValueError:
+            pass
+    return json.loads(json_str)
+
+
+def _dumps_json(obj: Any) -> str:
+    """
+    Serialize to a JSON string with orjson when installed, else the stdlib.
+
+    Falls back to the stdlib for values orjson rejects (e.g. non-str keys).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
 class EmailAnalysisEngine:
     """
     AI-powered email analysis engine.
@@ -76,25 +291,130 @@ class EmailAnalysisEngine:
         'meeting', 'schedule', 'review', 'update', 'fyi', 'please'
     ]
 
-    def __init__(self, ollama_manager: OllamaManager, db_path: str = 'data/mailmind.db'):
+    # Deadline phrases that also indicate high priority
+    DEADLINE_PATTERNS = [
+        r'by\s+(today|tomorrow|eod|end of day|friday)',
+        r'due\s+(today|tomorrow|this week)',
+        # Lazy so the first date after 'deadline' matches without scanning to end of line
+        r'deadline.*?\d{1,2}[/-]\d{1,2}'
+    ]
+
+    # Compiled once per class: one alternation per tier, so the heuristic is a
+    # single regex pass per tier instead of a substring scan per keyword
+    _HIGH_PRIORITY_RE = re.compile('|'.join(map(re.escape, HIGH_PRIORITY_KEYWORDS)), re.IGNORECASE)
+    _MEDIUM_PRIORITY_RE = re.compile('|'.join(map(re.escape, MEDIUM_PRIORITY_KEYWORDS)), re.IGNORECASE)
+    _DEADLINE_RE = re.compile('|'.join(DEADLINE_PATTERNS), re.IGNORECASE)
+
+    # Max tokens generated per analysis
+    ANALYSIS_NUM_PREDICT = 500
+
+    # Prompts shorter than this (estimated tokens) go to short_email_model
+    SHORT_PROMPT_TOKENS = 1000
+
+    # Smallest num_ctx requested when sizing the context per prompt
+    MIN_NUM_CTX = 512
+
+    # Seconds get_analysis_stats results are reused for
+    STATS_CACHE_TTL = 30
+
+    # Longest get_analysis_stats waits for queued writes before reading
+    STATS_FLUSH_TIMEOUT = 0.5
+
+    # analyze_batch drops one LLM slot when mean recent tokens/sec falls below
+    # this fraction of the best mean seen (GPU saturation), and adds one back otherwise
+    TPS_BACKOFF_RATIO = 0.5
+
+    def __init__(self, ollama_manager: OllamaManager, db_path: str = 'data/mailmind.db',
+                 cache_size: Optional[int] = 1000, max_concurrency: int = 1,
+                 ollama_endpoints: Optional[List[str]] = None,
+                 short_email_model: Optional[str] = None, dynamic_num_ctx: bool = False):
         """
         Initialize Email Analysis Engine.
 
         Args:
             ollama_manager: OllamaManager instance for LLM inference
             db_path: Path to SQLite database file
+            cache_size: Max analyses kept in the in-memory LRU in front of SQLite
+                        (None for no limit)
+            max_concurrency: Emails analyzed in parallel by analyze_batch (default: 1)
+            ollama_endpoints: Optional Ollama hosts to spread batch workers across
+                              round-robin (default: ollama_manager.client only)
+            short_email_model: Optional smaller model (e.g. a q4_0 quant) used for
+                               prompts under SHORT_PROMPT_TOKENS, with a matching
+                               smaller num_ctx
+            dynamic_num_ctx: Size num_ctx per email to the next power of two that
+                             fits prompt + output (default: False; Ollama reloads
+                             the model whenever num_ctx changes)
         """
         self.ollama = ollama_manager
         self.preprocessor = EmailPreprocessor()
+        self.max_concurrency = max(1, max_concurrency)
+        self.short_email_model = short_email_model
+        self.dynamic_num_ctx = dynamic_num_ctx
+
+        # One client per extra endpoint; each batch worker thread is pinned to
+        # the next one in turn on first use
+        self._endpoint_clients = [
+            self._create_client(host, self.max_concurrency) for host in (ollama_endpoints or [])
+        ]
+        self._endpoint_cycle = cycle(self._endpoint_clients) if self._endpoint_clients else None
+        self._endpoint_lock = threading.Lock()
+        self._thread_state = threading.local()
+        self._warm_up_endpoints(ollama_endpoints or [])
 
         # Initialize DatabaseManager (replaces direct SQLite operations)
         self.db = DatabaseManager(db_path=db_path)
 
+        # Cache and metric writes are batched on a background thread so the
+        # analysis path never waits on SQLite commits
+        self._storage = StorageWorker({
+            'email_analysis': self.db.insert_email_analysis_batch,
+            'performance_metrics': self.db.insert_performance_metric_batch,
+        })
+        # Queued writes are still flushed if the engine is dropped or the
+        # process exits without close() (the finalizer also runs at exit)
+        self._storage_finalizer = weakref.finalize(self, self._storage.stop)
+
+        # In-memory LRU keyed by (message_id, model_version). Populated on
+        # cache writes too, so queued analyses are visible before they land
+        self._mem_cache: OrderedDict = OrderedDict()
+        self._mem_cache_max = cache_size
+        self._mem_cache_lock = threading.Lock()
+
+        # Tokens/sec of recent LLM calls, used to adapt batch concurrency
+        self._recent_tps: deque = deque(maxlen=32)
+        self._peak_tps = 0.0
+
+        # (time bucket, stats) from the last get_analysis_stats call
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
         logger.info(f"EmailAnalysisEngine initialized with DatabaseManager: {db_path}")
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued cache and performance writes reach the database.
+
+        Args:
+            timeout: Optional maximum seconds to wait
+
+        Returns:
+            True if all pending writes completed
+        """
+        return self._storage.flush(timeout)
+
+    def close(self):
+        """Write pending results and stop the background storage worker."""
+        self._storage_finalizer()
+
+    def clear_memory_cache(self):
+        """Drop all analyses from the in-memory cache (SQLite cache is untouched)."""
+        with self._mem_cache_lock:
+            self._mem_cache.clear()
+
 
     def analyze_email(self, raw_email: Any, use_cache: bool = True,
-                     force_reanalyze: bool = False) -> Dict[str, Any]:
+                     force_reanalyze: bool = False,
+                     on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Analyze email with LLM and return structured results.
 
@@ -110,6 +430,8 @@ class EmailAnalysisEngine:
             raw_email: Raw email in any supported format (dict, MIME, Message)
             use_cache: Check cache before running analysis (default: True)
             force_reanalyze: Force re-analysis even if cached (default: False)
+            on_token: Optional callback receiving each streamed chunk of LLM
+                      output, for progressive display ("priority" comes first)
 
         Returns:
             Analysis results dictionary:
@@ -129,83 +451,131 @@ class EmailAnalysisEngine:
         Raises:
             EmailAnalysisError: If analysis fails critically
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Step 1: Preprocess email
-            logger.debug("Preprocessing email...")
-            preprocessed = self.preprocessor.preprocess_email(raw_email)
-            message_id = preprocessed['metadata']['message_id']
+            preprocessed, message_id, cached = self._prepare_email(
+                raw_email, use_cache=use_cache, force_reanalyze=force_reanalyze)
+            return self._complete_analysis(preprocessed, message_id, cached, start_ns,
+                                           on_token=on_token)
+        except Exception as e:
+            return self._failed_analysis(e, start_ns)
 
-            logger.debug(f"Email preprocessed: message_id={message_id}")
+    def _prepare_email(self, raw_email: Any, use_cache: bool = True,
+                       force_reanalyze: bool = False) -> Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]:
+        """
+        Run the CPU-side steps before the LLM call: preprocessing and cache check.
 
-            # Step 2: Check cache (unless force_reanalyze)
-            if use_cache and not force_reanalyze:
-                cached = self._get_cached_analysis(message_id)
-                if cached:
-                    logger.info(f"Cache hit for message_id={message_id}")
-                    cached['cache_hit'] = True
-                    cached['processing_time_ms'] = int((time.time() - start_time) * 1000)
-                    return cached
+        Args:
+            raw_email: Raw email in any supported format (dict, MIME, Message)
+            use_cache: Check cache before running analysis
+            force_reanalyze: Skip the cache check
 
-            logger.debug("Cache miss, proceeding with LLM analysis")
+        Returns:
+            Tuple of (preprocessed email, message_id, cached analysis or None)
+        """
+        # Step 1: Preprocess email
+        logger.debug("Preprocessing email...")
+        preprocessed = self.preprocessor.preprocess_email(raw_email)
+        message_id = preprocessed['metadata']['message_id']
 
-            # Step 3: Quick priority heuristic (for progressive disclosure)
-            quick_priority = self._quick_priority_heuristic(preprocessed)
-            logger.debug(f"Quick priority: {quick_priority}")
-
-            # Step 4: Build LLM prompt
-            prompt = self._build_analysis_prompt(preprocessed)
-            logger.debug(f"Prompt built ({len(prompt)} chars)")
-
-            # Step 5: Generate analysis with LLM
-            logger.info("Calling LLM for analysis...")
-            llm_start = time.time()
-
-            response = self.ollama.client.generate(
-                model=self.ollama.current_model,
-                prompt=prompt,
-                options={
-                    'temperature': 0.3,
-                    'num_ctx': self.ollama.context_window,
-                    'num_predict': 500,  # Max tokens for analysis
-                    'stop': ['}']  # Stop at end of JSON
-                }
-            )
+        logger.debug(f"Email preprocessed: message_id={message_id}")
 
-            llm_time = time.time() - llm_start
-            logger.info(f"LLM analysis completed in {llm_time:.2f}s")
+        # Step 2: Check cache (unless force_reanalyze)
+        cached = None
+        if use_cache and not force_reanalyze:
+            cached = self._get_cached_analysis(message_id)
 
-            # Step 6: Parse LLM response
-            analysis = self._parse_analysis_response(response['response'])
+        return preprocessed, message_id, cached
 
-            # Step 7: Add metadata
-            processing_time = int((time.time() - start_time) * 1000)
-            analysis['processing_time_ms'] = processing_time
-            analysis['tokens_per_second'] = self._calculate_tokens_per_sec(response)
-            analysis['model_version'] = self.ollama.current_model
-            analysis['cache_hit'] = False
+    def _complete_analysis(self, preprocessed: Dict[str, Any], message_id: str,
+                           cached: Optional[Dict[str, Any]], start_ns: int,
+                           on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        Finish analysis of a prepared email: return the cache hit or run the LLM.
 
-            # Use LLM priority, but fallback to quick heuristic if confidence is low
-            if analysis.get('confidence', 0) < 0.5:
-                logger.warning("Low confidence, using quick priority heuristic")
-                analysis['priority'] = quick_priority
-                analysis['confidence'] = 0.5
+        Args:
+            preprocessed: Output of EmailPreprocessor
+            message_id: Email message ID
+            cached: Cached analysis from _prepare_email, if any
+            start_ns: time.perf_counter_ns() when analysis of this email started
+            on_token: Optional callback for streamed LLM output chunks
 
-            logger.info(f"Analysis complete: priority={analysis['priority']}, "
-                       f"confidence={analysis['confidence']:.2f}, "
-                       f"time={processing_time}ms")
+        Returns:
+            Analysis results dictionary (see analyze_email)
+        """
+        if cached:
+            logger.info(f"Cache hit for message_id={message_id}")
+            cached['cache_hit'] = True
+            cached['processing_time_ms'] = (time.perf_counter_ns() - start_ns) // 1_000_000
+            return cached
+
+        logger.debug("Cache miss, proceeding with LLM analysis")
+
+        # Step 3: Quick priority heuristic runs only if the LLM is unsure (below)
+
+        # Step 4: Build LLM prompt (shorter, specialized for common shapes)
+        shape = self._classify_shape(preprocessed)
+        prompt = self._build_analysis_prompt(preprocessed, shape=shape)
+        logger.debug(f"Prompt built ({len(prompt)} chars, shape={shape})")
+
+        # Step 5: Generate analysis with LLM
+        logger.info("Calling LLM for analysis...")
+        llm_start_ns = time.perf_counter_ns()
+
+        response = self._generate_json(
+            prompt, on_token=on_token,
+            num_predict=_SHAPE_NUM_PREDICT.get(shape, self.ANALYSIS_NUM_PREDICT)
+        )
+
+        llm_ms = (time.perf_counter_ns() - llm_start_ns) // 1_000_000
+        logger.info(f"LLM analysis completed in {llm_ms}ms")
+
+        # Step 6: Parse LLM response
+        analysis = self._parse_analysis_response(response['response'])
+
+        # Step 7: Add metadata
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        analysis['processing_time_ms'] = processing_time
+        analysis['tokens_per_second'] = self._calculate_tokens_per_sec(response)
+        if analysis['tokens_per_second'] > 0:
+            self._recent_tps.append(analysis['tokens_per_second'])
+        analysis['model_version'] = response['model']
+        analysis['cache_hit'] = False
+
+        # Use LLM priority, but fallback to quick heuristic if confidence is low
+        if analysis.get('confidence', 0) < 0.5:
+            quick_priority = self._quick_priority_heuristic(preprocessed)
+            logger.warning(f"Low confidence, using quick priority heuristic: {quick_priority}")
+            analysis['priority'] = quick_priority
+            analysis['confidence'] = 0.5
 
-            # Step 8: Cache results
-            self._cache_analysis(message_id, preprocessed, analysis)
+        logger.info(f"Analysis complete: priority={analysis['priority']}, "
+                   f"confidence={analysis['confidence']:.2f}, "
+                   f"time={processing_time}ms")
 
-            # Step 9: Log performance
-            self._log_performance(analysis, operation='email_analysis')
+        # Step 8: Cache results
+        self._cache_analysis(message_id, preprocessed, analysis)
 
-            return analysis
+        # Step 9: Log performance
+        self._log_performance(analysis, operation='email_analysis')
 
-        except SecurityException as e:
+        return analysis
+
+    def _failed_analysis(self, error: Exception, start_ns: int) -> Dict[str, Any]:
+        """
+        Build the result returned when analysis raises.
+
+        Args:
+            error: Exception raised while analyzing
+            start_ns: time.perf_counter_ns() when analysis of this email started
+
+        Returns:
+            Blocked analysis for SecurityException, default analysis otherwise
+        """
+        if isinstance(error, SecurityException):
             # Handle security blocked emails (Story 3.2 AC1, AC2)
+            e = error
             logger.warning(f"Email blocked for security: {e.pattern_name} (severity: {e.severity})")
 
             # Return special analysis indicating email was blocked
@@ -218,7 +588,7 @@ class EmailAnalysisEngine:
                 'tags': ['security', 'blocked', e.pattern_name],
                 'sentiment': 'blocked',
                 'action_items': ['Review security settings if this email should be allowed'],
-                'processing_time_ms': int((time.time() - start_time) * 1000),
+                'processing_time_ms': (time.perf_counter_ns() - start_ns) // 1_000_000,
                 'tokens_per_second': 0.0,
                 'model_version': self.ollama.current_model,
                 'cache_hit': False,
@@ -229,10 +599,179 @@ class EmailAnalysisEngine:
                 }
             }
 
-        except Exception as e:
-            logger.error(f"Email analysis failed: {e}", exc_info=True)
-            # Return default analysis rather than failing completely
-            return self._default_analysis(str(e))
+        logger.error(f"Email analysis failed: {error}", exc_info=error)
+        # Return default analysis rather than failing completely
+        return self._default_analysis(str(error))
+
+    def _generate_json(self, prompt: str,
+                       on_token: Optional[Callable[[str], None]] = None,
+                       num_predict: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Stream an LLM generation and stop as soon as the JSON object closes.
+
+        Brace depth is tracked outside string literals, so a '}' inside a value
+        does not end generation early, and tokens the model emits after the
+        object are never waited for.
+
+        Args:
+            prompt: Analysis prompt
+            on_token: Optional callback receiving each streamed text chunk
+            num_predict: Max tokens to generate (default: ANALYSIS_NUM_PREDICT)
+
+        Returns:
+            Ollama-style response dict: 'response' text, the 'model' used, and
+            eval_count, eval_duration and total_duration (nanoseconds). When the stream is
+            cut short these are measured locally, one chunk per token.
+        """
+        model, num_ctx = self._select_model(prompt)
+
+        start_ns = time.perf_counter_ns()
+        stream = self._client().generate(
+            model=model,
+            prompt=prompt,
+            stream=True,
+            options={
+                'temperature': 0.3,
+                'num_ctx': num_ctx,
+                'num_predict': num_predict or self.ANALYSIS_NUM_PREDICT
+            }
+        )
+
+        scanner = _JsonObjectScanner()
+        parts: List[str] = []
+        first_token_ns = None
+        final_chunk = None
+        try:
+            for chunk in stream:
+                text = chunk['response']
+                if first_token_ns is None:
+                    first_token_ns = time.perf_counter_ns()
+                parts.append(text)
+                if on_token and text:
+                    on_token(text)
+                if chunk.get('done'):
+                    final_chunk = chunk
+                    break
+                if scanner.feed(text) != -1:
+                    break
+        finally:
+            # Closing the generator drops the HTTP stream so Ollama stops generating
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+
+        if final_chunk is not None and final_chunk.get('eval_count'):
+            return {
+                'response': ''.join(parts),
+                'model': model,
+                'eval_count': final_chunk.get('eval_count', 0),
+                'eval_duration': final_chunk.get('eval_duration', 0),
+                'total_duration': final_chunk.get('total_duration', 0)
+            }
+
+        now_ns = time.perf_counter_ns()
+        return {
+            'response': ''.join(parts),
+            'model': model,
+            'eval_count': len(parts),
+            'eval_duration': now_ns - (first_token_ns or now_ns),
+            'total_duration': now_ns - start_ns
+        }
+
+    def _select_model(self, prompt: str) -> Tuple[str, int]:
+        """
+        Choose the model and num_ctx for a prompt.
+
+        Short prompts go to short_email_model (when configured) with a context
+        sized for SHORT_PROMPT_TOKENS, so each model keeps one stable num_ctx
+        and Ollama does not reload it. With dynamic_num_ctx, num_ctx is sized
+        per prompt instead.
+
+        Args:
+            prompt: Analysis prompt
+
+        Returns:
+            Tuple of (model name, num_ctx)
+        """
+        window = self.ollama.context_window
+        prompt_tokens = len(prompt) // _CHARS_PER_TOKEN
+
+        if self.short_email_model and prompt_tokens < self.SHORT_PROMPT_TOKENS:
+            return self.short_email_model, self._fit_num_ctx(self.SHORT_PROMPT_TOKENS, window)
+        if self.dynamic_num_ctx:
+            return self.ollama.current_model, self._fit_num_ctx(prompt_tokens, window)
+        return self.ollama.current_model, window
+
+    def _fit_num_ctx(self, prompt_tokens: int, window: int) -> int:
+        """Next power of two holding prompt + output (+ margin), within [MIN_NUM_CTX, window]."""
+        needed = prompt_tokens + self.ANALYSIS_NUM_PREDICT + 100
+        return max(self.MIN_NUM_CTX, min(window, 1 << needed.bit_length()))
+
+    def _cache_models(self) -> Tuple[str, ...]:
+        """Model versions whose cached analyses are still valid."""
+        if self.short_email_model:
+            return (self.ollama.current_model, self.short_email_model)
+        return (self.ollama.current_model,)
+
+    @staticmethod
+    def _create_client(host: str, max_concurrency: int = 1):
+        """
+        Create an Ollama client for an additional endpoint.
+
+        The client wraps one long-lived httpx connection pool. Keep-alive
+        slots are sized so every batch worker can hold its connection open
+        between requests instead of reconnecting per email.
+
+        Args:
+            host: Ollama host URL (e.g. 'http://gpu-box:11434')
+            max_concurrency: Batch workers that may share this client
+
+        Returns:
+            ollama.Client bound to host
+        """
+        try:
+            import httpx
+            import ollama
+        except ImportError:
+            raise EmailAnalysisError("Ollama Python client not installed (pip install ollama)")
+
+        # httpx defaults (20 keep-alive / 100 total) already cover typical batches
+        limits = httpx.Limits(
+            max_connections=max(100, max_concurrency),
+            max_keepalive_connections=max(20, max_concurrency)
+        )
+        return ollama.Client(host=host, limits=limits)
+
+    def _warm_up_endpoints(self, hosts: List[str]):
+        """
+        Open a connection to each endpoint up front with a cheap /api/tags call.
+
+        Unreachable endpoints are logged, not fatal: the first batch request
+        will surface the error for that worker.
+        """
+        for host, client in zip(hosts, self._endpoint_clients):
+            try:
+                client.list()
+                logger.debug(f"Ollama endpoint ready: {host}")
+            except Exception as e:
+                logger.warning(f"Ollama endpoint {host} not reachable during warm-up: {e}")
+
+    def _client(self):
+        """
+        Get the Ollama client for the current thread.
+
+        Without extra endpoints this is always ollama_manager.client. With
+        endpoints, each thread picks the next endpoint once and keeps it.
+        """
+        if self._endpoint_cycle is None:
+            return self.ollama.client
+
+        client = getattr(self._thread_state, 'client', None)
+        if client is None:
+            with self._endpoint_lock:
+                client = next(self._endpoint_cycle)
+            self._thread_state.client = client
+        return client
 
     def _quick_priority_heuristic(self, email: Dict[str, Any]) -> str:
         """
@@ -247,26 +786,18 @@ class EmailAnalysisEngine:
         Returns:
             Priority string: "High", "Medium", or "Low"
         """
-        body = email['content']['body'].lower()
-        subject = email['metadata']['subject'].lower()
-        combined = f"{subject} {body}"
-
-        # High priority indicators
-        for keyword in self.HIGH_PRIORITY_KEYWORDS:
-            if keyword in combined:
-                logger.debug(f"High priority keyword found: {keyword}")
-                return 'High'
-
-        # Check for deadlines in text
-        deadline_patterns = [
-            r'by\s+(today|tomorrow|eod|end of day|friday)',
-            r'due\s+(today|tomorrow|this week)',
-            r'deadline.*\d{1,2}[/-]\d{1,2}'
-        ]
-
-        for pattern in deadline_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                logger.debug(f"Deadline pattern found: {pattern}")
+        # Patterns are case-insensitive, so subject and body are searched as-is
+        # (no lowered/concatenated copies). Subject first: it is short and
+        # usually decides High-priority emails without touching the body
+        subject = email['metadata']['subject']
+        body = email['content']['body']
+
+        # High priority indicators, then deadlines in text
+        for pattern, label in ((self._HIGH_PRIORITY_RE, "High priority keyword"),
+                               (self._DEADLINE_RE, "Deadline pattern")):
+            match = pattern.search(subject) or pattern.search(body)
+            if match:
+                logger.debug(f"{label} found: {match.group(0)}")
                 return 'High'
 
         # Medium priority for replies in important threads
@@ -277,24 +808,26 @@ class EmailAnalysisEngine:
                 return 'Medium'
 
         # Medium priority indicators
-        for keyword in self.MEDIUM_PRIORITY_KEYWORDS:
-            if keyword in combined:
-                logger.debug(f"Medium priority keyword found: {keyword}")
-                return 'Medium'
+        match = self._MEDIUM_PRIORITY_RE.search(subject) or self._MEDIUM_PRIORITY_RE.search(body)
+        if match:
+            logger.debug(f"Medium priority keyword found: {match.group(0)}")
+            return 'Medium'
 
         # Default to Low priority
         logger.debug("No priority indicators found, defaulting to Low")
         return 'Low'
 
-    def _build_analysis_prompt(self, email: Dict[str, Any]) -> str:
+    def _build_analysis_prompt(self, email: Dict[str, Any], shape: Optional[str] = None) -> str:
         """
         Build LLM prompt from preprocessed email.
 
         Creates a structured prompt that asks the LLM to return JSON
-        with all required analysis fields.
+        with all required analysis fields. Replies, newsletters and calendar
+        invites get shorter shape-specific instructions.
 
         Args:
             email: Preprocessed email data
+            shape: Shape from _classify_shape (computed when omitted)
 
         Returns:
             Prompt string for LLM
@@ -314,37 +847,58 @@ class EmailAnalysisEngine:
             attachments_list = ', '.join(content['attachments'])
             attachments_info = f"\nAttachments: {attachments_list}"
 
-        prompt = f"""Analyze this email and provide structured output in JSON format.
-
-Email Metadata:
-From: {metadata['from']}
-Subject: {metadata['subject']}
-Date: {metadata['date']}{thread_info}{attachments_info}
-
-Email Body:
-{content['body']}
+        # Trim the body to what fits the context window instead of sending it
+        # all and letting Ollama drop the overflow
+        body = content['body']
+        max_body_chars = self._max_body_chars()
+        if len(body) > max_body_chars:
+            body = body[:max_body_chars]
+
+        # Only the header varies per email; the instructions are a constant
+        # chosen by email shape
+        if shape is None:
+            shape = self._classify_shape(email)
+        tail = _SHAPE_PROMPT_TAILS.get(shape, _PROMPT_TAIL)
+        return _PROMPT_HEADER.format_map({
+            'sender': metadata['from'],
+            'subject': metadata['subject'],
+            'date': metadata['date'],
+            'thread_info': thread_info,
+            'attachments_info': attachments_info,
+            'body': body
+        }) + tail
+
+    def _classify_shape(self, email: Dict[str, Any]) -> str:
+        """
+        Cheaply classify a preprocessed email for prompt specialization.
 
-Provide analysis as valid JSON with these exact fields:
-{{
-  "priority": "High|Medium|Low",
-  "confidence": 0.92,
-  "summary": "2-3 sentence summary capturing key points and main purpose",
-  "tags": ["tag1", "tag2", "tag3"],
-  "sentiment": "positive|neutral|negative|urgent",
-  "action_items": ["Action 1 with deadline", "Action 2"]
-}}
+        Args:
+            email: Preprocessed email data
 
-Guidelines:
-- Priority: High for urgent/time-sensitive, Medium for standard, Low for FYI
-- Confidence: 0.0-1.0, higher for clear priority signals
-- Summary: Concise, preserve key details (names, dates, amounts)
-- Tags: Up to 5 relevant topics (lowercase, 1-3 words each)
-- Sentiment: urgent if time-sensitive, otherwise positive/neutral/negative
-- Action items: Extract clear actions with deadlines, or empty array if none
+        Returns:
+            'calendar', 'reply', 'newsletter' or 'general'
+        """
+        subject = email['metadata'].get('subject') or ''
+        content = email['content']
 
-Return ONLY the JSON object, no additional text:"""
+        if _CALENDAR_SUBJECT_RE.match(subject) or any(
+                name.lower().split(' (')[0].endswith('.ics') for name in content.get('attachments', [])):
+            return 'calendar'
+        if email['thread_context'].get('is_reply'):
+            return 'reply'
+        # Bulk mail carries an unsubscribe link, almost always in the footer
+        if _UNSUBSCRIBE_RE.search(content['body'], max(0, len(content['body']) - 2000)):
+            return 'newsletter'
+        return 'general'
+
+    def _max_body_chars(self) -> int:
+        """
+        Maximum body characters that fit the model context with the prompt and output.
 
-        return prompt
+        Uses the rough 4 characters per token estimate.
+        """
+        reserved_tokens = self.ANALYSIS_NUM_PREDICT + _PROMPT_OVERHEAD_TOKENS
+        return max(0, self.ollama.context_window - reserved_tokens) * _CHARS_PER_TOKEN
 
     def _parse_analysis_response(self, response: str) -> Dict[str, Any]:
         """
@@ -360,30 +914,20 @@ Return ONLY the JSON object, no additional text:"""
             Parsed analysis dictionary
         """
         try:
-            # Try to extract JSON from response
-            # Handle markdown code blocks: ```json ... ```
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to find JSON object directly
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
-                    logger.warning("No JSON found in response, using fallback parsing")
-                    return self._fallback_parse(response)
+            # Extract the JSON object (plain or inside a ```json ... ``` block)
+            json_str = _find_json(response)
+            if json_str is None:
+                logger.warning("No JSON found in response, using fallback parsing")
+                return self._fallback_parse(response)
 
             # Parse JSON
-            analysis = json.loads(json_str)
+            analysis = _loads_json(json_str)
 
             # Validate and normalize fields
             analysis['priority'] = analysis.get('priority', 'Medium')
             analysis['confidence'] = float(analysis.get('confidence', 0.5))
             analysis['summary'] = analysis.get('summary', 'No summary available')
-            analysis['tags'] = analysis.get('tags', [])[:5]  # Limit to 5 tags
             analysis['sentiment'] = analysis.get('sentiment', 'neutral')
-            analysis['action_items'] = analysis.get('action_items', [])[:5]  # Limit to 5 actions
 
             # Validate priority values
             if analysis['priority'] not in ['High', 'Medium', 'Low']:
@@ -395,11 +939,19 @@ Return ONLY the JSON object, no additional text:"""
                 logger.warning(f"Invalid sentiment: {analysis['sentiment']}, defaulting to neutral")
                 analysis['sentiment'] = 'neutral'
 
-            # Ensure tags are strings and normalized
-            analysis['tags'] = [str(tag).lower().strip() for tag in analysis['tags']]
+            # Tags: strings, lowercased, de-duplicated in order, up to 5
+            analysis['tags'] = list(dict.fromkeys(
+                tag for tag in (str(t).lower().strip() for t in analysis.get('tags', [])) if tag
+            ))[:5]
 
-            # Ensure action items are strings
-            analysis['action_items'] = [str(item).strip() for item in analysis['action_items']]
+            # Action items: strings, de-duplicated case-insensitively (first
+            # spelling kept), up to 5
+            action_items: Dict[str, str] = {}
+            for item in map(str, analysis.get('action_items', [])):
+                item = item.strip()
+                if item:
+                    action_items.setdefault(item.lower(), item)
+            analysis['action_items'] = list(action_items.values())[:5]
 
             logger.debug("Successfully parsed LLM response")
             return analysis
@@ -439,12 +991,12 @@ Return ONLY the JSON object, no additional text:"""
             analysis['priority'] = 'Medium'
 
         # Try to extract summary (first few sentences)
-        sentences = re.split(r'[.!?]+', response)
+        sentences = _SENT_SPLIT_RE.split(response)
         if len(sentences) >= 2:
             analysis['summary'] = '. '.join(sentences[:2]).strip() + '.'
 
         # Try to extract tags (look for comma-separated words)
-        tags_match = re.search(r'tags?:?\s*([a-z0-9,\s-]+)', response_lower)
+        tags_match = _TAGS_RE.search(response_lower)
         if tags_match:
             tags = [t.strip() for t in tags_match.group(1).split(',')]
             analysis['tags'] = tags[:5]
@@ -487,31 +1039,44 @@ Return ONLY the JSON object, no additional text:"""
         Returns:
             Cached analysis dictionary or None if not found
         """
+        models = self._cache_models()
+        with self._mem_cache_lock:
+            for model in models:
+                cached = self._mem_cache.get((message_id, model))
+                if cached is not None:
+                    self._mem_cache.move_to_end((message_id, model))
+                    break
+        if cached is not None:
+            logger.debug(f"Memory cache hit for message_id={message_id}")
+            return dict(cached)
+
+        # A failed lookup is treated as a miss; only database/JSON errors are
+        # expected here, anything else is a bug and propagates
         try:
             cached_result = self.db.get_email_analysis(message_id)
+        except (DatabaseError, ValueError) as e:
+            logger.error(f"Cache check failed: {e}")
+            return None
 
-            if cached_result:
-                # Check if model version matches (invalidate cache if changed)
-                cached_model = cached_result.get('model_version')
-                if cached_model != self.ollama.current_model:
-                    logger.info(f"Cache invalidated due to model change: {cached_model} → {self.ollama.current_model}")
-                    return None
-
-                # Extract analysis from cached result
-                analysis = cached_result.get('analysis', {})
-                logger.debug(f"Cache hit for message_id={message_id}")
-                return analysis
-
+        if not cached_result:
             return None
 
-        except Exception as e:
-            logger.error(f"Cache check failed: {e}")
+        # Check if model version matches (invalidate cache if changed)
+        cached_model = cached_result.get('model_version')
+        if cached_model not in models:
+            logger.info(f"Cache invalidated due to model change: {cached_model} → {self.ollama.current_model}")
             return None
 
+        # Extract analysis from cached result
+        analysis = cached_result.get('analysis', {})
+        logger.debug(f"Cache hit for message_id={message_id}")
+        self._remember_analysis((message_id, cached_model), analysis)
+        return dict(analysis)
+
     def _cache_analysis(self, message_id: str, email: Dict[str, Any],
                        analysis: Dict[str, Any]):
         """
-        Store analysis results in cache using DatabaseManager.
+        Queue analysis results for caching via the background storage worker.
 
         Args:
             message_id: Unique message identifier
@@ -520,56 +1085,97 @@ Return ONLY the JSON object, no additional text:"""
         """
         try:
             metadata = email['metadata']
-
-            # Insert using DatabaseManager
-            self.db.insert_email_analysis(
-                message_id=message_id,
-                analysis=analysis,
-                metadata={
+            analysis = dict(analysis)  # Snapshot: the caller keeps the original
+
+            # Denormalized columns have CHECK constraints; an out-of-range
+            # confidence must not fail the whole batched insert
+            confidence = analysis.get('confidence')
+            if not isinstance(confidence, (int, float)) or not 0 <= confidence <= 1:
+                confidence = None
+
+            self._remember_analysis((message_id, analysis['model_version']), analysis)
+            # Serialized once here; the worker binds it straight into the
+            # prepared INSERT without re-encoding
+            self._storage.put('email_analysis', (
+                message_id,
+                _dumps_json(analysis),
+                {
                     'subject': metadata['subject'],
                     'sender': metadata['from'],
                     'received_date': metadata['date'],
+                    'priority': analysis.get('priority'),
+                    'confidence_score': confidence,
+                    'sentiment': analysis.get('sentiment'),
                     'model_version': analysis['model_version'],
                     'processing_time_ms': analysis['processing_time_ms'],
                     'tokens_per_second': analysis.get('tokens_per_second', 0.0)
                 }
-            )
+            ))
 
-            logger.debug(f"Analysis cached for message_id={message_id}")
+            logger.debug(f"Analysis queued for caching: message_id={message_id}")
 
         except Exception as e:
             logger.error(f"Failed to cache analysis: {e}")
 
+    def _remember_analysis(self, key: Tuple[str, str], analysis: Dict[str, Any]):
+        """
+        Insert an analysis into the in-memory LRU, evicting the oldest entry if full.
+
+        Args:
+            key: (message_id, model_version)
+            analysis: Analysis results
+        """
+        with self._mem_cache_lock:
+            self._mem_cache[key] = analysis
+            self._mem_cache.move_to_end(key)
+            if self._mem_cache_max is not None and len(self._mem_cache) > self._mem_cache_max:
+                self._mem_cache.popitem(last=False)
+
     def _calculate_tokens_per_sec(self, response: Dict[str, Any]) -> float:
         """
-        Calculate tokens per second from LLM response.
+        Calculate generation tokens per second from LLM response.
 
         Args:
-            response: Ollama generate response dictionary
+            response: Ollama generate response dictionary (eval_count, eval_duration)
 
         Returns:
             Tokens per second (float)
         """
-        try:
-            # Ollama returns total_duration and eval_count
-            if 'total_duration' in response and 'eval_count' in response:
-                total_duration_s = response['total_duration'] / 1e9  # nanoseconds to seconds
-                eval_count = response['eval_count']
+        # eval_duration covers generation only; total_duration also includes
+        # model load and prompt evaluation
+        eval_duration_s = response.get('eval_duration', 0) / 1e9  # nanoseconds to seconds
+        if eval_duration_s > 0:
+            return round(response.get('eval_count', 0) / eval_duration_s, 2)
+        return 0.0
+
+    def _adjust_concurrency(self, current: int) -> int:
+        """
+        Pick the number of concurrent LLM calls from recent tokens/sec.
 
-                if total_duration_s > 0:
-                    tokens_per_sec = eval_count / total_duration_s
-                    return round(tokens_per_sec, 2)
+        Per-call tokens/sec collapses once the GPU is saturated, so a mean
+        below TPS_BACKOFF_RATIO of the best mean seen drops one slot;
+        otherwise one slot is added back, up to max_concurrency.
 
-            return 0.0
+        Args:
+            current: Current concurrency limit
 
-        except Exception as e:
-            logger.debug(f"Could not calculate tokens/sec: {e}")
-            return 0.0
+        Returns:
+            New concurrency limit (1..max_concurrency)
+        """
+        recent = list(self._recent_tps)
+        if len(recent) < 4:
+            return current
+
+        mean_tps = sum(recent) / len(recent)
+        self._peak_tps = max(self._peak_tps, mean_tps)
+        if mean_tps < self.TPS_BACKOFF_RATIO * self._peak_tps:
+            return max(1, current - 1)
+        return min(self.max_concurrency, current + 1)
 
     def _log_performance(self, analysis: Dict[str, Any], operation: str = 'email_analysis',
                         batch_size: int = 1):
         """
-        Log performance metrics to database using DatabaseManager.
+        Queue performance metrics for the background storage worker.
 
         Args:
             analysis: Analysis results with performance data
@@ -583,7 +1189,7 @@ Return ONLY the JSON object, no additional text:"""
                 'model_version': analysis.get('model_version', 'unknown'),
                 'batch_size': batch_size
             }
-            self.db.insert_performance_metric(operation=operation, metrics=metrics)
+            self._storage.put('performance_metrics', (operation, metrics))
 
             logger.debug(f"Performance logged: {operation}, {analysis.get('processing_time_ms', 0)}ms")
 
@@ -595,13 +1201,15 @@ Return ONLY the JSON object, no additional text:"""
         """
         Analyze multiple emails in batch.
 
-        Processes emails sequentially to avoid GPU thrashing and provides
-        progress updates via callback.
+        A producer thread preprocesses and cache-checks upcoming emails while
+        LLM calls run on up to max_concurrency worker threads (one at a time
+        by default). Cache hits are returned without taking an LLM slot.
 
         Args:
             emails: List of raw emails
             callback: Optional progress callback(current, total, result)
-                     Called after each email is analyzed
+                     Called after each email is analyzed, never concurrently,
+                     in completion order
 
         Returns:
             List of analysis results (same order as input emails)
@@ -612,29 +1220,90 @@ Return ONLY the JSON object, no additional text:"""
 
             results = engine.analyze_batch(emails, callback=progress)
         """
-        logger.info(f"Starting batch analysis of {len(emails)} emails")
-        batch_start = time.time()
+        logger.info(f"Starting batch analysis of {len(emails)} emails "
+                   f"(max_concurrency={self.max_concurrency})")
+        batch_start_ns = time.perf_counter_ns()
 
-        results = []
         total = len(emails)
-
-        for i, email in enumerate(emails):
-            try:
-                result = self.analyze_email(email)
-                results.append(result)
-
-                # Call progress callback if provided
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        callback_lock = threading.Lock()
+        completed = 0
+
+        def finish(i: int, result: Dict[str, Any]):
+            nonlocal completed
+            results[i] = result
+            with callback_lock:
+                completed += 1
                 if callback:
-                    callback(i + 1, total, result)
-
-                logger.debug(f"Batch progress: {i+1}/{total} ({(i+1)/total*100:.1f}%)")
-
+                    try:
+                        callback(completed, total, result)
+                    except Exception as e:
+                        logger.error(f"Batch progress callback failed: {e}")
+                logger.debug(f"Batch progress: {completed}/{total} ({completed/total*100:.1f}%)")
+
+        # Producer preprocesses and cache-checks email i+1 while the LLM works
+        # on email i. The queue bound keeps it at most two emails ahead
+        prepared_queue: queue.Queue = queue.Queue(maxsize=2)
+
+        def produce():
+            for i, email in enumerate(emails):
+                start_ns = time.perf_counter_ns()
+                try:
+                    prepared_queue.put((i, start_ns, self._prepare_email(email), None))
+                except Exception as e:
+                    prepared_queue.put((i, start_ns, None, e))
+            prepared_queue.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True, name="EmailPrepare")
+        producer.start()
+
+        def analyze(i: int, start_ns: int, prepared: Tuple) -> Dict[str, Any]:
+            try:
+                return self._complete_analysis(*prepared, start_ns)
             except Exception as e:
                 logger.error(f"Failed to analyze email {i+1}/{total}: {e}")
-                # Add error result but continue processing
-                results.append(self._default_analysis(f"Batch processing error: {str(e)}"))
+                return self._failed_analysis(e, start_ns)
+
+        # Concurrent LLM calls are capped by a limit that adapts to recent
+        # tokens/sec; cache hits and failures never take a slot
+        slots = threading.Condition()
+        in_flight = 0
+        limit = self.max_concurrency
+
+        def on_done(i: int, future):
+            nonlocal in_flight, limit
+            with slots:
+                in_flight -= 1
+                new_limit = self._adjust_concurrency(limit)
+                if new_limit != limit:
+                    logger.debug(f"Batch concurrency {limit} -> {new_limit}")
+                    limit = new_limit
+                slots.notify_all()
+            finish(i, future.result())
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                thread_name_prefix="EmailAnalysis") as executor:
+            while True:
+                item = prepared_queue.get()
+                if item is None:
+                    break
+                i, start_ns, prepared, error = item
+
+                if error is not None:
+                    logger.error(f"Failed to analyze email {i+1}/{total}: {error}")
+                    finish(i, self._failed_analysis(error, start_ns))
+                elif prepared[2]:
+                    finish(i, self._complete_analysis(*prepared, start_ns))
+                else:
+                    with slots:
+                        slots.wait_for(lambda: in_flight < limit)
+                        in_flight += 1
+                    future = executor.submit(analyze, i, start_ns, prepared)
+                    future.add_done_callback(lambda f, i=i: on_done(i, f))
 
-        batch_time = time.time() - batch_start
+        producer.join()
+
+        batch_time = (time.perf_counter_ns() - batch_start_ns) / 1e9
         emails_per_min = (total / batch_time) * 60 if batch_time > 0 else 0
 
         logger.info(f"Batch analysis complete: {total} emails in {batch_time:.1f}s "
@@ -651,44 +1320,51 @@ Return ONLY the JSON object, no additional text:"""
 
         return results
 
+    def analyze_emails(self, emails: List[Any], conn: Any = None) -> List[Dict[str, Any]]:
+        """
+        Analyze a group of emails in one call (EmailBatchProcessor grouped path).
+
+        Args:
+            emails: List of raw emails
+            conn: Pooled connection from EmailBatchProcessor. Unused: the engine
+                  routes requests through its own endpoint clients.
+
+        Returns:
+            List of analysis results (same order as input emails)
+        """
+        return self.analyze_batch(emails)
+
     def get_analysis_stats(self) -> Dict[str, Any]:
         """
         Get analysis statistics from database using DatabaseManager.
 
+        Results come from one SQL aggregate and are cached for
+        STATS_CACHE_TTL seconds, so repeated UI polls do not hit the database.
+        Queued writes are waited on for at most STATS_FLUSH_TIMEOUT seconds;
+        if the storage worker is behind, the stats cover what has been
+        committed so far and are not cached.
+
         Returns:
             Statistics dictionary with counts, averages, etc.
         """
-        try:
-            # Get counts by priority
-            high_count = len(self.db.get_emails_by_priority('High'))
-            medium_count = len(self.db.get_emails_by_priority('Medium'))
-            low_count = len(self.db.get_emails_by_priority('Low'))
-            total_analyses = high_count + medium_count + low_count
-
-            priority_dist = {
-                'High': high_count,
-                'Medium': medium_count,
-                'Low': low_count
-            }
-
-            # Get performance metrics (last 365 days)
-            metrics = self.db.get_performance_metrics(days=365, operation='email_analysis')
+        bucket = int(time.monotonic() // self.STATS_CACHE_TTL)
+        if self._stats_cache is not None and self._stats_cache[0] == bucket:
+            return dict(self._stats_cache[1])
 
-            # Calculate averages from metrics
-            avg_processing_time = 0
-            avg_tokens_per_sec = 0
-            if metrics:
-                avg_processing_time = sum(m['processing_time_ms'] for m in metrics) / len(metrics)
-                tokens_metrics = [m['tokens_per_second'] for m in metrics if m.get('tokens_per_second', 0) > 0]
-                if tokens_metrics:
-                    avg_tokens_per_sec = sum(tokens_metrics) / len(tokens_metrics)
-
-            return {
-                'total_analyses': total_analyses,
-                'priority_distribution': priority_dist,
-                'avg_processing_time_ms': round(avg_processing_time, 2),
-                'avg_tokens_per_second': round(avg_tokens_per_sec, 2)
+        try:
+            # Include analyses still queued on the storage worker, within a bound
+            flushed = self.flush(timeout=self.STATS_FLUSH_TIMEOUT)
+            summary = self.db.get_stats_summary(days=365, operation='email_analysis')
+
+            stats = {
+                'total_analyses': summary['total_analyses'],
+                'priority_distribution': summary['priority_counts'],
+                'avg_processing_time_ms': round(summary['avg_processing_time_ms'], 2),
+                'avg_tokens_per_second': round(summary['avg_tokens_per_second'], 2)
             }
+            if flushed:
+                self._stats_cache = (bucket, stats)
+            return dict(stats)
 
         except Exception as e:
             logger.error(f"Failed to get stats: {e}")
@@ -710,4 +1386,7 @@ def analyze_email(raw_email: Any, ollama_manager: OllamaManager,
         Analysis results dictionary
     """
     engine = EmailAnalysisEngine(ollama_manager, db_path=db_path)
-    return engine.analyze_email(raw_email)
+    try:
+        return engine.analyze_email(raw_email)
+    finally:
+        engine.close()
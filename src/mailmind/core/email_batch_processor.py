@@ -8,14 +8,180 @@ Story 3.3 AC4: Parallel Email Processing
 Story 3.3 AC5: Performance Target (10-15 emails/minute)
 """
 
+import asyncio
+import atexit
+import inspect
+import itertools
 import logging
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
-from typing import List, Dict, Any, Optional, Callable
+import traceback
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
 from dataclasses import dataclass
 
+try:
+    from opentelemetry import metrics as otel_metrics
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on batch worker threads; MAILMIND_MAX_WORKERS overrides the computed value
+MAX_WORKERS_CAP = 16
+MAX_WORKERS_ENV = "MAILMIND_MAX_WORKERS"
+
+# MAILMIND_PIN_THREADS=1 pins each batch worker thread to one CPU (Linux only)
+PIN_THREADS_ENV = "MAILMIND_PIN_THREADS"
+_pin_counter = itertools.count()
+
+# Shared executors keyed by (worker count, pinned), so repeated batch runs reuse
+# threads instead of spinning up a new pool per EmailBatchProcessor
+_EXECUTOR_CACHE: Dict[Tuple[int, bool], ThreadPoolExecutor] = {}
+_EXECUTOR_LOCK = threading.Lock()
+_atexit_registered = False
+
+
+def _resolve_max_workers(pool_size: int) -> int:
+    """
+    Decide how many worker threads a batch processor should use.
+
+    Thread count is bounded by the connection pool, by the CPU count (two per
+    core) and by MAX_WORKERS_CAP, so a large pool on a many-core machine does not
+    oversubscribe. A positive MAILMIND_MAX_WORKERS value takes precedence.
+
+    Args:
+        pool_size: Connection pool size
+
+    Returns:
+        int: Number of worker threads (at least 1)
+    """
+    override = os.environ.get(MAX_WORKERS_ENV, "0")
+    try:
+        override_workers = int(override)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {MAX_WORKERS_ENV}={override!r}")
+        override_workers = 0
+
+    if override_workers > 0:
+        return override_workers
+
+    cpu_workers = (os.cpu_count() or 4) * 2
+    return max(1, min(pool_size, cpu_workers, MAX_WORKERS_CAP))
+
+
+def _pin_thread(cpus: Tuple[int, ...]) -> None:
+    """
+    Executor initializer: pin the new worker thread to the next CPU, round-robin.
+
+    Args:
+        cpus: CPUs this process may run on
+    """
+    cpu = cpus[next(_pin_counter) % len(cpus)]
+    try:
+        # pid 0 is the calling thread on Linux
+        os.sched_setaffinity(0, {cpu})
+        logger.debug(f"Pinned {threading.current_thread().name} to CPU {cpu}")
+    except OSError as e:
+        logger.debug(f"Could not pin {threading.current_thread().name} to CPU {cpu}: {e}")
+
+
+def _pin_threads_enabled() -> bool:
+    """Check MAILMIND_PIN_THREADS and platform support for thread pinning."""
+    return os.environ.get(PIN_THREADS_ENV, "0") == "1" and hasattr(os, "sched_setaffinity")
+
+
+def _shared_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get (or lazily create) the shared executor for a worker count.
+
+    Worker threads are named mailmind-batch_N so profilers attribute their work.
+    With MAILMIND_PIN_THREADS=1 on Linux, each worker is pinned to one CPU.
+
+    Args:
+        max_workers: Number of worker threads
+
+    Returns:
+        ThreadPoolExecutor shared by every processor with the same worker count
+    """
+    global _atexit_registered
+
+    pinned = _pin_threads_enabled()
+    key = (max_workers, pinned)
+
+    with _EXECUTOR_LOCK:
+        executor = _EXECUTOR_CACHE.get(key)
+        if executor is None:
+            options: Dict[str, Any] = {}
+            if pinned:
+                options['initializer'] = _pin_thread
+                options['initargs'] = (tuple(sorted(os.sched_getaffinity(0))),)
+
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="mailmind-batch",
+                **options
+            )
+            _EXECUTOR_CACHE[key] = executor
+            logger.debug(
+                f"Created shared batch executor with {max_workers} workers"
+                f"{' (pinned)' if pinned else ''}"
+            )
+
+            if not _atexit_registered:
+                atexit.register(_shutdown_shared_executors)
+                _atexit_registered = True
+
+        return executor
+
+
+def _shutdown_shared_executors() -> None:
+    """Shut down and forget all shared executors (registered with atexit)."""
+    with _EXECUTOR_LOCK:
+        executors = list(_EXECUTOR_CACHE.values())
+        _EXECUTOR_CACHE.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass(slots=True, frozen=True)
+class EmailResult:
+    """
+    Outcome of processing one email in a batch.
+
+    Slotted to keep per-email overhead small for large batches. Frozen so that
+    identical results (see _CIRCUIT_OPEN) can be shared between emails.
+
+    Attributes:
+        email_id: The email's id attribute, if any
+        error: Error message, or None if the email was analyzed successfully
+        timeout: True if the email ran past its time budget or the batch deadline
+        exception: True if processing raised instead of returning an error
+        cancelled: True if the email was skipped because the circuit breaker
+                   opened, cancel_batch() was called, or the batch deadline
+                   passed before it started ('not_started')
+        payload: Analysis result returned by the engine
+    """
+    email_id: Optional[Any]
+    error: Optional[str] = None
+    timeout: bool = False
+    exception: bool = False
+    cancelled: bool = False
+    payload: Optional[Dict[str, Any]] = None
+
+
+# Shared results for emails without an id skipped by an open circuit breaker
+# or by cancel_batch()
+_CIRCUIT_OPEN = EmailResult(email_id=None, error='circuit_open', cancelled=True)
+_CANCELLED = EmailResult(email_id=None, error='cancelled', cancelled=True)
+# Shared result for emails without an id that never started before the batch deadline
+_NOT_STARTED = EmailResult(email_id=None, error='not_started', cancelled=True)
+
 
 @dataclass
 class BatchResult:
@@ -23,9 +189,86 @@ class BatchResult:
     total: int
     success: int
     failed: int
-    results: List[Dict[str, Any]]
+    results: List[EmailResult]
     elapsed_time: float
     emails_per_minute: float
+    # Per-email latency (seconds from submission to result or timeout)
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    max_latency: float = 0.0
+
+
+class _ProgressThrottle:
+    """
+    Coalesce progress callbacks for a batch.
+
+    A callback that updates UI or crosses a process boundary is expensive, so it
+    fires only once min_step emails have completed since the last call or interval
+    seconds have passed. update(force=True) always reports the final count.
+    """
+
+    def __init__(self, callback: Optional[Callable[[int, int], None]], total: int, interval: float):
+        self.callback = callback
+        self.total = total
+        self.interval = interval
+        self.min_step = max(1, total // 100)
+        self.last_count = 0
+        self.last_ts = time.monotonic()
+
+    def update(self, completed: int, force: bool = False) -> None:
+        """Report progress if enough emails or time have passed since the last report."""
+        if not self.callback or completed == self.last_count:
+            return
+
+        now = time.monotonic()
+        if (force or completed - self.last_count >= self.min_step
+                or now - self.last_ts >= self.interval):
+            self.last_count = completed
+            self.last_ts = now
+            # Story 3.3 AC4: Progress callback support (callback errors are logged, not raised)
+            try:
+                self.callback(completed, self.total)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
+
+class _CircuitBreaker:
+    """
+    Stop a batch early when most emails are failing.
+
+    If the backend is down, every remaining email would fail too, each after
+    burning worker time. Once at least min_samples emails have completed and the
+    failure rate reaches threshold, the breaker opens and stays open for the batch.
+    """
+
+    def __init__(self, threshold: float, min_samples: int):
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.success = 0
+        self.failed = 0
+        self.is_open = False
+
+    def record(self, failed: bool) -> bool:
+        """
+        Record one completed email.
+
+        Returns:
+            bool: True if the breaker is (now) open
+        """
+        if failed:
+            self.failed += 1
+        else:
+            self.success += 1
+
+        samples = self.success + self.failed
+        if not self.is_open and samples >= self.min_samples and self.failed / samples >= self.threshold:
+            self.is_open = True
+            logger.warning(
+                f"Circuit breaker opened: {self.failed}/{samples} emails failed, "
+                f"cancelling the rest of the batch"
+            )
+        return self.is_open
 
 
 class EmailBatchProcessor:
@@ -38,7 +281,9 @@ class EmailBatchProcessor:
     Implements:
     - ThreadPoolExecutor for concurrent processing
     - Individual email failure isolation (don't stop batch)
-    - Timeout handling (30s per email max)
+    - Timeout handling (30s per running email, plus a batch deadline or batch_timeout)
+    - Circuit breaker that cancels the rest of a batch when most emails fail
+    - Caller-initiated cancellation (cancel_batch)
     - Progress callback support
     - Result aggregation with success/failure counts
     - Performance metrics calculation
@@ -53,29 +298,152 @@ class EmailBatchProcessor:
         print(f"Throughput: {results.emails_per_minute:.1f} emails/minute")
     """
 
-    def __init__(self, analysis_engine, pool):
+    # Tracebacks kept per batch and logged together once it finishes
+    MAX_FAILURE_TRACEBACKS = 16
+
+    # Futures allowed in flight per worker thread; more are submitted as these finish
+    IN_FLIGHT_PER_WORKER = 4
+
+    def __init__(
+        self,
+        analysis_engine,
+        pool,
+        executor: Optional[ThreadPoolExecutor] = None,
+        emails_per_call: int = 1
+    ):
         """
         Initialize batch processor.
 
         Args:
             analysis_engine: EmailAnalysisEngine instance for processing emails
             pool: OllamaConnectionPool for concurrent connection management
+            executor: Optional executor to run emails on. The processor takes
+                      ownership and shuts it down in shutdown(). When omitted, a
+                      module-level executor shared by all processors with the
+                      same worker count is used and left running.
+            emails_per_call: Emails passed to one engine call (default: 1). Values
+                             above 1 group emails into analyze_emails(group, conn)
+                             calls and need an engine that provides it.
 
-        Story 3.3 AC4: Configure max_workers based on pool size
+        Story 3.3 AC4: Configure max_workers based on pool size, capped by CPU
+        count and MAX_WORKERS_CAP (see _resolve_max_workers)
         """
         self.engine = analysis_engine
         self.pool = pool
+        self.max_workers = _resolve_max_workers(pool.size)
+
+        if emails_per_call > 1 and not hasattr(analysis_engine, 'analyze_emails'):
+            logger.warning("Engine has no analyze_emails(); processing one email per call")
+            emails_per_call = 1
+        self.emails_per_call = max(1, emails_per_call)
+
+        # (label, exception) for recent failures; appended from worker threads
+        self._failures: deque = deque(maxlen=self.MAX_FAILURE_TRACEBACKS)
 
-        # Story 3.3 AC4: max_workers = pool.size for optimal parallelism
-        self.executor = ThreadPoolExecutor(max_workers=pool.size)
+        # Futures submitted by the current batch and not yet reaped (see get_stats)
+        self._in_flight = 0
 
-        logger.info(f"EmailBatchProcessor initialized with {pool.size} workers")
+        # Set by cancel_batch(); _wake is resolved at the same time so a reaper
+        # blocked in wait() notices without waiting for an email to finish
+        self._stop_event = threading.Event()
+        self._wake: Future = Future()
+
+        self._owns_executor = executor is not None
+        self.executor = executor if executor is not None else _shared_executor(self.max_workers)
+
+        logger.info(
+            f"EmailBatchProcessor initialized with {self.max_workers} workers "
+            f"(pool size {pool.size})"
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get executor utilization for tuning max_workers.
+
+        Returns:
+            dict: {'queue_depth': int, 'active_workers': int,
+                   'max_workers': int, 'in_flight_tasks': int}
+        """
+        work_queue = getattr(self.executor, '_work_queue', None)
+        threads = getattr(self.executor, '_threads', ())
+        return {
+            'queue_depth': work_queue.qsize() if work_queue is not None else 0,
+            'active_workers': len(threads),
+            'max_workers': getattr(self.executor, '_max_workers', self.max_workers),
+            'in_flight_tasks': self._in_flight
+        }
+
+    def register_metrics(self, meter=None) -> bool:
+        """
+        Publish get_stats() as OpenTelemetry observable gauges.
+
+        Gauges are named mailmind.batch.<stat> and read on collection, so there
+        is no cost on the processing path.
+
+        Args:
+            meter: Optional OpenTelemetry Meter (default: get_meter("mailmind.batch"))
+
+        Returns:
+            bool: True if gauges were registered, False if OpenTelemetry is not installed
+        """
+        if not OTEL_AVAILABLE:
+            logger.debug("opentelemetry not installed, batch executor metrics not registered")
+            return False
+
+        meter = meter or otel_metrics.get_meter("mailmind.batch")
+        for name in self.get_stats():
+            meter.create_observable_gauge(
+                f"mailmind.batch.{name}",
+                callbacks=[lambda options, name=name: [otel_metrics.Observation(self.get_stats()[name])]],
+                description=f"EmailBatchProcessor executor {name.replace('_', ' ')}"
+            )
+
+        logger.info("Registered EmailBatchProcessor executor metrics")
+        return True
+
+    def warmup(self) -> int:
+        """
+        Open every pooled connection before the first batch.
+
+        Holds all pool.size connections at once and pings each one in parallel,
+        so the first emails of a batch don't pay connection setup against the
+        emails/minute target. Failures are logged, not raised.
+
+        Returns:
+            int: Number of connections that responded
+        """
+        try:
+            with ExitStack() as stack:
+                conns = [stack.enter_context(self.pool.acquire()) for _ in range(self.pool.size)]
+                futures = [self.executor.submit(self._ping, conn) for conn in conns]
+                warmed = sum(1 for future in futures if future.result())
+        except Exception as e:
+            logger.warning(f"Connection pool warm-up failed: {e}")
+            return 0
+
+        logger.info(f"Warmed up {warmed}/{self.pool.size} pooled connections")
+        return warmed
+
+    @staticmethod
+    def _ping(conn: Any) -> bool:
+        """Make a cheap request on a connection so its HTTP connection is open."""
+        try:
+            conn.list()
+            return True
+        except Exception as e:
+            logger.warning(f"Connection warm-up request failed: {e}")
+            return False
 
     def process_batch(
         self,
         emails: List[Any],
         progress_callback: Optional[Callable[[int, int], None]] = None,
-        email_timeout: float = 30.0
+        email_timeout: float = 30.0,
+        batch_timeout: Optional[float] = None,
+        progress_interval: float = 0.25,
+        chunk_size: int = 64,
+        circuit_threshold: float = 0.8,
+        circuit_min_samples: int = 10
     ) -> BatchResult:
         """
         Process emails concurrently using connection pool.
@@ -85,114 +453,509 @@ class EmailBatchProcessor:
 
         Args:
             emails: List of email objects to process
-            progress_callback: Optional callback function(current, total) for progress updates
-            email_timeout: Maximum time per email in seconds (default: 30s)
+            progress_callback: Optional callback function(current, total) for progress updates.
+                               Calls are coalesced: it fires once at least 1% of the
+                               batch has completed since the last call or
+                               progress_interval seconds have passed, and always
+                               once at the end with (total, total)
+            email_timeout: Time budget per email in seconds, counted from when
+                           the email starts running (default: 30s). The batch
+                           deadline is email_timeout * len(emails)
+            batch_timeout: Optional hard limit in seconds for the whole batch. When
+                           it is shorter than the per-email budget, emails still
+                           running at this deadline are reported with 'batch
+                           deadline exceeded'
+                           Emails that have not started by the batch deadline are
+                           reported as 'not_started' rather than as timeouts
+            progress_interval: Maximum seconds between progress callbacks while
+                               emails are completing (default: 0.25s)
+            chunk_size: Emails submitted to the executor at a time (default: 64)
+            circuit_threshold: Failure rate at which the rest of the batch is
+                               cancelled and reported as 'circuit_open' (default:
+                               0.8; values above 1.0 disable the breaker)
+            circuit_min_samples: Completed emails required before the failure
+                                 rate is checked (default: 10)
 
         Returns:
-            BatchResult with success/failure counts, results, and performance metrics
+            BatchResult with success/failure counts, results (in input order),
+            and performance metrics (throughput and p50/p90/p99/max latency)
 
         Implementation:
-        - Submits all emails to ThreadPoolExecutor
-        - Waits for completion with per-email timeout
-        - Individual failures logged but don't stop batch
+        - Submits emails to ThreadPoolExecutor in chunks of chunk_size, so only
+          one chunk of futures is alive at a time
+        - Collects results in completion order (wait(FIRST_COMPLETED), draining
+          every finished future per wake-up), so a slow email does not delay
+          finished ones
+        - An email still running email_timeout after it started is reported as
+          a timeout and abandoned, so it never holds back later chunks
+        - At the batch deadline, running emails time out and emails that never
+          started are reported as 'not_started'
+        - Individual failures logged but don't stop batch, unless the failure rate
+          trips the circuit breaker
         - Returns aggregated results with performance metrics
         """
         if not emails:
             logger.warning("process_batch called with empty email list")
-            return BatchResult(
-                total=0,
-                success=0,
-                failed=0,
-                results=[],
-                elapsed_time=0.0,
-                emails_per_minute=0.0
-            )
+            return self._build_result([], [], 0.0)
+
+        logger.info(f"Processing batch of {len(emails)} emails with {self.max_workers} workers...")
+        start_ns = time.monotonic_ns()
 
-        logger.info(f"Processing batch of {len(emails)} emails with {self.pool.size} workers...")
-        start_time = time.time()
+        results: List[EmailResult] = []
+        latencies: List[float] = []
+        for chunk_results, chunk_latencies in self._iter_chunks(
+            emails, progress_callback, email_timeout, batch_timeout, progress_interval,
+            chunk_size, circuit_threshold, circuit_min_samples
+        ):
+            results.extend(chunk_results)
+            latencies.extend(chunk_latencies)
 
-        # Story 3.3 AC4: Submit all emails for parallel processing
-        futures = []
-        for email in emails:
-            future = self.executor.submit(self._process_one, email)
-            futures.append((email, future))
+        # Story 3.3 AC5: Calculate performance metrics
+        batch = self._build_result(results, latencies, (time.monotonic_ns() - start_ns) / 1e9)
+
+        logger.info(
+            f"Batch processing complete: {batch.success}/{batch.total} successful, "
+            f"{batch.failed} failed in {batch.elapsed_time:.2f}s "
+            f"({batch.emails_per_minute:.1f} emails/minute)"
+        )
+        logger.info(
+            f"Email latency: p50={batch.p50:.2f}s p90={batch.p90:.2f}s "
+            f"p99={batch.p99:.2f}s max={batch.max_latency:.2f}s"
+        )
 
-        # Story 3.3 AC4: Wait for completion with individual error handling
-        results = []
-        success_count = 0
-        failed_count = 0
+        return batch
 
-        for i, (email, future) in enumerate(futures):
-            try:
-                # Story 3.3 AC4: Per-email timeout (30s default)
-                result = future.result(timeout=email_timeout)
-
-                if result.get('error'):
-                    # Email processed but had an error
-                    failed_count += 1
-                    logger.warning(
-                        f"Email {i+1}/{len(emails)} failed: {result.get('error')}"
+    async def process_batch_async(
+        self,
+        emails: List[Any],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        email_timeout: float = 30.0,
+        progress_interval: float = 0.25
+    ) -> BatchResult:
+        """
+        Process emails concurrently on the event loop.
+
+        Concurrency is limited by an asyncio.Semaphore of pool.size instead of
+        worker threads. A coroutine analyze_email() on the engine is awaited
+        directly; a synchronous one runs via asyncio.to_thread(). From synchronous
+        code, use asyncio.run(processor.process_batch_async(emails)).
+
+        Args:
+            emails: List of email objects to process
+            progress_callback: See process_batch()
+            email_timeout: Time limit per email in seconds (default: 30s)
+            progress_interval: See process_batch()
+
+        Returns:
+            BatchResult with results in input order
+        """
+        if not emails:
+            logger.warning("process_batch_async called with empty email list")
+            return self._build_result([], [], 0.0)
+
+        total = len(emails)
+        logger.info(f"Processing batch of {total} emails asynchronously "
+                    f"(concurrency {self.pool.size})...")
+        start_ns = time.monotonic_ns()
+
+        semaphore = asyncio.Semaphore(self.pool.size)
+        self._start_batch()
+        progress = _ProgressThrottle(progress_callback, total, progress_interval)
+        latencies: List[float] = []
+        completed = 0
+
+        async def run(i: int, email: Any) -> EmailResult:
+            nonlocal completed
+            async with semaphore:
+                if self._stop_event.is_set():
+                    completed += 1
+                    email_id = getattr(email, 'id', None)
+                    return _CANCELLED if email_id is None else EmailResult(
+                        email_id=email_id, error='cancelled', cancelled=True)
+
+                submit_ns = time.monotonic_ns()
+                try:
+                    result = await asyncio.wait_for(self._process_one_async(email), timeout=email_timeout)
+                except asyncio.TimeoutError:
+                    result = EmailResult(
+                        email_id=getattr(email, 'id', None),
+                        error=f'Timeout after {email_timeout}s',
+                        timeout=True
                     )
+                    logger.error(f"Email {i+1}/{total} timed out after {email_timeout}s")
+                latencies.append((time.monotonic_ns() - submit_ns) / 1e9)
+
+            completed += 1
+            progress.update(completed)
+            return result
+
+        results = await asyncio.gather(*(run(i, email) for i, email in enumerate(emails)))
+        progress.update(total, force=True)
+        self._log_failures()
+
+        batch = self._build_result(list(results), latencies, (time.monotonic_ns() - start_ns) / 1e9)
+        logger.info(
+            f"Async batch processing complete: {batch.success}/{batch.total} successful, "
+            f"{batch.failed} failed in {batch.elapsed_time:.2f}s "
+            f"({batch.emails_per_minute:.1f} emails/minute)"
+        )
+        return batch
+
+    async def _process_one_async(self, email: Any) -> EmailResult:
+        """
+        Process single email from the event loop.
+
+        Args:
+            email: Email object to process
+
+        Returns:
+            EmailResult with the analysis as payload, or the error
+        """
+        if not inspect.iscoroutinefunction(self.engine.analyze_email):
+            return await asyncio.to_thread(self._process_one, email)
+
+        email_id = getattr(email, 'id', None)
+        try:
+            with self.pool.acquire() as conn:
+                analysis = await self.engine.analyze_email(email, conn)
+                return EmailResult(email_id=email_id, error=analysis.get('error'), payload=analysis)
+
+        except Exception as e:
+            self._record_failure(f"id={email_id}", e)
+            return EmailResult(email_id=email_id, error=str(e))
+
+    def iter_batches(
+        self,
+        emails: List[Any],
+        chunk_size: int = 64,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        email_timeout: float = 30.0,
+        batch_timeout: Optional[float] = None,
+        progress_interval: float = 0.25,
+        circuit_threshold: float = 0.8,
+        circuit_min_samples: int = 10
+    ) -> Iterator[BatchResult]:
+        """
+        Process emails like process_batch(), yielding a BatchResult per chunk.
+
+        Lets callers store or display partial results while later chunks are
+        still running. Deadlines and progress are tracked across the whole list.
+
+        Args:
+            emails: List of email objects to process
+            chunk_size: Emails per yielded result (default: 64)
+            progress_callback: See process_batch()
+            email_timeout: See process_batch()
+            batch_timeout: See process_batch()
+            progress_interval: See process_batch()
+            circuit_threshold: See process_batch()
+            circuit_min_samples: See process_batch()
+
+        Yields:
+            BatchResult for each chunk, in input order
+        """
+        chunk_start_ns = time.monotonic_ns()
+        for chunk_results, chunk_latencies in self._iter_chunks(
+            emails, progress_callback, email_timeout, batch_timeout, progress_interval,
+            chunk_size, circuit_threshold, circuit_min_samples
+        ):
+            yield self._build_result(
+                chunk_results, chunk_latencies, (time.monotonic_ns() - chunk_start_ns) / 1e9)
+            chunk_start_ns = time.monotonic_ns()
+
+    def _iter_chunks(
+        self,
+        emails: List[Any],
+        progress_callback: Optional[Callable[[int, int], None]],
+        email_timeout: float,
+        batch_timeout: Optional[float],
+        progress_interval: float,
+        chunk_size: int,
+        circuit_threshold: float,
+        circuit_min_samples: int
+    ) -> Iterator[Tuple[List[EmailResult], List[float]]]:
+        """
+        Run emails chunk by chunk, each email against its own time budget and
+        all of them against one batch deadline.
+
+        Yields:
+            (results, latencies) for each chunk, in input order
+        """
+        total = len(emails)
+        chunk_size = max(1, chunk_size)
+
+        # The whole batch shares one outer deadline on top of the per-email
+        # budgets, so emails queued behind hung ones cannot wait forever
+        # (integer nanoseconds on the monotonic clock, like per-email latencies)
+        start_ns = time.monotonic_ns()
+        deadline_ns = start_ns + int(email_timeout * total * 1e9)
+        if batch_timeout is not None and batch_timeout < email_timeout * total:
+            deadline_ns = start_ns + int(batch_timeout * 1e9)
+            timeout_error = 'batch deadline exceeded'
+        else:
+            timeout_error = f'Timeout after {email_timeout}s'
+
+        progress = _ProgressThrottle(progress_callback, total, progress_interval)
+        breaker = _CircuitBreaker(circuit_threshold, circuit_min_samples)
+        self._start_batch()
+
+        for offset in range(0, total, chunk_size):
+            yield self._run_chunk(
+                emails[offset:offset + chunk_size], offset, total, email_timeout, deadline_ns,
+                timeout_error, progress, breaker
+            )
+
+        progress.update(total, force=True)
+        self._log_failures()
+
+    def _run_chunk(
+        self,
+        chunk: List[Any],
+        offset: int,
+        total: int,
+        email_timeout: float,
+        deadline_ns: int,
+        timeout_error: str,
+        progress: _ProgressThrottle,
+        breaker: _CircuitBreaker
+    ) -> Tuple[List[EmailResult], List[float]]:
+        """
+        Submit one chunk and reap its results until every email has finished,
+        run out of its own time budget, or the batch deadline passes.
+
+        Args:
+            chunk: Emails in this chunk
+            offset: Index of the chunk's first email in the batch
+            total: Batch size (for log messages and progress)
+            email_timeout: Seconds each email may run, counted from when it starts
+            deadline_ns: time.monotonic_ns() value after which the batch stops
+            timeout_error: Error message for emails still running at deadline_ns
+            progress: Batch progress throttle
+            breaker: Batch circuit breaker
+
+        Returns:
+            (results, latencies) for the chunk, results in input order
+        """
+        # Story 3.3 AC4: Submit the chunk for parallel processing, one future per
+        # email or, when the engine supports it, per group of emails_per_call
+        grouped = self.emails_per_call > 1
+        step = self.emails_per_call if grouped else 1
+        # Ids for error results, looked up once instead of per failure
+        email_ids = [getattr(email, 'id', None) for email in chunk]
+        # future -> (start index, group, submit time, [start time or 0])
+        future_map = {}
+        pending = set()
+
+        # Backpressure: the executor queue is unbounded, so only keep a few
+        # futures per worker in flight and top up as they complete
+        in_flight_limit = self.max_workers * self.IN_FLIGHT_PER_WORKER
+        group_starts = iter(range(0, len(chunk), step))
+
+        def submit_more() -> None:
+            while len(pending) < in_flight_limit and not breaker.is_open and not stop.is_set():
+                if time.monotonic_ns() >= deadline_ns:
+                    return
+                start = next(group_starts, None)
+                if start is None:
+                    return
+                group = chunk[start:start + step]
+                started = [0]
+                if grouped:
+                    future = self.executor.submit(self._run_timed, started, self._process_group, group)
                 else:
-                    success_count += 1
-                    logger.debug(f"Email {i+1}/{len(emails)} processed successfully")
-
-                results.append(result)
-
-            except FutureTimeoutError:
-                # Story 3.3 AC4: Timeout handling
-                failed_count += 1
-                error_result = {
-                    'error': f'Timeout after {email_timeout}s',
-                    'email_id': getattr(email, 'id', None),
-                    'timeout': True
-                }
-                results.append(error_result)
-                logger.error(
-                    f"Email {i+1}/{len(emails)} timed out after {email_timeout}s"
-                )
+                    future = self.executor.submit(self._run_timed, started, self._process_one, group[0])
+                future_map[future] = (start, group, time.monotonic_ns(), started)
+                pending.add(future)
+            self._in_flight = len(pending)
 
-            except Exception as e:
-                # Story 3.3 AC4: Individual email failures don't stop batch
-                failed_count += 1
-                error_result = {
-                    'error': str(e),
-                    'email_id': getattr(email, 'id', None),
-                    'exception': True
-                }
-                results.append(error_result)
-                logger.error(
-                    f"Email {i+1}/{len(emails)} failed with exception: {e}",
-                    exc_info=True
-                )
-
-            # Story 3.3 AC4: Progress callback support
-            if progress_callback:
+        # Story 3.3 AC4: Reap results as they complete, with individual error handling
+        results: List[Optional[EmailResult]] = [None] * len(chunk)
+        latencies: List[float] = []
+        timed_out: List[int] = []
+        completed = 0
+        budget_ns = int(email_timeout * step * 1e9)
+        # Checked once per chunk so the success path skips building debug messages
+        debug = logger.isEnabledFor(logging.DEBUG)
+        stop = self._stop_event
+        wake = self._wake
+
+        def time_out(future: Future, now_ns: int, error: str) -> None:
+            # Report every email of a running future as timed out
+            nonlocal completed
+            start, group, submit_ns, _ = future_map.pop(future)
+            future.cancel()
+            for i in range(start, start + len(group)):
+                results[i] = EmailResult(email_id=email_ids[i], error=error, timeout=True)
+                latencies.append((now_ns - submit_ns) / 1e9)
+                timed_out.append(i)
+                completed += 1
+                breaker.record(True)
+            progress.update(offset + completed)
+
+        submit_more()
+        while pending:
+            now_ns = time.monotonic_ns()
+            if now_ns >= deadline_ns:
+                break
+
+            # Abandon emails that have run past their own budget; the worker
+            # thread finishes in the background but no longer holds the chunk
+            next_check_ns = min(deadline_ns, now_ns + budget_ns)
+            for future in list(pending):
+                started_ns = future_map[future][3][0]
+                if not started_ns:
+                    continue
+                if now_ns - started_ns >= budget_ns and not future.done():
+                    pending.discard(future)
+                    time_out(future, now_ns, f'Timeout after {email_timeout}s')
+                else:
+                    next_check_ns = min(next_check_ns, started_ns + budget_ns)
+            self._in_flight = len(pending)
+            if breaker.is_open:
+                break
+            if not pending:
+                submit_more()
+                continue
+
+            # Drain every future finished since the last wake-up in one pass
+            remaining = max(0.0, (next_check_ns - now_ns) / 1e9)
+            done, _ = wait(pending | {wake}, timeout=remaining, return_when=FIRST_COMPLETED)
+            done.discard(wake)
+            pending.difference_update(done)
+            self._in_flight = len(pending)
+            for future in done:
+                start, group, submit_ns, _ = future_map.pop(future)
                 try:
-                    progress_callback(i + 1, len(emails))
+                    outcome = future.result()
+                    group_results = outcome if grouped else [outcome]
                 except Exception as e:
-                    logger.warning(f"Progress callback failed: {e}")
+                    # Story 3.3 AC4: Individual email failures don't stop batch
+                    group_results = [
+                        EmailResult(email_id=email_id, error=str(e), exception=True)
+                        for email_id in email_ids[start:start + len(group)]
+                    ]
+                    self._record_failure(f"{offset + start + 1}/{total}", e)
 
-        # Story 3.3 AC5: Calculate performance metrics
-        elapsed_time = time.time() - start_time
-        emails_per_minute = (len(emails) / elapsed_time) * 60 if elapsed_time > 0 else 0.0
+                latency = (time.monotonic_ns() - submit_ns) / 1e9
+                for i, result in enumerate(group_results, start):
+                    if result.error and not result.exception:
+                        # Email processed but had an error
+                        logger.warning(f"Email {offset + i + 1}/{total} failed: {result.error}")
+                    elif debug and not result.error:
+                        logger.debug(f"Email {offset + i + 1}/{total} processed successfully")
 
-        logger.info(
-            f"Batch processing complete: {success_count}/{len(emails)} successful, "
-            f"{failed_count} failed in {elapsed_time:.2f}s "
-            f"({emails_per_minute:.1f} emails/minute)"
-        )
+                    results[i] = result
+                    latencies.append(latency)
+                    completed += 1
+                    progress.update(offset + completed)
+                    breaker.record(bool(result.error))
+
+            if breaker.is_open or stop.is_set():
+                break
+            submit_more()
+
+        # Give up on everything unfinished. Futures that cancel cleanly never
+        # started; the rest are still running
+        now_ns = time.monotonic_ns()
+        cancelled_before_start = [future for future in pending if future.cancel()]
+        for future in cancelled_before_start:
+            pending.discard(future)
+            del future_map[future]
+        self._in_flight = 0
+
+        # Cancellation storms (a tripped breaker on a large batch) reuse one
+        # shared result for id-less emails and log a single summary line.
+        # Cancellation and an open circuit breaker take precedence over the deadline.
+        if breaker.is_open or stop.is_set():
+            error, shared = ('cancelled', _CANCELLED) if stop.is_set() else ('circuit_open', _CIRCUIT_OPEN)
+            for i, email_id in enumerate(email_ids):
+                if results[i] is None:
+                    results[i] = shared if email_id is None else EmailResult(
+                        email_id=email_id,
+                        error=error,
+                        cancelled=True
+                    )
+            return results, latencies
+
+        # Story 3.3 AC4: Timeout handling - emails running at the batch deadline
+        for future in list(pending):
+            time_out(future, now_ns, timeout_error)
+
+        # Emails never started before the batch deadline did not time out
+        not_started = [i for i, result in enumerate(results) if result is None]
+        for i in not_started:
+            email_id = email_ids[i]
+            results[i] = _NOT_STARTED if email_id is None else EmailResult(
+                email_id=email_id,
+                error='not_started',
+                cancelled=True
+            )
+
+        if timed_out:
+            logger.error(
+                f"{len(timed_out)} emails timed out, "
+                f"starting with email {offset + min(timed_out) + 1}/{total}"
+            )
+        if not_started:
+            logger.error(
+                f"{len(not_started)} emails not started before the batch deadline, "
+                f"starting with email {offset + not_started[0] + 1}/{total}"
+            )
+
+        return results, latencies
+
+    @staticmethod
+    def _run_timed(started: List[int], fn: Callable[[Any], Any], arg: Any) -> Any:
+        """Record when a submitted task starts running (in started[0]), then run it."""
+        started[0] = time.monotonic_ns()
+        return fn(arg)
+
+    def _build_result(self, results: List[EmailResult], latencies: List[float],
+                      elapsed_time: float) -> BatchResult:
+        """
+        Aggregate results and latencies into a BatchResult.
+
+        Story 3.3 AC5: Performance metrics (emails/minute and latency percentiles)
+        """
+        total = len(results)
+        failed = sum(1 for result in results if result.error)
+        emails_per_minute = (total / elapsed_time) * 60 if elapsed_time > 0 else 0.0
+
+        p50 = p90 = p99 = max_latency = 0.0
+        if latencies:
+            p50, p90, p99 = self._latency_percentiles(latencies, (50, 90, 99))
+            max_latency = max(latencies)
 
         return BatchResult(
-            total=len(emails),
-            success=success_count,
-            failed=failed_count,
+            total=total,
+            success=total - failed,
+            failed=failed,
             results=results,
             elapsed_time=elapsed_time,
-            emails_per_minute=emails_per_minute
+            emails_per_minute=emails_per_minute,
+            p50=p50,
+            p90=p90,
+            p99=p99,
+            max_latency=max_latency
         )
 
-    def _process_one(self, email: Any) -> Dict[str, Any]:
+    @staticmethod
+    def _latency_percentiles(latencies: List[float], percentiles: tuple) -> List[float]:
+        """
+        Nearest-rank percentiles of per-email latencies.
+
+        Args:
+            latencies: Seconds from each email's submission to its result
+            percentiles: Percentiles to compute (0-100)
+
+        Returns:
+            List of latencies, one per requested percentile
+        """
+        ordered = sorted(latencies)
+        last = len(ordered) - 1
+        return [ordered[min(last, max(0, -(-p * len(ordered) // 100) - 1))] for p in percentiles]
+
+    def _process_one(self, email: Any) -> EmailResult:
         """
         Process single email with pooled connection.
 
@@ -202,32 +965,110 @@ class EmailBatchProcessor:
             email: Email object to process
 
         Returns:
-            Dictionary with analysis results or error information
+            EmailResult with the analysis as payload, or the error
         """
+        email_id = getattr(email, 'id', None)
+        if self._stop_event.is_set():
+            return _CANCELLED if email_id is None else EmailResult(
+                email_id=email_id, error='cancelled', cancelled=True)
+
         try:
             # Story 3.3 AC2: Use connection pool context manager
             with self.pool.acquire() as conn:
                 # Process email using analysis engine
                 # Note: EmailAnalysisEngine.analyze_email needs to accept conn parameter
-                result = self.engine.analyze_email(email, conn)
-                return result
+                analysis = self.engine.analyze_email(email, conn)
+                return EmailResult(email_id=email_id, error=analysis.get('error'), payload=analysis)
 
         except Exception as e:
-            logger.error(f"Error processing email: {e}", exc_info=True)
-            return {
-                'error': str(e),
-                'email_id': getattr(email, 'id', None)
-            }
+            self._record_failure(f"id={email_id}", e)
+            return EmailResult(email_id=email_id, error=str(e))
+
+    def _process_group(self, group: List[Any]) -> List[EmailResult]:
+        """
+        Process a group of emails with one engine call on one pooled connection.
+
+        Args:
+            group: Emails to analyze together
+
+        Returns:
+            One EmailResult per email, in group order
+        """
+        email_ids = [getattr(email, 'id', None) for email in group]
+        try:
+            with self.pool.acquire() as conn:
+                analyses = self.engine.analyze_emails(group, conn)
+
+        except Exception as e:
+            self._record_failure(f"group starting id={email_ids[0]}", e)
+            return [EmailResult(email_id=email_id, error=str(e)) for email_id in email_ids]
+
+        return [
+            EmailResult(email_id=email_id, error=analysis.get('error'), payload=analysis)
+            for email_id, analysis in zip(email_ids, analyses)
+        ]
+
+    def cancel_batch(self) -> None:
+        """
+        Abort the batch that is currently running.
+
+        Emails not yet started are reported as EmailResult(error='cancelled',
+        cancelled=True) and process_batch() returns without waiting for them.
+        Emails already inside the engine finish in the background; their results
+        are discarded. The next batch starts with the flag cleared.
+        """
+        logger.info("Cancelling current batch...")
+        self._stop_event.set()
+        if not self._wake.done():
+            self._wake.set_result(None)
+
+    def _start_batch(self) -> None:
+        """Reset per-batch state: cancellation flag and buffered failures."""
+        self._stop_event.clear()
+        self._wake = Future()
+        self._failures.clear()
+
+    def _record_failure(self, label: str, e: Exception) -> None:
+        """
+        Log a one-line warning for a failed email and keep its exception.
+
+        Tracebacks are formatted once per batch by _log_failures() instead of on
+        every failure, so failure-heavy batches don't serialize on traceback
+        formatting and the logging lock.
+
+        Args:
+            label: Email position or id for the log message
+            e: Exception raised while processing
+        """
+        logger.warning(f"Email {label} failed with exception: {e!r}")
+        self._failures.append((label, e))
+
+    def _log_failures(self) -> None:
+        """Log the tracebacks of the batch's most recent failures as one error."""
+        failures = list(self._failures)
+        self._failures.clear()
+        if not failures:
+            return
+
+        details = "\n".join(
+            f"Email {label}:\n{''.join(traceback.format_exception(e))}" for label, e in failures
+        )
+        logger.error(f"Tracebacks for the last {len(failures)} failed emails:\n{details}")
 
     def shutdown(self, wait: bool = True) -> None:
         """
         Shutdown the thread pool executor.
 
-        Story 3.3 arch-8: Graceful cleanup
+        Story 3.3 arch-8: Graceful cleanup. The shared executor outlives any
+        one processor, so this only shuts down an injected executor.
 
         Args:
             wait: If True, wait for all submitted tasks to complete
         """
+        if not self._owns_executor:
+            logger.debug("EmailBatchProcessor uses the shared executor, nothing to shut down")
+            return
+
         logger.info("Shutting down EmailBatchProcessor...")
         self.executor.shutdown(wait=wait)
         logger.info("EmailBatchProcessor shutdown complete")
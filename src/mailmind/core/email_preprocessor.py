@@ -21,17 +21,49 @@ import re
 import time
 import logging
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from html import unescape
+from io import BytesIO
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from email.parser import Parser
+from email import policy
+from email.errors import HeaderParseError
+from email.header import decode_header, make_header
+from email.parser import BytesParser, Parser
 from email.message import Message
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 try:
     from bs4 import BeautifulSoup
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 try:
     from dateutil import parser as date_parser
     DATEUTIL_AVAILABLE = True
@@ -51,15 +83,25 @@ from mailmind.core.security_logger import get_security_logger
 
 logger = logging.getLogger(__name__)
 
+# Per-thread EmailPreprocessor reused by the preprocess_email() convenience function
+_local = threading.local()
+
+# Per-process EmailPreprocessors used by preprocess_batch() workers, keyed by
+# (security_level, security_patterns_path)
+_worker_preprocessors: Dict[Tuple[str, Optional[str]], 'EmailPreprocessor'] = {}
 
-# Email signature detection patterns
+# Emails handed to a preprocess_batch() worker process per task
+BATCH_CHUNKSIZE = 32
+
+
+# Email signature detection patterns (trailing whitespace stops at the line end)
 SIGNATURE_PATTERNS = [
-    r'^--\s*$',  # Standard email signature delimiter
+    r'^--[^\S\n]*$',  # Standard email signature delimiter
     r'^_{10,}',  # Underscores (10 or more)
     r'^={10,}',  # Equals signs
     r'Sent from my (iPhone|iPad|Android|BlackBerry)',
     r'Get Outlook for (iOS|Android)',
-    r'\b(Best regards|Sincerely|Thanks|Cheers|Regards|Kind regards|Warm regards|Cordially),?\s*$',
+    r'\b(Best regards|Sincerely|Thanks|Cheers|Regards|Kind regards|Warm regards|Cordially),?[^\S\n]*$',
     r'\b(Phone|Tel|Mobile|Cell|Office):',
     r'\bwww\.[a-z0-9-]+\.(com|net|org|io|co)',
     r'CONFIDENTIALITY NOTICE',
@@ -70,12 +112,79 @@ SIGNATURE_PATTERNS = [
 # Quote detection patterns
 QUOTE_PATTERNS = [
     r'^On .+ wrote:$',  # Gmail style: "On Mon, Oct 13, 2025 at 2:30 PM, Alice wrote:"
-    r'^From:.+Sent:.+To:.+Subject:',  # Outlook style headers
+    # Outlook style headers; each gap stops at the first marker (tempered) so a
+    # long header line cannot make the three gaps backtrack against each other
+    r'^From:.(?:(?!Sent:).)*Sent:.(?:(?!To:).)*To:.(?:(?!Subject:).)*Subject:',
     r'^>',  # Traditional quote marker
     r'^\|',  # Pipe-style quote marker
     r'^>{2,}',  # Multiple quote markers (nested quotes)
 ]
 
+# Flags for SIGNATURE_PATTERNS/QUOTE_PATTERNS. Not DOTALL: '.+' must stay on one line
+STRIP_PATTERN_FLAGS = re.MULTILINE | re.IGNORECASE | re.ASCII
+
+# Compiled once at import (all ASCII, so \s and \b skip the Unicode tables)
+_SIGNATURE_RES = [re.compile(p, STRIP_PATTERN_FLAGS) for p in SIGNATURE_PATTERNS]
+_QUOTE_RES = [re.compile(p, STRIP_PATTERN_FLAGS) for p in QUOTE_PATTERNS]
+# Quote patterns are all line-anchored, so one alternation scan finds the
+# same earliest line as searching them one by one
+_QUOTE_RE = re.compile('|'.join(f'(?:{p})' for p in QUOTE_PATTERNS), STRIP_PATTERN_FLAGS)
+
+# Bodies shorter than this skip signature/quote stripping in preprocess_email
+SHORT_BODY_CHARS = 64
+
+# Attachment extensions that trigger a warning (matched case-insensitively)
+DANGEROUS_EXTENSIONS = ('.exe', '.scr', '.bat', '.cmd', '.vbs', '.js')
+
+# Date header layouts tried with strptime before falling back to dateutil
+_FAST_DATE_FORMATS = (
+    '%a, %d %b %Y %H:%M:%S %z',  # RFC 2822: "Mon, 13 Oct 2025 14:30:00 +0000"
+    '%a, %d %b %Y %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S%z',
+)
+
+# Reply/forward subject prefixes, possibly stacked ("Re: Fwd: ...")
+_REPLY_PREFIX_RE = re.compile(r'^(?:(?:Re|Fwd|Fw):\s*)+', re.IGNORECASE)
+
+# HTML cleanup pattern used by parse_html
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Start of a tag, end tag, comment or doctype: "HTML" without one is plain text
+_HTML_MARKUP_RE = re.compile(r'<[a-zA-Z/!]')
+
+# A plain-text alternative at least this long (and at least half the HTML's
+# length) is used as the body instead of converting the HTML part
+PLAIN_BODY_PREFERRED_CHARS = 200
+
+# C0/C1 control characters and DEL, except newline and tab
+_CTRL_TRANS = dict.fromkeys(
+    c for c in range(0xA0) if not chr(c).isprintable() and chr(c) not in '\n\t'
+)
+
+# The ASCII subset: for pure-ASCII text these are the only non-printables
+_ASCII_CTRL = {c: None for c in _CTRL_TRANS if c < 128}
+
+# The same characters as a regex class: on non-ASCII text a search that finds
+# nothing is far cheaper than str.translate with a dict table
+_CTRL_RE = re.compile('[\x00-\x08\x0b-\x1f\x7f-\x9f]')
+
+# Elements whose content never reaches the extracted text
+_SKIPPED_HTML_TAGS = frozenset(['head', 'script', 'style', 'meta', 'link'])
+
+# Fast HTML mode (parse_html(fast_html=True)), applied in this order. Unclosed
+# comments/skipped elements run to the end, and link text stops at the next
+# <a>, so every pattern stays linear on malformed input
+_FAST_SKIP_RE = re.compile(
+    r'<!--.*?(?:-->|\Z)'
+    r'|<(script|style|head)\b[^>]*>.*?(?:</\1\s*>|\Z)'
+    r'|<(?:meta|link)\b[^>]*>',
+    re.IGNORECASE | re.DOTALL
+)
+_FAST_LINK_RE = re.compile(r'<a\b([^>]*)>((?:(?!<a\b|</a\s*>).)*)</a\s*>', re.IGNORECASE | re.DOTALL)
+_FAST_IMG_RE = re.compile(r'<img\b([^>]*)>', re.IGNORECASE)
+_FAST_TAG_RE = re.compile(r'</?[a-zA-Z!?][^>]*>')
+_HTML_ATTR_RE = re.compile(r'([a-zA-Z-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+
 # Suspicious content patterns for prompt injection detection
 SUSPICIOUS_PATTERNS = [
     r'ignore\s+(previous|all|prior)\s+instructions',
@@ -99,6 +208,7 @@ class EmailPreprocessor:
     Attributes:
         signature_patterns: Compiled regex patterns for signature detection
         quote_patterns: Compiled regex patterns for quote detection
+        quote_pattern: All quote patterns as one compiled alternation
         suspicious_patterns: Compiled regex patterns for security checks
         warnings: List of warnings generated during preprocessing
         security_level: Security level for prompt injection blocking ("Strict", "Normal", "Permissive")
@@ -126,15 +236,17 @@ class EmailPreprocessor:
         self.security_level = security_level
         self.security_patterns_path = security_patterns_path
 
-        # Compile regex patterns
-        self.signature_patterns = [re.compile(p, re.MULTILINE | re.IGNORECASE)
-                                   for p in SIGNATURE_PATTERNS]
-        self.quote_patterns = [re.compile(p, re.MULTILINE | re.IGNORECASE)
-                              for p in QUOTE_PATTERNS]
+        # Regex patterns are compiled once at import and shared by all instances
+        self.signature_patterns = _SIGNATURE_RES
+        self.quote_patterns = _QUOTE_RES
+        self.quote_pattern = _QUOTE_RE
 
         # Load security patterns (will be enhanced in Task 3 with YAML loading)
         # For now, use default patterns with severity metadata
         self.suspicious_patterns = self._load_security_patterns()
+        self._pattern_set = self._compile_pattern_set(
+            tuple(p["regex"].pattern for p in self.suspicious_patterns)
+        )
 
         self.warnings: List[str] = []
 
@@ -143,7 +255,8 @@ class EmailPreprocessor:
 
         logger.info(f"EmailPreprocessor initialized with security_level='{security_level}'")
 
-    def preprocess_email(self, raw_email: Any, max_chars: int = 10000) -> Dict[str, Any]:
+    def preprocess_email(self, raw_email: Any, max_chars: int = 10000,
+                         fast_html: bool = False) -> Dict[str, Any]:
         """
         Preprocess raw email into structured format for LLM.
 
@@ -151,8 +264,10 @@ class EmailPreprocessor:
         preprocessing steps and returns a structured dictionary ready for LLM consumption.
 
         Args:
-            raw_email: Raw email message (can be MIME string, dict, or email.message.Message)
+            raw_email: Raw email message (can be MIME string or bytes, dict, or email.message.Message)
             max_chars: Maximum characters before truncation (default: 10000)
+            fast_html: Convert HTML with the single-pass tag scanner instead of
+                a parser (default: False)
 
         Returns:
             Dictionary with preprocessed email data:
@@ -170,18 +285,30 @@ class EmailPreprocessor:
         self.warnings = []  # Reset warnings for each email
 
         try:
+            # Parse MIME once; every step below accepts the Message
+            if isinstance(raw_email, (bytes, bytearray)):
+                raw_email = BytesParser(policy=policy.compat32).parsebytes(raw_email)
+            elif isinstance(raw_email, str):
+                raw_email = Parser(policy=policy.compat32).parsestr(raw_email)
+
             # Step 1: Extract metadata
             metadata = self.extract_metadata(raw_email)
 
+            # Walk MIME parts once for both the body and the attachment list
+            parts = self._walk_parts(raw_email) if isinstance(raw_email, Message) else None
+
             # Step 2: Parse body (HTML → plain text if needed)
-            body = self.parse_body(raw_email)
+            # HTML beyond twice the truncation limit never reaches the output
+            body = self.parse_body(raw_email, parts=parts, max_html_chars=max_chars * 2,
+                                   fast_html=fast_html)
 
-            # Step 3: Strip signatures and quotes
-            body = self.strip_signatures(body)
-            body = self.strip_quotes(body)
+            # Step 3: Strip signatures and quotes (short notifications have neither)
+            if len(body) >= SHORT_BODY_CHARS:
+                body = self.strip_signatures(body)
+                body = self.strip_quotes(body)
 
             # Step 4: Handle attachments
-            attachments = self.extract_attachments(raw_email)
+            attachments = self.extract_attachments(raw_email, parts=parts)
 
             # Step 5: Truncate if needed
             body, was_truncated = self.smart_truncate(body, max_chars=max_chars)
@@ -223,6 +350,50 @@ class EmailPreprocessor:
             logger.error(f"Email preprocessing failed: {e}", exc_info=True)
             raise EmailPreprocessorError(f"Failed to preprocess email: {str(e)}") from e
 
+    def preprocess_batch(self, raw_emails: List[Any], max_chars: int = 10000,
+                         fast_html: bool = False,
+                         workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Preprocess many emails in parallel worker processes.
+
+        Emails share no state, and MIME parsing, HTML conversion and pattern
+        scanning are CPU-bound, so a process pool scales with the core count
+        where threads would serialize on the GIL. Each worker process builds
+        one EmailPreprocessor with this instance's security settings and
+        reuses it for every email it receives.
+
+        Batches of dicts (already-parsed Outlook emails) and batches no larger
+        than one chunk are processed in this process: without MIME parsing,
+        pickling and worker startup cost more than they save.
+
+        Args:
+            raw_emails: Emails in any format accepted by preprocess_email
+            max_chars: Maximum characters before truncation (default: 10000)
+            fast_html: Convert HTML with the single-pass tag scanner (default: False)
+            workers: Worker process count (default: os.cpu_count())
+
+        Returns:
+            Preprocessed email dictionaries, in input order
+
+        Raises:
+            EmailPreprocessorError: If preprocessing fails critically for any email
+            SecurityException: If any email is blocked by the security level
+        """
+        raw_emails = list(raw_emails)
+        workers = min(workers or os.cpu_count() or 1, -(-len(raw_emails) // BATCH_CHUNKSIZE))
+
+        if workers <= 1 or all(isinstance(raw_email, dict) for raw_email in raw_emails):
+            return [self.preprocess_email(raw_email, max_chars=max_chars, fast_html=fast_html)
+                    for raw_email in raw_emails]
+
+        settings = (self.security_level, self.security_patterns_path, max_chars, fast_html)
+        logger.info(f"Preprocessing batch of {len(raw_emails)} emails in {workers} processes")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_preprocess_worker, raw_emails,
+                                     [settings] * len(raw_emails),
+                                     chunksize=BATCH_CHUNKSIZE))
+
     def extract_metadata(self, raw_email: Any) -> Dict[str, Any]:
         """
         Extract email metadata (sender, subject, date, message ID, thread info).
@@ -260,14 +431,9 @@ class EmailPreprocessor:
                 logger.warning(f"Unknown email format: {type(raw_email)}")
                 return self._get_default_metadata()
 
-            # Extract sender (from field)
-            from_field = msg.get('From', 'unknown@unknown.com')
-
-            # Extract subject and decode MIME encoding if needed
-            subject = msg.get('Subject', '(No Subject)')
-            if hasattr(subject, 'encode'):
-                # Already decoded by parser
-                subject = str(subject)
+            # Extract sender and subject, decoding MIME encoded words if needed
+            from_field = self._decode_header_value(msg.get('From', 'unknown@unknown.com'))
+            subject = self._decode_header_value(msg.get('Subject', '(No Subject)'))
 
             # Extract and parse date
             date_field = msg.get('Date', '')
@@ -307,7 +473,13 @@ class EmailPreprocessor:
             self.warnings.append(f"Metadata extraction error: {str(e)}")
             return self._get_default_metadata()
 
-    def parse_body(self, raw_email: Any) -> str:
+    def parse_body(
+        self,
+        raw_email: Any,
+        parts: Optional[Tuple[str, str, List[Tuple[str, int]]]] = None,
+        max_html_chars: Optional[int] = None,
+        fast_html: bool = False
+    ) -> str:
         """
         Parse email body and convert HTML to plain text if needed.
 
@@ -316,6 +488,9 @@ class EmailPreprocessor:
 
         Args:
             raw_email: Raw email in supported format
+            parts: Result of _walk_parts() for raw_email, if already computed
+            max_html_chars: Stop HTML text extraction after this many characters
+            fast_html: Use the single-pass tag scanner for HTML (see parse_html)
 
         Returns:
             Clean plain text body
@@ -329,9 +504,9 @@ class EmailPreprocessor:
                 body = raw_email.get('body', raw_email.get('Body', ''))
                 body_html = raw_email.get('body_html', raw_email.get('HTMLBody', ''))
 
-                # Prefer HTML if available
-                if body_html:
-                    return self.parse_html(body_html)
+                # Prefer HTML if available, unless the plain text is substantive
+                if body_html and not self._plain_body_suffices(body, body_html):
+                    return self.parse_html(body_html, max_chars=max_html_chars, fast_html=fast_html)
                 return str(body)
             elif isinstance(raw_email, Message):
                 msg = raw_email
@@ -342,19 +517,11 @@ class EmailPreprocessor:
             # Extract body from Message object
             if msg.is_multipart():
                 # Handle multipart messages
-                body = ""
-                html_body = ""
-
-                for part in msg.walk():
-                    content_type = part.get_content_type()
-                    if content_type == 'text/plain':
-                        body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                    elif content_type == 'text/html':
-                        html_body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-
-                # Prefer HTML conversion over plain text
-                if html_body:
-                    return self.parse_html(html_body)
+                body, html_body, _ = parts if parts is not None else self._walk_parts(msg)
+
+                # Prefer HTML conversion over plain text, unless the plain text is substantive
+                if html_body and not self._plain_body_suffices(body, html_body):
+                    return self.parse_html(html_body, max_chars=max_html_chars, fast_html=fast_html)
                 return body
             else:
                 # Single part message
@@ -362,12 +529,12 @@ class EmailPreprocessor:
                 payload = msg.get_payload(decode=True)
 
                 if payload:
-                    body = payload.decode('utf-8', errors='ignore')
+                    body = self._decode_payload(payload, msg)
                 else:
                     body = str(msg.get_payload())
 
                 if content_type == 'text/html':
-                    return self.parse_html(body)
+                    return self.parse_html(body, max_chars=max_html_chars, fast_html=fast_html)
                 return body
 
         except Exception as e:
@@ -375,84 +542,74 @@ class EmailPreprocessor:
             self.warnings.append(f"Body parsing error: {str(e)}")
             return ""
 
-    def parse_html(self, html_content: str) -> str:
+    def parse_html(self, html_content: str, max_chars: Optional[int] = None,
+                   fast_html: bool = False) -> str:
         """
         Convert HTML email to clean plain text with structure preserved.
 
-        Uses BeautifulSoup to parse HTML and extract text while:
+        Uses lxml (or selectolax, then BeautifulSoup, when lxml is not installed)
+        to extract text while:
         - Preserving paragraph structure (double newlines)
         - Converting links to "text (URL)" format
         - Noting inline images as "[Image: filename.jpg]"
         - Removing scripts, styles, and tracking pixels
 
+        With lxml the HTML is parsed incrementally; when max_chars is given,
+        parsing stops once that much text has been extracted, so huge
+        marketing emails are never built into a full tree.
+
+        Content without any markup (no tag, comment or doctype) is treated as
+        plain text and never reaches a parser.
+
+        With fast_html, no parser or tree is involved: a short chain of regex
+        substitutions does the same conversion over the whole string (max_chars
+        is not applied). Well-formed email HTML gives the same text; malformed
+        markup is not repaired the way a parser would.
+
         Args:
             html_content: HTML email content
+            max_chars: Stop after this many characters of text (default: None)
+            fast_html: Use the single-pass tag scanner (default: False)
 
         Returns:
             Clean plain text with structure preserved
 
         Raises:
-            HTMLParsingError: If BeautifulSoup is not available or parsing fails
+            HTMLParsingError: If no HTML parser is available
         """
-        if not BS4_AVAILABLE:
-            raise HTMLParsingError("BeautifulSoup4 not available. Install with: pip install beautifulsoup4 lxml")
+        is_markup = _HTML_MARKUP_RE.search(html_content) is not None
+        if is_markup and not (fast_html or LXML_AVAILABLE or SELECTOLAX_AVAILABLE or BS4_AVAILABLE):
+            raise HTMLParsingError("No HTML parser available. Install with: pip install lxml")
 
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
-
-            # Remove scripts, styles, and tracking pixels
-            for tag in soup(['script', 'style', 'meta', 'link']):
-                tag.decompose()
-
-            # Remove 1x1 tracking images
-            for img in soup.find_all('img'):
-                width = img.get('width', '')
-                height = img.get('height', '')
-                if width == '1' or height == '1':
-                    img.decompose()
-                else:
-                    # Replace image with placeholder
-                    alt_text = img.get('alt', 'image')
-                    src = img.get('src', '')
-                    filename = src.split('/')[-1] if src else 'unknown'
-                    img.replace_with(f"[Image: {filename}]")
-
-            # Convert links to readable format
-            for link in soup.find_all('a'):
-                link_text = link.get_text().strip()
-                link_url = link.get('href', '')
-                if link_url and link_url != link_text:
-                    link.replace_with(f"{link_text} ({link_url})")
-                elif link_text:
-                    link.replace_with(link_text)
-
-            # Get text with structure preserved
-            text = soup.get_text(separator='\n')
-
-            # Clean up whitespace
-            lines = []
-            for line in text.split('\n'):
-                line = line.strip()
-                if line:
-                    lines.append(line)
-
-            # Join with double newlines for paragraph structure
-            text = '\n\n'.join(lines)
-
-            # Reduce multiple newlines
-            text = re.sub(r'\n{3,}', '\n\n', text)
+            if not is_markup:
+                # Plain text labelled text/html: only entities need decoding
+                text = unescape(html_content) if '&' in html_content else html_content
+            elif fast_html:
+                text = self._fast_html_to_text(html_content)
+            elif LXML_AVAILABLE:
+                text = self._html_to_text(html_content, max_chars=max_chars)
+            elif SELECTOLAX_AVAILABLE:
+                text = self._lexbor_to_text(html_content)
+            else:
+                text = self._soup_to_text(html_content)
+
+            # One line per text node, paragraphs separated by blank lines. Any
+            # whitespace around a newline goes, as do blank and whitespace-only
+            # lines (split/strip in C: a regex here is quadratic on long space runs)
+            text = '\n\n'.join(filter(None, map(str.strip, text.split('\n'))))
 
             logger.debug(f"HTML parsed to {len(text)} chars")
 
-            return text.strip()
+            return text
 
         except Exception as e:
             logger.error(f"HTML parsing failed: {e}")
             self.warnings.append(f"HTML parsing failed, using raw content: {str(e)}")
             # Fallback: return raw HTML with tags stripped
-            return re.sub(r'<[^>]+>', ' ', html_content)
+            return _HTML_TAG_RE.sub(' ', html_content)
 
-    def extract_attachments(self, raw_email: Any) -> List[str]:
+    def extract_attachments(self, raw_email: Any, parts: Optional[Tuple[str, str, List[Tuple[str, int]]]] = None) -> List[str]:
         """
         Extract attachment metadata (filename and size).
 
@@ -460,6 +617,7 @@ class EmailPreprocessor:
 
         Args:
             raw_email: Raw email in supported format
+            parts: Result of _walk_parts() for raw_email, if already computed
 
         Returns:
             List of attachment strings: ["report.pdf (2.3MB)", "image.png (450KB)"]
@@ -478,7 +636,9 @@ class EmailPreprocessor:
                                 size = att.get('size', att.get('Size', 0))
                                 attachments.append(self._format_attachment(name, size))
                             else:
-                                attachments.append(str(att))
+                                name = str(att)
+                                attachments.append(name)
+                            self._check_attachment_name(str(name), attachments[-1])
                 return attachments
 
             elif isinstance(raw_email, str):
@@ -489,27 +649,14 @@ class EmailPreprocessor:
                 return []
 
             # Extract from Message object
-            for part in msg.walk():
-                if part.get_content_maintype() == 'multipart':
-                    continue
-                if part.get('Content-Disposition') is None:
-                    continue
-
-                filename = part.get_filename()
-                if filename:
-                    # Get size from payload
-                    payload = part.get_payload(decode=True)
-                    size = len(payload) if payload else 0
-                    attachments.append(self._format_attachment(filename, size))
+            _, _, found = parts if parts is not None else self._walk_parts(msg)
+            for filename, size in found:
+                attachments.append(self._format_attachment(filename, size))
+                self._check_attachment_name(filename, attachments[-1])
 
             if attachments:
                 logger.debug(f"Found {len(attachments)} attachments")
 
-            # Check for potentially malicious attachments
-            for att in attachments:
-                if any(ext in att.lower() for ext in ['.exe', '.scr', '.bat', '.cmd', '.vbs', '.js']):
-                    self.warnings.append(f"Potentially dangerous attachment detected: {att}")
-
             return attachments
 
         except Exception as e:
@@ -533,24 +680,13 @@ class EmailPreprocessor:
         if not body:
             return body
 
-        lines = body.split('\n')
-        signature_start = None
-
-        # Find signature start
-        for i, line in enumerate(lines):
-            # Check if line matches any signature pattern
-            for pattern in self.signature_patterns:
-                if pattern.search(line):
-                    signature_start = i
-                    break
-
-            if signature_start is not None:
-                break
-
-        if signature_start is not None:
-            # Keep content before signature
-            result = '\n'.join(lines[:signature_start]).strip()
-            logger.debug(f"Stripped signature at line {signature_start}")
+        # Find signature start (earliest match of any pattern)
+        match = self._earliest_match(self.signature_patterns, body)
+        if match:
+            # Keep content before the line the signature starts on
+            line_start = body.rfind('\n', 0, match.start()) + 1
+            result = body[:line_start].strip()
+            logger.debug(f"Stripped signature at offset {line_start} ({match.re.pattern})")
             return result
 
         return body
@@ -571,32 +707,23 @@ class EmailPreprocessor:
         if not body:
             return body
 
-        lines = body.split('\n')
-        quote_start = None
-
-        # Find where quotes begin
-        for i, line in enumerate(lines):
-            # Check if line matches any quote pattern
-            for pattern in self.quote_patterns:
-                if pattern.search(line):
-                    quote_start = i
+        # Find where quotes begin (earliest match of any pattern)
+        match = self.quote_pattern.search(body)
+        if match:
+            # Keep content before quotes plus the first 2 quoted lines for context
+            quote_start = body.rfind('\n', 0, match.start()) + 1
+            context_end = quote_start - 1
+            for _ in range(2):
+                context_end = body.find('\n', context_end + 1)
+                if context_end == -1:
+                    context_end = len(body)
                     break
 
-            if quote_start is not None:
-                break
-
-        if quote_start is not None:
-            # Keep content before quotes
-            # Optionally keep first 2-3 lines of quote for context
-            kept_quote_lines = min(2, len(lines) - quote_start)
-            result_lines = lines[:quote_start]
-
-            if kept_quote_lines > 0:
-                result_lines.append("\n[Previous message context:]")
-                result_lines.extend(lines[quote_start:quote_start + kept_quote_lines])
-
-            result = '\n'.join(result_lines).strip()
-            logger.debug(f"Stripped quotes starting at line {quote_start}")
+            result = (
+                f"{body[:quote_start]}\n[Previous message context:]\n"
+                f"{body[quote_start:context_end]}"
+            ).strip()
+            logger.debug(f"Stripped quotes starting at offset {quote_start}")
             return result
 
         return body
@@ -625,11 +752,10 @@ class EmailPreprocessor:
         first_part_len = int(max_chars * 0.8)
         last_part_len = int(max_chars * 0.1)
 
-        first_part = body[:first_part_len]
         last_part = body[-last_part_len:]
 
-        # Try to end on sentence boundary
-        first_part = self._truncate_to_sentence(first_part)
+        # Try to end on sentence boundary (searched in body, sliced once)
+        first_part = self._truncate_to_sentence(body, end=first_part_len)
 
         truncated_body = (
             f"{first_part}\n\n"
@@ -678,12 +804,30 @@ class EmailPreprocessor:
             }
 
         # Remove control characters (except newlines and tabs)
-        sanitized = ''.join(char for char in body
-                          if char.isprintable() or char in '\n\t')
+        is_ascii = body.isascii()
+        if is_ascii:
+            # ASCII fast path: C0 controls and DEL are the only non-printables
+            sanitized = body.translate(_ASCII_CTRL)
+        else:
+            # Clean bodies pass through without allocating a copy
+            sanitized = _CTRL_RE.sub('', body)
+            if not sanitized.replace('\n', '').replace('\t', '').isprintable():
+                # Rare: other non-printable Unicode (NBSP, zero-width, separators)
+                sanitized = ''.join(char for char in sanitized
+                                    if char.isprintable() or char in '\n\t')
 
         # Check for suspicious patterns based on security_level
-        for pattern_dict in self.suspicious_patterns:
-            pattern = pattern_dict["regex"]
+        candidates = self.suspicious_patterns
+        pattern_set, members, others = self._pattern_set
+        if is_ascii and pattern_set is not None:
+            # One linear-time Hyperscan/RE2 pass finds the patterns that can
+            # match; only those (and patterns the set cannot run) are searched with re
+            hits = {members[i] for i in pattern_set(sanitized)}
+            candidates = [candidates[i] for i in sorted(hits.union(others))]
+
+        regex_key = "ascii_regex" if is_ascii else "regex"
+        for pattern_dict in candidates:
+            pattern = pattern_dict[regex_key]
             pattern_name = pattern_dict["name"]
             severity = pattern_dict["severity"]
             description = pattern_dict["description"]
@@ -796,7 +940,7 @@ class EmailPreprocessor:
         subject = metadata.get('subject', '')
         previous_subject = None
         if is_reply:
-            previous_subject = re.sub(r'^(Re:|Fwd:|RE:|FW:)\s*', '', subject, flags=re.IGNORECASE).strip()
+            previous_subject = _REPLY_PREFIX_RE.sub('', subject).strip()
 
         # Estimate thread length from references
         references = metadata.get('references', [])
@@ -817,6 +961,268 @@ class EmailPreprocessor:
 
     # Helper methods
 
+    def _walk_parts(self, msg: Message) -> Tuple[str, str, List[Tuple[str, int]]]:
+        """
+        Collect body text and attachments in a single msg.walk() pass.
+
+        Parts with a Content-Disposition and a filename are attachments; of the
+        remaining parts, the first text/plain and first text/html are the body.
+
+        Args:
+            msg: Parsed email message
+
+        Returns:
+            Tuple of (plain_body, html_body, [(filename, size), ...]); bodies are "" if absent
+        """
+        body = ""
+        html_body = ""
+        attachments = []
+
+        for part in msg.walk():
+            if part.get_content_maintype() == 'multipart':
+                continue
+
+            filename = part.get_filename() if part.get('Content-Disposition') is not None else None
+            if filename:
+                attachments.append((filename, self._attachment_size(part)))
+                continue
+
+            content_type = part.get_content_type()
+            if content_type == 'text/plain' and not body:
+                body = self._decode_payload(part.get_payload(decode=True) or b'', part)
+            elif content_type == 'text/html' and not html_body:
+                html_body = self._decode_payload(part.get_payload(decode=True) or b'', part)
+
+        return body, html_body, attachments
+
+    @staticmethod
+    def _plain_body_suffices(body: Any, html_body: str) -> bool:
+        """Whether a plain-text alternative can stand in for the HTML part."""
+        if not isinstance(body, str):
+            return False
+        return len(body) >= PLAIN_BODY_PREFERRED_CHARS and len(body) * 2 > len(html_body)
+
+    def _html_to_text(self, html_content: str, max_chars: Optional[int] = None) -> str:
+        """
+        Extract text from HTML by streaming lxml parse events.
+
+        Text nodes are emitted in document order as the parser produces them and
+        finished elements are discarded, so memory stays proportional to the
+        text kept rather than the size of the HTML. Images and links become
+        single "[Image: name]" and "text (URL)" parts; skipped elements and 1x1
+        tracking pixels emit nothing but keep their tail text.
+
+        Args:
+            html_content: HTML email content
+            max_chars: Stop once this many characters of text were collected
+                (default: None, extract everything)
+
+        Returns:
+            Text nodes joined by newlines
+        """
+        parts: List[str] = []
+        size = 0
+        # Stack of open <a> elements and the parts collected inside each
+        links: List[Tuple[Any, List[str]]] = []
+        skipping = None
+        # A node's text (or tail) is only complete once the parser has moved
+        # on to the next event, so emission lags one event behind
+        pending = None
+        pending_is_tail = False
+
+        events = etree.iterparse(
+            BytesIO(html_content.encode('utf-8', errors='ignore')),
+            events=('start', 'end', 'comment', 'pi'),
+            html=True,
+            encoding='utf-8',
+            recover=True,
+        )
+
+        try:
+            for event, el in events:
+                if skipping is not None:
+                    if event == 'end' and el is skipping:
+                        skipping = None
+                        pending, pending_is_tail = el, True
+                    continue
+
+                # Emit the previous node's now-complete text or tail
+                if pending is not None:
+                    text = pending.tail if pending_is_tail else pending.text
+                    if text:
+                        if links:
+                            links[-1][1].append(text)
+                        else:
+                            parts.append(text)
+                            size += len(text)
+                    if pending_is_tail:
+                        self._discard_html_node(pending)
+                    pending = None
+                    if max_chars is not None and size >= max_chars:
+                        break
+
+                if event != 'start' and event != 'end':
+                    # Comments and processing instructions: tail only
+                    pending, pending_is_tail = el, True
+                    continue
+
+                tag = el.tag
+                if event == 'start':
+                    if tag in _SKIPPED_HTML_TAGS:
+                        skipping = el
+                    else:
+                        if tag == 'a':
+                            links.append((el, []))
+                        pending, pending_is_tail = el, False
+                    continue
+
+                if tag == 'img':
+                    if el.get('width', '') != '1' and el.get('height', '') != '1':
+                        src = el.get('src', '')
+                        filename = src.rpartition('/')[2] if src else 'unknown'
+                        target = links[-1][1] if links else parts
+                        target.append(f"[Image: {filename}]")
+                        if not links:
+                            size += len(target[-1])
+                elif tag == 'a' and links and links[-1][0] is el:
+                    _, inner = links.pop()
+                    link_text = ''.join(inner).strip()
+                    link_url = el.get('href', '')
+                    if link_url and link_url != link_text:
+                        inner = [f"{link_text} ({link_url})"]
+                    elif link_text:
+                        inner = [link_text]
+                    target = links[-1][1] if links else parts
+                    target.extend(inner)
+                    if not links:
+                        size += sum(len(part) for part in inner)
+
+                pending, pending_is_tail = el, True
+        except etree.XMLSyntaxError:
+            # Empty document
+            return ""
+
+        return '\n'.join(parts)
+
+    def _fast_html_to_text(self, html_content: str) -> str:
+        """
+        Extract text from HTML with regex substitutions instead of a parser.
+
+        Skipped elements and comments are dropped, links and images become
+        "text (URL)" and "[Image: name]" parts, and every other tag becomes a
+        line break. Entities are decoded once at the end.
+
+        Args:
+            html_content: HTML email content
+
+        Returns:
+            Text parts separated by newlines
+        """
+        text = _FAST_SKIP_RE.sub('\n', html_content)
+        text = _FAST_LINK_RE.sub(self._fast_link, text)
+        text = _FAST_IMG_RE.sub(self._fast_image, text)
+        text = _FAST_TAG_RE.sub('\n', text)
+        return unescape(text) if '&' in text else text
+
+    @staticmethod
+    def _fast_image(match: re.Match, separator: str = '\n') -> str:
+        """Replace an <img> tag with its placeholder, or nothing for tracking pixels."""
+        attrs = EmailPreprocessor._html_attrs(match.group(1))
+        if attrs.get('width', '') == '1' or attrs.get('height', '') == '1':
+            return separator
+        src = attrs.get('src', '')
+        filename = src.rpartition('/')[2] if src else 'unknown'
+        return f"{separator}[Image: {filename}]{separator}"
+
+    @staticmethod
+    def _fast_link(match: re.Match) -> str:
+        """Replace an <a> element with "text (URL)", or just its text."""
+        inner = _FAST_IMG_RE.sub(lambda m: EmailPreprocessor._fast_image(m, ''), match.group(2))
+        link_text = _FAST_TAG_RE.sub('', inner).strip()
+        link_url = EmailPreprocessor._html_attrs(match.group(1)).get('href', '')
+        if link_url and link_url != link_text:
+            return f"\n{link_text} ({link_url})\n"
+        return f"\n{link_text}\n"
+
+    @staticmethod
+    def _html_attrs(attr_text: str) -> Dict[str, str]:
+        """Parse a start tag's attribute text into a lowercase-keyed dict."""
+        attrs = {}
+        for name, double, single, bare in _HTML_ATTR_RE.findall(attr_text):
+            attrs.setdefault(name.lower(), double or single or bare)
+        return attrs
+
+    @staticmethod
+    def _discard_html_node(node: Any) -> None:
+        """Free a fully emitted node and any earlier siblings."""
+        parent = node.getparent()
+        if parent is None or not isinstance(node.tag, str):
+            return
+        node.clear()
+        while node.getprevious() is not None:
+            del parent[0]
+
+    def _lexbor_to_text(self, html_content: str) -> str:
+        """Extract text from HTML with selectolax's lexbor parser (used when lxml is missing)."""
+        tree = LexborHTMLParser(html_content)
+
+        # Remove head, scripts, styles, and tracking pixels
+        for node in tree.css(','.join(_SKIPPED_HTML_TAGS)):
+            node.decompose()
+
+        for img in tree.css('img'):
+            attrs = img.attributes
+            if attrs.get('width') == '1' or attrs.get('height') == '1':
+                img.decompose()
+            else:
+                # Replace image with placeholder
+                src = attrs.get('src') or ''
+                filename = src.rpartition('/')[2] if src else 'unknown'
+                img.replace_with(f"[Image: {filename}]")
+
+        # Convert links to readable format
+        for link in tree.css('a'):
+            link_text = link.text().strip()
+            link_url = link.attributes.get('href') or ''
+            if link_url and link_url != link_text:
+                link.replace_with(f"{link_text} ({link_url})")
+            elif link_text:
+                link.replace_with(link_text)
+
+        root = tree.root
+        return root.text(separator='\n') if root is not None else ''
+
+    def _soup_to_text(self, html_content: str) -> str:
+        """Extract text from HTML with BeautifulSoup (used when lxml is missing)."""
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        # Remove head, scripts, styles, and tracking pixels
+        for tag in soup(list(_SKIPPED_HTML_TAGS)):
+            tag.decompose()
+
+        # Remove 1x1 tracking images
+        for img in soup.find_all('img'):
+            width = img.get('width', '')
+            height = img.get('height', '')
+            if width == '1' or height == '1':
+                img.decompose()
+            else:
+                # Replace image with placeholder
+                src = img.get('src', '')
+                filename = src.rpartition('/')[2] if src else 'unknown'
+                img.replace_with(f"[Image: {filename}]")
+
+        # Convert links to readable format
+        for link in soup.find_all('a'):
+            link_text = link.get_text().strip()
+            link_url = link.get('href', '')
+            if link_url and link_url != link_text:
+                link.replace_with(f"{link_text} ({link_url})")
+            elif link_text:
+                link.replace_with(link_text)
+
+        return soup.get_text(separator='\n')
+
     def _dict_to_message(self, email_dict: Dict[str, Any]) -> Message:
         """Convert dictionary to email.message.Message object."""
         msg = Message()
@@ -842,49 +1248,182 @@ class EmailPreprocessor:
 
         return msg
 
+    @staticmethod
+    def _earliest_match(patterns: List[re.Pattern], body: str) -> Optional[re.Match]:
+        """
+        Find the leftmost match of any pattern in body.
+
+        Each pattern is searched on its own so the regex engine keeps its
+        literal-prefix fast paths, which a fused alternation loses. Once a
+        match is found, later patterns only search up to the end of that
+        line; ties go to the earlier pattern.
+
+        Args:
+            patterns: Compiled patterns, in priority order
+            body: Text to search
+
+        Returns:
+            The leftmost match, or None if no pattern matches
+        """
+        best = None
+        end = len(body)
+
+        for pattern in patterns:
+            match = pattern.search(body, 0, end)
+            if match and (best is None or match.start() < best.start()):
+                best = match
+                # Cutting at the line's newline keeps '$' anchors truthful
+                line_end = body.find('\n', match.start())
+                end = len(body) if line_end == -1 else line_end
+
+        return best
+
     def _parse_date(self, date_str: str) -> str:
         """Parse date string to ISO 8601 format."""
-        if not date_str:
-            return datetime.now().isoformat() + 'Z'
+        if date_str:
+            parsed = self._parse_date_cached(str(date_str))
+            if parsed is not None:
+                return parsed
 
-        try:
-            if DATEUTIL_AVAILABLE:
-                dt = date_parser.parse(date_str)
-            else:
-                # Fallback: try basic parsing
-                dt = datetime.strptime(date_str, '%a, %d %b %Y %H:%M:%S %z')
+        return datetime.now().isoformat() + 'Z'
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date_cached(date_str: str) -> Optional[str]:
+        """
+        Parse a non-empty date string to ISO 8601, memoized by the raw string.
+
+        Returns None on failure rather than a timestamp so the "now" fallback
+        is never cached.
+
+        ISO 8601 strings and the common RFC 2822 layouts are parsed directly;
+        only other formats go through dateutil's format detection.
+        """
+        if date_str[:1].isdigit():
+            try:
+                return datetime.fromisoformat(date_str).isoformat()
+            except ValueError:
+                pass
+
+        for date_format in _FAST_DATE_FORMATS:
+            try:
+                return datetime.strptime(date_str, date_format).isoformat()
+            except ValueError:
+                continue
+
+        if not DATEUTIL_AVAILABLE:
+            logger.debug(f"Date parsing failed for '{date_str}': unrecognized format")
+            return None
 
-            return dt.isoformat()
+        try:
+            return date_parser.parse(date_str).isoformat()
         except Exception as e:
             logger.debug(f"Date parsing failed for '{date_str}': {e}")
-            return datetime.now().isoformat() + 'Z'
+            return None
 
-    def _format_attachment(self, filename: str, size: int) -> str:
-        """Format attachment as 'filename.ext (size)'."""
-        if size < 1024:
-            size_str = f"{size}B"
-        elif size < 1024 * 1024:
-            size_str = f"{size/1024:.1f}KB"
-        else:
-            size_str = f"{size/(1024*1024):.1f}MB"
+    def _check_attachment_name(self, filename: str, attachment: str) -> None:
+        """Warn if the attachment's filename has an executable/script extension."""
+        if filename.lower().endswith(DANGEROUS_EXTENSIONS):
+            self.warnings.append(f"Potentially dangerous attachment detected: {attachment}")
+
+    @staticmethod
+    def _decode_header_value(value: Any) -> str:
+        """
+        Decode RFC 2047 encoded words ("=?utf-8?b?...?=") in a header value.
+
+        Messages are parsed with the compat32 policy, which leaves encoded
+        words as-is; decoding just the headers we use is several times cheaper
+        than parsing every header with policy.default.
+
+        Args:
+            value: Raw header value
+
+        Returns:
+            Decoded header text, or the raw value if it cannot be decoded
+        """
+        value = str(value)
+        if '=?' not in value:
+            return value
+        try:
+            return str(make_header(decode_header(value)))
+        except (HeaderParseError, LookupError, UnicodeDecodeError):
+            return value
+
+    @staticmethod
+    def _decode_payload(payload: bytes, part: Message) -> str:
+        """
+        Decode a text part's payload with its declared charset.
+
+        Parts without a charset, or with one Python does not know, are read as
+        UTF-8; undecodable bytes are dropped either way.
+
+        Args:
+            payload: Transfer-decoded payload (get_payload(decode=True))
+            part: MIME part the payload came from
 
-        return f"{filename} ({size_str})"
+        Returns:
+            Payload text
+        """
+        charset = part.get_content_charset() or 'utf-8'
+        try:
+            return payload.decode(charset, errors='ignore')
+        except LookupError:
+            return payload.decode('utf-8', errors='ignore')
 
-    def _truncate_to_sentence(self, text: str) -> str:
-        """Truncate text to last complete sentence."""
-        # Find last sentence ending
-        sentence_endings = ['.', '!', '?']
-        last_ending = -1
+    @staticmethod
+    def _attachment_size(part: Message) -> int:
+        """
+        Get an attachment's decoded size in bytes.
+
+        Base64 payloads are measured from the encoded text (4 characters per
+        3 bytes, less padding) instead of being decoded, which is exact for
+        encoder output with one line break per line; other encodings are
+        decoded as before.
 
-        for ending in sentence_endings:
-            pos = text.rfind(ending)
-            if pos > last_ending:
-                last_ending = pos
+        Args:
+            part: Attachment MIME part
 
-        if last_ending > len(text) * 0.8:  # Only truncate if we're keeping at least 80%
+        Returns:
+            Decoded payload size, or 0 if there is no payload
+        """
+        raw = part.get_payload()
+        if isinstance(raw, str) and part.get('Content-Transfer-Encoding', '').strip().lower() == 'base64':
+            # Line breaks are not data (CRLF if the first line ends in one);
+            # '=' padding only appears at the end
+            newlines = raw.count('\n')
+            if raw.find('\r\n', 0, 1024) != -1:
+                newlines *= 2
+            chars = len(raw) - newlines
+            padding = raw[-8:].count('=')
+            return max(chars * 3 // 4 - padding, 0)
+
+        payload = part.get_payload(decode=True)
+        return len(payload) if payload else 0
+
+    def _format_attachment(self, filename: str, size: int) -> str:
+        """Format attachment as 'filename.ext (size)'."""
+        # Size class from the bit length: <=10 bits is <1KB, <=20 bits is <1MB
+        bits = int(size).bit_length() if size > 0 else 0
+        if bits <= 10:
+            return f"{filename} ({size}B)"
+        if bits <= 20:
+            return f"{filename} ({size/1024:.1f}KB)"
+        return f"{filename} ({size/(1024*1024):.1f}MB)"
+
+    def _truncate_to_sentence(self, text: str, end: Optional[int] = None) -> str:
+        """Truncate text (or its first end characters) to last complete sentence."""
+        if end is None or end > len(text):
+            end = len(text)
+
+        # Only truncate if we're keeping at least 80%, so only the tail is searched
+        start = int(end * 0.8) + 1
+        last_ending = max(text.rfind('.', start, end), text.rfind('!', start, end),
+                          text.rfind('?', start, end))
+
+        if last_ending != -1:
             return text[:last_ending + 1]
 
-        return text
+        return text[:end]
 
     def _get_default_metadata(self) -> Dict[str, Any]:
         """Return default metadata when extraction fails."""
@@ -907,11 +1446,12 @@ class EmailPreprocessor:
         Tries to load patterns from security_patterns.yaml. If file doesn't exist
         or YAML parsing fails, falls back to hardcoded default patterns.
 
+        Compiled patterns are shared between instances; the file's modification
+        time is part of the cache key so edits are picked up by new instances.
+
         Returns:
             List of pattern dictionaries with compiled regex and metadata
         """
-        compiled_patterns = []
-
         # Try to load from YAML file first
         if YAML_AVAILABLE and self.security_patterns_path is None:
             # Auto-discover security_patterns.yaml
@@ -922,21 +1462,44 @@ class EmailPreprocessor:
             if os.path.exists(yaml_path):
                 self.security_patterns_path = yaml_path
 
+        path = self.security_patterns_path
+        if path and os.path.exists(path):
+            return list(self._compile_security_patterns(path, os.path.getmtime(path)))
+        return list(self._compile_security_patterns(None, None))
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _compile_security_patterns(path: Optional[str],
+                                   mtime: Optional[float]) -> Tuple[Dict[str, Any], ...]:
+        """
+        Compile security patterns from a YAML file, or the defaults.
+
+        Args:
+            path: Existing security_patterns.yaml path, or None for defaults
+            mtime: Modification time of path (cache key only)
+
+        Returns:
+            Tuple of pattern dictionaries with compiled regex and metadata
+        """
+        compiled_patterns = []
+
         # Load from YAML if available
-        if self.security_patterns_path and os.path.exists(self.security_patterns_path):
+        if path:
             try:
-                with open(self.security_patterns_path, 'r', encoding='utf-8') as f:
+                with open(path, 'r', encoding='utf-8') as f:
                     data = yaml.safe_load(f)
 
                 if data and 'patterns' in data:
                     version = data.get('version', 'unknown')
-                    logger.info(f"Loading security patterns from {self.security_patterns_path} (version: {version})")
+                    logger.info(f"Loading security patterns from {path} (version: {version})")
 
                     for pattern_def in data['patterns']:
                         try:
+                            regex = re.compile(pattern_def["regex"], re.IGNORECASE)
                             compiled_patterns.append({
                                 "name": pattern_def["name"],
-                                "regex": re.compile(pattern_def["regex"], re.IGNORECASE),
+                                "regex": regex,
+                                "ascii_regex": EmailPreprocessor._ascii_variant(regex),
                                 "severity": pattern_def.get("severity", "medium"),
                                 "description": pattern_def.get("description", ""),
                                 "category": pattern_def.get("category", "unknown")
@@ -946,7 +1509,7 @@ class EmailPreprocessor:
                             continue
 
                     logger.info(f"Loaded {len(compiled_patterns)} security patterns from YAML (version: {version})")
-                    return compiled_patterns
+                    return tuple(compiled_patterns)
             except Exception as e:
                 logger.warning(f"Failed to load security_patterns.yaml: {e}. Falling back to defaults.")
 
@@ -1021,29 +1584,171 @@ class EmailPreprocessor:
 
         # Compile default patterns
         for pdef in default_patterns:
+            regex = re.compile(pdef["pattern"], re.IGNORECASE)
             compiled_patterns.append({
                 "name": pdef["name"],
-                "regex": re.compile(pdef["pattern"], re.IGNORECASE),
+                "regex": regex,
+                "ascii_regex": EmailPreprocessor._ascii_variant(regex),
                 "severity": pdef["severity"],
                 "description": pdef["description"],
                 "category": pdef["category"]
             })
 
         logger.info(f"Loaded {len(compiled_patterns)} default security patterns")
-        return compiled_patterns
+        return tuple(compiled_patterns)
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _compile_pattern_set(patterns: Tuple[str, ...]) -> Tuple[Any, Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Compile security patterns into one multi-pattern set for scanning ASCII bodies.
+
+        Hyperscan is used when installed, else RE2. Both match every pattern in
+        a single linear-time pass, so crafted bodies cannot make the scan
+        backtrack. Only pure-ASCII patterns without '$' are added: on ASCII
+        text those match exactly as with re. Patterns the engine rejects
+        (lookaround, backreferences, Python-only escapes) stay with re.
+
+        Args:
+            patterns: Security regex sources, in check order
+
+        Returns:
+            Tuple of (scan function or None, pattern index of each set entry,
+            indexes of patterns that must still be searched with re). The scan
+            function takes a body and returns the set entries that matched.
+        """
+        if HYPERSCAN_AVAILABLE:
+            return EmailPreprocessor._compile_hyperscan_set(patterns)
+        if not RE2_AVAILABLE:
+            return None, (), tuple(range(len(patterns)))
+
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        pattern_set = re2.Set.SearchSet(options)
+        members: List[int] = []
+        others: List[int] = []
+
+        for index, pattern in enumerate(patterns):
+            if pattern.isascii() and '$' not in pattern:
+                try:
+                    pattern_set.Add(pattern)
+                    members.append(index)
+                    continue
+                except re2.error:
+                    pass
+            others.append(index)
+
+        if not members:
+            return None, (), tuple(others)
+
+        pattern_set.Compile()
+        logger.debug(f"RE2 set compiled with {len(members)} of {len(patterns)} security patterns")
+        return lambda text: pattern_set.Match(text) or (), tuple(members), tuple(others)
+
+    @staticmethod
+    def _compile_hyperscan_set(patterns: Tuple[str, ...]) -> Tuple[Any, Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Compile security patterns into one Hyperscan block-mode database.
+
+        Each pattern is test-compiled on its own first, so one unsupported
+        pattern only sends that pattern back to re. Every entry reports at
+        most one match (HS_FLAG_SINGLEMATCH). A database can only be scanned
+        by one thread at a time with the same scratch space, so each thread
+        gets its own.
+
+        Args:
+            patterns: Security regex sources, in check order
+
+        Returns:
+            Same as _compile_pattern_set
+        """
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        expressions: List[bytes] = []
+        members: List[int] = []
+        others: List[int] = []
+
+        for index, pattern in enumerate(patterns):
+            if pattern.isascii() and '$' not in pattern:
+                try:
+                    hyperscan.Database().compile(expressions=[pattern.encode()], flags=flags)
+                    expressions.append(pattern.encode())
+                    members.append(index)
+                    continue
+                except hyperscan.error:
+                    pass
+            others.append(index)
+
+        if not members:
+            return None, (), tuple(others)
+
+        database = hyperscan.Database()
+        database.compile(expressions=expressions, ids=list(range(len(expressions))), flags=flags)
+        scratches = threading.local()
+
+        def scan(text: str) -> List[int]:
+            scratch = getattr(scratches, 'scratch', None)
+            if scratch is None:
+                scratch = scratches.scratch = hyperscan.Scratch(database)
+            hits: List[int] = []
+            database.scan(text.encode('ascii'), match_event_handler=lambda i, *_: hits.append(i),
+                          scratch=scratch)
+            return hits
+
+        logger.debug(f"Hyperscan database compiled with {len(members)} of {len(patterns)} security patterns")
+        return scan, tuple(members), tuple(others)
+
+    @staticmethod
+    def _ascii_variant(regex: re.Pattern) -> re.Pattern:
+        """
+        Recompile a security pattern with re.ASCII for pure-ASCII bodies.
+
+        On ASCII text (with control characters already removed) ASCII and
+        Unicode matching agree, but ASCII case folding keeps the regex engine's
+        fast literal search, which IGNORECASE otherwise disables.
+
+        Args:
+            regex: Pattern compiled with Unicode semantics
+
+        Returns:
+            The ASCII-mode pattern, or regex itself if it cannot be recompiled
+        """
+        try:
+            return re.compile(regex.pattern, (regex.flags & ~re.UNICODE) | re.ASCII)
+        except (re.error, ValueError):
+            return regex
+
+
+def _preprocess_worker(raw_email: Any,
+                       settings: Tuple[str, Optional[str], int, bool]) -> Dict[str, Any]:
+    """Preprocess one email in a preprocess_batch() worker process."""
+    security_level, security_patterns_path, max_chars, fast_html = settings
+    key = (security_level, security_patterns_path)
+    preprocessor = _worker_preprocessors.get(key)
+    if preprocessor is None:
+        preprocessor = _worker_preprocessors[key] = EmailPreprocessor(
+            security_level=security_level, security_patterns_path=security_patterns_path)
+    return preprocessor.preprocess_email(raw_email, max_chars=max_chars, fast_html=fast_html)
 
 
 # Convenience function for quick preprocessing
-def preprocess_email(raw_email: Any, max_chars: int = 10000) -> Dict[str, Any]:
+def preprocess_email(raw_email: Any, max_chars: int = 10000,
+                     fast_html: bool = False) -> Dict[str, Any]:
     """
     Convenience function to preprocess an email.
 
+    Uses a default-configured EmailPreprocessor cached per thread.
+
     Args:
         raw_email: Raw email in supported format
         max_chars: Maximum characters before truncation
+        fast_html: Convert HTML with the single-pass tag scanner
 
     Returns:
         Preprocessed email dictionary
     """
-    preprocessor = EmailPreprocessor()
-    return preprocessor.preprocess_email(raw_email, max_chars=max_chars)
+    # Reuse one instance per thread so patterns are compiled once, not per email
+    preprocessor = getattr(_local, 'preprocessor', None)
+    if preprocessor is None:
+        preprocessor = _local.preprocessor = EmailPreprocessor()
+    return preprocessor.preprocess_email(raw_email, max_chars=max_chars, fast_html=fast_html)
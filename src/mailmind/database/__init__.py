@@ -10,6 +10,7 @@ Main Components:
 - schema: SQL schema definitions for all tables
 - migrations: Database migration framework
 - backup_manager: Backup and restore functionality
+- storage_worker: Background batched writer for hot-path inserts
 - encryption: Optional SQLCipher encryption support
 
 Integration:
@@ -41,6 +42,7 @@ from .database_manager import (
     QueryError,
     DataNotFoundError,
 )
+from .storage_worker import StorageWorker
 from .schema import (
     get_schema_statements,
     get_initial_data_statements,
@@ -53,6 +55,7 @@ __all__ = [
     "ConnectionError",
     "QueryError",
     "DataNotFoundError",
+    "StorageWorker",
     "get_schema_statements",
     "get_initial_data_statements",
     "get_current_schema_version",
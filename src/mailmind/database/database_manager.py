@@ -232,7 +232,8 @@ class DatabaseManager:
                 self._thread_local.conn = sqlite3.connect(
                     self.db_path,
                     timeout=10.0,  # 10 second timeout
-                    check_same_thread=False  # Allow connection sharing (safe with thread-local)
+                    check_same_thread=False,  # Allow connection sharing (safe with thread-local)
+                    cached_statements=256  # Keep the fixed INSERT/SELECT statements prepared
                 )
 
                 # Story 3.1 AC1: Execute PRAGMA key command immediately after connection
@@ -259,6 +260,10 @@ class DatabaseManager:
 
                 # Configure connection
                 self._thread_local.conn.row_factory = sqlite3.Row  # Access columns by name
+                # WAL is persisted by the schema; synchronous is per-connection and
+                # NORMAL is durable under WAL while avoiding an fsync per commit
+                self._thread_local.conn.execute("PRAGMA synchronous=NORMAL")
+                self._thread_local.conn.execute("PRAGMA temp_store=MEMORY")
                 logger.debug(f"Created new database connection for thread {threading.current_thread().name}")
 
             except sqlite3.Error as e:
@@ -379,6 +384,41 @@ class DatabaseManager:
             conn.rollback()
             raise QueryError(f"Query execution failed: {e}")
 
+    def _execute_many(self, query: str, params_seq: List[tuple]) -> int:
+        """
+        Execute a SQL statement for every parameter tuple in one transaction.
+
+        Used by batch writers (e.g. StorageWorker) so N rows cost a single
+        commit instead of N.
+
+        Args:
+            query: SQL statement with ? placeholders
+            params_seq: List of parameter tuples
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            QueryError: If execution fails (the whole batch is rolled back)
+        """
+        start_time = time.time() if self.debug else None
+        conn = self._get_connection()
+
+        try:
+            conn.executemany(query, params_seq)
+            conn.commit()
+
+            if self.debug:
+                elapsed_ms = (time.time() - start_time) * 1000
+                logger.debug(f"Batch of {len(params_seq)} executed in {elapsed_ms:.2f}ms: {query[:100]}...")
+
+            return len(params_seq)
+
+        except sqlite3.Error as e:
+            logger.error(f"Batch query failed: {query[:200]}... Error: {e}")
+            conn.rollback()
+            raise QueryError(f"Batch execution failed: {e}")
+
     # ========== Connection Management ==========
 
     def connect(self) -> bool:
@@ -534,6 +574,14 @@ class DatabaseManager:
 
     # ========== Email Analysis CRUD (Story 1.3 integration) ==========
 
+    _INSERT_EMAIL_ANALYSIS_SQL = """
+        INSERT OR REPLACE INTO email_analysis (
+            message_id, subject, sender, received_date, analysis_json,
+            priority, suggested_folder, confidence_score, sentiment,
+            processing_time_ms, model_version, hardware_profile
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
     def insert_email_analysis(self, message_id: str, analysis: Dict, metadata: Dict) -> int:
         """
         Insert email analysis record.
@@ -549,20 +597,36 @@ class DatabaseManager:
         Raises:
             QueryError: If insert fails
         """
-        query = """
-        INSERT OR REPLACE INTO email_analysis (
-            message_id, subject, sender, received_date, analysis_json,
-            priority, suggested_folder, confidence_score, sentiment,
-            processing_time_ms, model_version, hardware_profile
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        params = self._email_analysis_params(message_id, analysis, metadata)
+        return self._execute_query(self._INSERT_EMAIL_ANALYSIS_SQL, params)
+
+    def insert_email_analysis_batch(self, records: List[Tuple[str, Dict, Dict]]) -> int:
         """
+        Insert several email analysis records in one transaction.
 
-        params = (
+        Args:
+            records: List of (message_id, analysis, metadata) tuples. analysis
+                     may be a dict or an already-serialized JSON string, which
+                     is stored as-is
+
+        Returns:
+            int: Number of records written
+
+        Raises:
+            QueryError: If insert fails
+        """
+        params_seq = [self._email_analysis_params(*record) for record in records]
+        return self._execute_many(self._INSERT_EMAIL_ANALYSIS_SQL, params_seq)
+
+    @staticmethod
+    def _email_analysis_params(message_id: str, analysis: Dict, metadata: Dict) -> tuple:
+        """Build the email_analysis INSERT parameter tuple."""
+        return (
             message_id,
             metadata.get("subject"),
             metadata.get("sender"),
             metadata.get("received_date"),
-            json.dumps(analysis),
+            analysis if isinstance(analysis, str) else json.dumps(analysis),
             metadata.get("priority"),
             metadata.get("suggested_folder"),
             metadata.get("confidence_score"),
@@ -572,8 +636,6 @@ class DatabaseManager:
             metadata.get("hardware_profile"),
         )
 
-        return self._execute_query(query, params)
-
     def get_email_analysis(self, message_id: str) -> Optional[Dict]:
         """
         Get email analysis by message ID.
@@ -727,8 +789,72 @@ class DatabaseManager:
         logger.warning("All email analyses deleted")
         return True
 
+    def get_stats_summary(self, days: int = 365, operation: str = "email_analysis") -> Dict:
+        """
+        Aggregate email analysis statistics in SQL.
+
+        One grouped pass over email_analysis for per-priority counts and
+        processing time, plus one aggregate over recent performance_metrics for
+        tokens/sec, instead of loading rows into Python.
+
+        Args:
+            days: Performance metric window in days (default: 365)
+            operation: Performance metric operation to average (default: 'email_analysis')
+
+        Returns:
+            dict: {
+                'priority_counts': {'High': n, 'Medium': n, 'Low': n},
+                'total_analyses': n,
+                'avg_processing_time_ms': float,
+                'avg_tokens_per_second': float
+            }
+        """
+        rows = self._execute_query(
+            """
+            SELECT priority, COUNT(*) AS count,
+                   SUM(processing_time_ms) AS total_ms, COUNT(processing_time_ms) AS timed
+            FROM email_analysis
+            GROUP BY priority
+            """,
+            fetch_all=True,
+        )
+
+        priority_counts = {"High": 0, "Medium": 0, "Low": 0}
+        total = total_ms = timed = 0
+        for row in rows:
+            if row["priority"] in priority_counts:
+                priority_counts[row["priority"]] = row["count"]
+            total += row["count"]
+            total_ms += row["total_ms"] or 0
+            timed += row["timed"]
+
+        cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+        tps_row = self._execute_query(
+            """
+            SELECT AVG(tokens_per_second) AS avg_tps
+            FROM performance_metrics
+            WHERE timestamp >= ? AND operation = ? AND tokens_per_second > 0
+            """,
+            (cutoff_date, operation),
+            fetch_one=True,
+        )
+
+        return {
+            "priority_counts": priority_counts,
+            "total_analyses": total,
+            "avg_processing_time_ms": total_ms / timed if timed else 0.0,
+            "avg_tokens_per_second": (tps_row["avg_tps"] or 0.0) if tps_row else 0.0,
+        }
+
     # ========== Performance Metrics (Story 1.6 integration) ==========
 
+    _INSERT_PERFORMANCE_METRIC_SQL = """
+        INSERT INTO performance_metrics (
+            operation, hardware_config, model_version, tokens_per_second,
+            memory_usage_mb, processing_time_ms, database_size_mb, batch_size
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
     def insert_performance_metric(self, operation: str, metrics: Dict) -> int:
         """
         Insert performance metric record.
@@ -740,14 +866,26 @@ class DatabaseManager:
         Returns:
             int: ID of inserted record
         """
-        query = """
-        INSERT INTO performance_metrics (
-            operation, hardware_config, model_version, tokens_per_second,
-            memory_usage_mb, processing_time_ms, database_size_mb, batch_size
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        params = self._performance_metric_params(operation, metrics)
+        return self._execute_query(self._INSERT_PERFORMANCE_METRIC_SQL, params)
+
+    def insert_performance_metric_batch(self, records: List[Tuple[str, Dict]]) -> int:
         """
+        Insert several performance metric records in one transaction.
 
-        params = (
+        Args:
+            records: List of (operation, metrics) tuples
+
+        Returns:
+            int: Number of records written
+        """
+        params_seq = [self._performance_metric_params(*record) for record in records]
+        return self._execute_many(self._INSERT_PERFORMANCE_METRIC_SQL, params_seq)
+
+    @staticmethod
+    def _performance_metric_params(operation: str, metrics: Dict) -> tuple:
+        """Build the performance_metrics INSERT parameter tuple."""
+        return (
             operation,
             metrics.get("hardware_config"),
             metrics.get("model_version"),
@@ -758,8 +896,6 @@ class DatabaseManager:
             metrics.get("batch_size", 1),  # Default to 1 if not specified
         )
 
-        return self._execute_query(query, params)
-
     def get_performance_metrics(self, days: int = 7, operation: str = None) -> List[Dict]:
         """
         Get performance metrics for the last N days, optionally filtered by operation.
@@ -0,0 +1,159 @@
+"""
+Background Storage Worker for MailMind
+
+Moves SQLite writes off the analysis hot path. Callers enqueue rows and return
+immediately; a single daemon thread drains the queue and hands each batch to a
+DatabaseManager batch-insert method, so N rows cost one transaction instead of N.
+
+Usage:
+    worker = StorageWorker({
+        'email_analysis': db.insert_email_analysis_batch,
+        'performance_metrics': db.insert_performance_metric_batch,
+    })
+    worker.put('email_analysis', (message_id, analysis, metadata))
+    worker.flush()  # Block until everything queued so far is written
+    worker.stop()
+
+Integration:
+- Story 1.3 (EmailAnalysisEngine): analysis cache and performance metric writes
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Control messages placed on the queue alongside (kind, row) items
+_FLUSH = object()
+_STOP = object()
+
+
+class StorageWorker:
+    """
+    Single-threaded batched writer for DatabaseManager.
+
+    The worker only calls the writer callables it is given, all from its one
+    thread. Rows are grouped by kind and written with the matching batch
+    writer, one call per kind per batch. Write failures are logged and the
+    batch is dropped, matching the best-effort semantics of the synchronous
+    cache writes it replaces.
+    """
+
+    def __init__(
+        self,
+        writers: Dict[str, Callable[[List[Any]], Any]],
+        batch_size: int = 64,
+        flush_interval: float = 0.05
+    ):
+        """
+        Initialize and start the storage worker.
+
+        Args:
+            writers: Mapping of kind -> callable(rows) that writes a batch
+            batch_size: Maximum rows per batch (default: 64)
+            flush_interval: Seconds to wait for more rows before writing (default: 0.05)
+        """
+        self._writers = writers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run,
+            daemon=True,
+            name="StorageWorker"
+        )
+        self._thread.start()
+
+        logger.debug(f"StorageWorker started (batch_size={batch_size}, flush_interval={flush_interval}s)")
+
+    def put(self, kind: str, row: Any) -> None:
+        """
+        Queue a row for writing.
+
+        Args:
+            kind: Writer key passed to the constructor
+            row: Row object understood by that writer
+        """
+        if kind not in self._writers:
+            raise ValueError(f"Unknown storage kind: {kind}")
+        self._queue.put((kind, row))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every row queued before this call has been written.
+
+        Args:
+            timeout: Optional maximum seconds to wait
+
+        Returns:
+            bool: True if the flush completed, False on timeout or if stopped
+        """
+        if not self.is_running():
+            return False
+
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Write pending rows and stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to exit
+        """
+        if not self.is_running():
+            return
+
+        self._queue.put((_STOP, None))
+        self._thread.join(timeout)
+        logger.debug("StorageWorker stopped")
+
+    def is_running(self) -> bool:
+        """Check if the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        """Worker loop: collect up to batch_size rows, then write them."""
+        while True:
+            pending: Dict[str, List[Any]] = {}
+            waiters: List[threading.Event] = []
+            stopping = False
+
+            # Block for the first item, then gather more until batch is full or idle
+            kind, row = self._queue.get()
+            count = 0
+            while True:
+                if kind is _FLUSH:
+                    waiters.append(row)
+                elif kind is _STOP:
+                    stopping = True
+                else:
+                    pending.setdefault(kind, []).append(row)
+                    count += 1
+
+                if stopping or waiters or count >= self.batch_size:
+                    break
+                try:
+                    kind, row = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+
+            self._write(pending)
+
+            for done in waiters:
+                done.set()
+            if stopping:
+                return
+
+    def _write(self, pending: Dict[str, List[Any]]) -> None:
+        """Write grouped rows with their batch writers."""
+        for kind, rows in pending.items():
+            try:
+                self._writers[kind](rows)
+                logger.debug(f"StorageWorker wrote {len(rows)} {kind} rows")
+            except Exception as e:
+                logger.error(f"StorageWorker failed to write {len(rows)} {kind} rows: {e}")
@@ -61,7 +61,9 @@ def temp_db():
 @pytest.fixture
 def analysis_engine(ollama_manager, temp_db):
     """Create EmailAnalysisEngine with real Ollama."""
-    return EmailAnalysisEngine(ollama_manager, db_path=temp_db)
+    engine = EmailAnalysisEngine(ollama_manager, db_path=temp_db)
+    yield engine
+    engine.close()
 
 
 # ============================================================================
@@ -354,6 +356,7 @@ class TestCachingIntegration:
         # First analysis with current model
         analysis1 = analysis_engine.analyze_email(email)
         assert analysis1['cache_hit'] is False
+        analysis_engine.flush()
 
         # Manually change model version in cache
         conn = sqlite3.connect(temp_db)
@@ -365,6 +368,7 @@ class TestCachingIntegration:
         ''', (email['message_id'],))
         conn.commit()
         conn.close()
+        analysis_engine.clear_memory_cache()
 
         # Next analysis should be cache miss (model version mismatch)
         analysis2 = analysis_engine.analyze_email(email)
@@ -10,16 +10,35 @@ Tests cover:
 - Performance metrics calculation
 """
 
+import asyncio
 import pytest
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, MagicMock, patch
-from concurrent.futures import TimeoutError as FutureTimeoutError
-from mailmind.core.email_batch_processor import EmailBatchProcessor, BatchResult
+from mailmind.core.email_batch_processor import EmailBatchProcessor, BatchResult, EmailResult
+from mailmind.core.ollama_manager import OllamaConnectionPool
+
+
+def ok(**payload):
+    """Successful EmailResult carrying payload."""
+    return EmailResult(email_id=payload.get('id'), payload=payload)
+
+
+def failed(error):
+    """EmailResult for an email the engine could not analyze."""
+    return EmailResult(email_id=None, error=error, payload={'error': error})
 
 
 class TestEmailBatchProcessorInitialization:
     """Test EmailBatchProcessor initialization."""
 
+    @pytest.fixture(autouse=True)
+    def eight_cpus(self, monkeypatch):
+        """Pin the CPU count and clear the worker override."""
+        monkeypatch.setattr('mailmind.core.email_batch_processor.os.cpu_count', lambda: 8)
+        monkeypatch.delenv('MAILMIND_MAX_WORKERS', raising=False)
+
     def test_init_with_pool_size_3(self):
         """Test initialization with pool size 3."""
         mock_engine = Mock()
@@ -42,6 +61,91 @@ class TestEmailBatchProcessorInitialization:
 
         assert processor.executor._max_workers == 5
 
+    def test_workers_capped_by_cpu_count(self, monkeypatch):
+        """Test workers never exceed two per CPU."""
+        monkeypatch.setattr('mailmind.core.email_batch_processor.os.cpu_count', lambda: 2)
+        mock_pool = Mock()
+        mock_pool.size = 10
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+
+        assert processor.max_workers == 4
+        assert processor.executor._max_workers == 4
+
+    def test_workers_capped_at_max(self, monkeypatch):
+        """Test workers never exceed MAX_WORKERS_CAP."""
+        monkeypatch.setattr('mailmind.core.email_batch_processor.os.cpu_count', lambda: 64)
+        mock_pool = Mock()
+        mock_pool.size = 100
+
+        processor = EmailBatchProcessor(Mock(), mock_pool, executor=Mock())
+
+        assert processor.max_workers == 16
+
+    def test_workers_env_override(self, monkeypatch):
+        """Test MAILMIND_MAX_WORKERS overrides the computed worker count."""
+        monkeypatch.setenv('MAILMIND_MAX_WORKERS', '7')
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        processor = EmailBatchProcessor(Mock(), mock_pool, executor=Mock())
+
+        assert processor.max_workers == 7
+
+    def test_workers_invalid_env_ignored(self, monkeypatch):
+        """Test a non-numeric MAILMIND_MAX_WORKERS falls back to the cap."""
+        monkeypatch.setenv('MAILMIND_MAX_WORKERS', 'lots')
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        processor = EmailBatchProcessor(Mock(), mock_pool, executor=Mock())
+
+        assert processor.max_workers == 3
+
+    def test_processors_share_executor(self):
+        """Test processors with the same pool size reuse one executor."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        first = EmailBatchProcessor(Mock(), mock_pool)
+        second = EmailBatchProcessor(Mock(), mock_pool)
+
+        assert first.executor is second.executor
+
+    def test_pinned_workers(self, monkeypatch):
+        """Test MAILMIND_PIN_THREADS pins each named worker thread to a CPU."""
+        from mailmind.core import email_batch_processor as module
+
+        monkeypatch.setenv('MAILMIND_PIN_THREADS', '1')
+        monkeypatch.setenv('MAILMIND_MAX_WORKERS', '2')
+        monkeypatch.setattr(module.os, 'sched_getaffinity', lambda pid: {0, 1}, raising=False)
+        pinned = []
+        monkeypatch.setattr(module.os, 'sched_setaffinity',
+                            lambda pid, cpus: pinned.append(cpus), raising=False)
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        try:
+            names = {processor.executor.submit(lambda: threading.current_thread().name).result(timeout=5)}
+
+            assert pinned and all(len(cpus) == 1 and cpus <= {0, 1} for cpus in pinned)
+            assert all(name.startswith('mailmind-batch') for name in names)
+        finally:
+            module._EXECUTOR_CACHE.pop((2, True)).shutdown(wait=True)
+
+    def test_init_with_injected_executor(self):
+        """Test an injected executor is used instead of the shared one."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            processor = EmailBatchProcessor(Mock(), mock_pool, executor=executor)
+            assert processor.executor is executor
+        finally:
+            executor.shutdown(wait=True)
+
 
 class TestBatchProcessing:
     """Test batch processing functionality."""
@@ -70,7 +174,7 @@ class TestBatchProcessing:
         mock_pool.size = 3
 
         # Mock successful processing
-        mock_process_one.return_value = {'status': 'success', 'result': 'analyzed'}
+        mock_process_one.return_value = ok(status='success', result='analyzed')
 
         processor = EmailBatchProcessor(mock_engine, mock_pool)
 
@@ -94,11 +198,11 @@ class TestBatchProcessing:
 
         # Mock: 2 successful, 1 failed, 2 successful
         mock_process_one.side_effect = [
-            {'status': 'success'},
-            {'status': 'success'},
-            {'error': 'Analysis failed'},
-            {'status': 'success'},
-            {'status': 'success'}
+            ok(status='success'),
+            ok(status='success'),
+            failed('Analysis failed'),
+            ok(status='success'),
+            ok(status='success')
         ]
 
         processor = EmailBatchProcessor(mock_engine, mock_pool)
@@ -122,11 +226,11 @@ class TestBatchProcessing:
 
         # Mock: 2 successful, 1 exception, 2 successful
         mock_process_one.side_effect = [
-            {'status': 'success'},
-            {'status': 'success'},
+            ok(status='success'),
+            ok(status='success'),
             Exception("Unexpected error"),
-            {'status': 'success'},
-            {'status': 'success'}
+            ok(status='success'),
+            ok(status='success')
         ]
 
         processor = EmailBatchProcessor(mock_engine, mock_pool)
@@ -134,28 +238,32 @@ class TestBatchProcessing:
         emails = [Mock(id=i) for i in range(5)]
 
         # Should not raise, but handle exception gracefully
-        # Note: The executor will catch the exception in future.result()
-        # We need to mock the future to raise exception
-        with patch.object(processor.executor, 'submit') as mock_submit:
-            # Create mock futures
-            futures = []
-            for i, email in enumerate(emails):
-                mock_future = Mock()
-                if i == 2:
-                    # Third email raises exception
-                    mock_future.result.side_effect = Exception("Unexpected error")
-                else:
-                    mock_future.result.return_value = {'status': 'success'}
-                futures.append(mock_future)
-                mock_submit.return_value = mock_future
-
-            # Process batch with proper future mocking
-            mock_submit.side_effect = futures
-            result = processor.process_batch(emails)
-
-            assert result.total == 5
-            assert result.success == 4
-            assert result.failed == 1
+        result = processor.process_batch(emails)
+
+        assert result.total == 5
+        assert result.success == 4
+        assert result.failed == 1
+        assert result.results[2].exception is True
+        assert result.results[2].email_id == 2
+
+    def test_exception_tracebacks_logged_once_per_batch(self, caplog):
+        """Test failures log one-line warnings and a single traceback summary."""
+        mock_engine = Mock()
+        mock_engine.analyze_email.side_effect = RuntimeError("model crashed")
+        mock_pool = MagicMock()
+        mock_pool.size = 3
+
+        processor = EmailBatchProcessor(mock_engine, mock_pool)
+        with caplog.at_level('WARNING', logger='mailmind.core.email_batch_processor'):
+            result = processor.process_batch([Mock(id=i) for i in range(3)], circuit_min_samples=100)
+
+        errors = [r for r in caplog.records if r.levelname == 'ERROR']
+        warnings = [r for r in caplog.records if 'failed with exception' in r.getMessage()]
+        assert result.failed == 3
+        assert len(warnings) == 3
+        assert all(r.exc_info is None for r in warnings)
+        assert len(errors) == 1
+        assert errors[0].getMessage().count('RuntimeError: model crashed') == 3
 
     @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
     def test_process_batch_timeout_handling(self, mock_process_one):
@@ -164,35 +272,85 @@ class TestBatchProcessing:
         mock_pool = Mock()
         mock_pool.size = 3
 
+        # Second email never finishes within the batch deadline
+        def process(email):
+            if email.id == 1:
+                time.sleep(0.5)
+            return ok(status='success')
+
+        mock_process_one.side_effect = process
+
+        processor = EmailBatchProcessor(mock_engine, mock_pool)
+
+        emails = [Mock(id=i) for i in range(3)]
+        result = processor.process_batch(emails, email_timeout=0.05)
+
+        assert result.total == 3
+        assert result.success == 2
+        assert result.failed == 1
+
+        # Check timeout result
+        timeout_result = result.results[1]
+        assert 'Timeout' in timeout_result.error
+        assert timeout_result.timeout is True
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_process_batch_batch_timeout(self, mock_process_one):
+        """Test batch_timeout cancels emails still pending at the batch deadline."""
+        mock_engine = Mock()
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        def process(email):
+            if email.id == 2:
+                time.sleep(0.5)
+            return ok(status='success')
+
+        mock_process_one.side_effect = process
+
+        processor = EmailBatchProcessor(mock_engine, mock_pool)
+
+        emails = [Mock(id=i) for i in range(3)]
+        start = time.monotonic()
+        result = processor.process_batch(emails, email_timeout=30.0, batch_timeout=0.1)
+
+        assert time.monotonic() - start < 0.4
+        assert result.success == 2
+        assert result.failed == 1
+        assert result.results[2] == EmailResult(
+            email_id=2, error='batch deadline exceeded', timeout=True)
+
+    def test_latency_percentiles(self):
+        """Test nearest-rank latency percentiles."""
+        latencies = [float(i) for i in range(1, 101)]
+
+        assert EmailBatchProcessor._latency_percentiles(latencies, (50, 90, 99)) == [50.0, 90.0, 99.0]
+        assert EmailBatchProcessor._latency_percentiles([2.0], (50, 99)) == [2.0, 2.0]
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_slow_email_does_not_block_finished_ones(self, mock_process_one):
+        """Test results are reaped in completion order, not submission order."""
+        mock_engine = Mock()
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        def process(email):
+            if email.id == 0:
+                time.sleep(0.2)
+            return ok(status='success', id=email.id)
+
+        mock_process_one.side_effect = process
+
         processor = EmailBatchProcessor(mock_engine, mock_pool)
+        reaped = []
 
         emails = [Mock(id=i) for i in range(3)]
+        result = processor.process_batch(
+            emails, progress_callback=lambda current, total: reaped.append(time.monotonic()))
 
-        # Mock futures with timeout
-        with patch.object(processor.executor, 'submit') as mock_submit:
-            futures = []
-            for i, email in enumerate(emails):
-                mock_future = Mock()
-                if i == 1:
-                    # Second email times out
-                    mock_future.result.side_effect = FutureTimeoutError()
-                else:
-                    mock_future.result.return_value = {'status': 'success'}
-                futures.append(mock_future)
-                mock_submit.return_value = mock_future
-
-            mock_submit.side_effect = futures
-            result = processor.process_batch(emails, email_timeout=30.0)
-
-            assert result.total == 3
-            assert result.success == 2
-            assert result.failed == 1
-
-            # Check timeout result
-            timeout_result = result.results[1]
-            assert 'error' in timeout_result
-            assert 'Timeout' in timeout_result['error']
-            assert timeout_result.get('timeout') is True
+        # Results keep input order even though email 0 finished last
+        assert [r.payload['id'] for r in result.results] == [0, 1, 2]
+        assert reaped[1] - reaped[0] < 0.15
 
     @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
     def test_process_batch_progress_callback(self, mock_process_one):
@@ -201,7 +359,7 @@ class TestBatchProcessing:
         mock_pool = Mock()
         mock_pool.size = 3
 
-        mock_process_one.return_value = {'status': 'success'}
+        mock_process_one.return_value = ok(status='success')
 
         processor = EmailBatchProcessor(mock_engine, mock_pool)
 
@@ -217,6 +375,27 @@ class TestBatchProcessing:
         for i in range(10):
             progress_callback.assert_any_call(i + 1, 10)
 
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_process_batch_progress_callback_coalesced(self, mock_process_one):
+        """Test large batches report progress in chunks and always report the end."""
+        mock_engine = Mock()
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        mock_process_one.return_value = ok(status='success')
+
+        processor = EmailBatchProcessor(mock_engine, mock_pool)
+
+        emails = [Mock(id=i) for i in range(1000)]
+        progress_callback = Mock()
+
+        processor.process_batch(emails, progress_callback=progress_callback,
+                                progress_interval=60.0)
+
+        # At most one call per 1% of the batch, ending with the final count
+        assert progress_callback.call_count <= 100
+        assert progress_callback.call_args_list[-1] == ((1000, 1000),)
+
     @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
     def test_process_batch_progress_callback_exception(self, mock_process_one):
         """Test batch processing continues if progress callback fails."""
@@ -224,7 +403,7 @@ class TestBatchProcessing:
         mock_pool = Mock()
         mock_pool.size = 3
 
-        mock_process_one.return_value = {'status': 'success'}
+        mock_process_one.return_value = ok(status='success')
 
         processor = EmailBatchProcessor(mock_engine, mock_pool)
 
@@ -247,7 +426,7 @@ class TestBatchProcessing:
         # Mock quick processing (10ms per email)
         def quick_process(email):
             time.sleep(0.01)
-            return {'status': 'success'}
+            return ok(status='success')
 
         mock_process_one.side_effect = quick_process
 
@@ -266,6 +445,316 @@ class TestBatchProcessing:
         expected_epm = (10 / result.elapsed_time) * 60
         assert abs(result.emails_per_minute - expected_epm) < 1.0
 
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_process_batch_latency_percentiles(self, mock_process_one):
+        """Test per-email latency percentiles are reported in BatchResult."""
+        mock_engine = Mock()
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        def process(email):
+            time.sleep(0.2 if email.id == 0 else 0.01)
+            return ok(status='success')
+
+        mock_process_one.side_effect = process
+
+        processor = EmailBatchProcessor(mock_engine, mock_pool)
+        result = processor.process_batch([Mock(id=i) for i in range(3)])
+
+        assert 0 < result.p50 <= result.p90 <= result.p99 <= result.max_latency
+        assert result.max_latency >= 0.2
+        assert result.p50 < 0.2
+
+    def test_empty_batch_has_zero_latency(self):
+        """Test empty batches report zero latency percentiles."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        result = EmailBatchProcessor(Mock(), mock_pool).process_batch([])
+
+        assert (result.p50, result.p90, result.p99, result.max_latency) == (0.0, 0.0, 0.0, 0.0)
+
+
+class TestChunkedProcessing:
+    """Test chunked submission and iter_batches()."""
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_process_batch_chunks_keep_order(self, mock_process_one):
+        """Test chunked processing returns every result in input order."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+        mock_process_one.side_effect = lambda email: ok(status='success', id=email.id)
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        result = processor.process_batch([Mock(id=i) for i in range(7)], chunk_size=2)
+
+        assert result.total == 7
+        assert result.success == 7
+        assert [r.payload['id'] for r in result.results] == list(range(7))
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_in_flight_futures_are_bounded(self, mock_process_one, monkeypatch):
+        """Test at most max_workers * IN_FLIGHT_PER_WORKER futures are outstanding."""
+        monkeypatch.setenv('MAILMIND_MAX_WORKERS', '1')
+        mock_pool = Mock()
+        mock_pool.size = 3
+        mock_process_one.side_effect = lambda email: ok(status='success', id=email.id)
+
+        outstanding = {'now': 0, 'peak': 0}
+
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args):
+                outstanding['now'] += 1
+                outstanding['peak'] = max(outstanding['peak'], outstanding['now'])
+                future = super().submit(fn, *args)
+                future.add_done_callback(lambda f: outstanding.__setitem__('now', outstanding['now'] - 1))
+                return future
+
+        processor = EmailBatchProcessor(Mock(), mock_pool, executor=CountingExecutor(max_workers=1))
+        try:
+            result = processor.process_batch([Mock(id=i) for i in range(50)])
+        finally:
+            processor.shutdown(wait=True)
+
+        assert result.success == 50
+        assert [r.payload['id'] for r in result.results] == list(range(50))
+        assert outstanding['peak'] <= EmailBatchProcessor.IN_FLIGHT_PER_WORKER
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_iter_batches_yields_partial_results(self, mock_process_one):
+        """Test iter_batches yields one BatchResult per chunk."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+        mock_process_one.side_effect = lambda email: ok(status='success', id=email.id)
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        chunks = list(processor.iter_batches([Mock(id=i) for i in range(5)], chunk_size=2))
+
+        assert [chunk.total for chunk in chunks] == [2, 2, 1]
+        assert [r.payload['id'] for chunk in chunks for r in chunk.results] == list(range(5))
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_chunks_after_deadline_are_not_submitted(self, mock_process_one):
+        """Test chunks starting after the batch deadline are reported as not started."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        def process(email):
+            time.sleep(0.2)
+            return ok(status='success')
+
+        mock_process_one.side_effect = process
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        result = processor.process_batch(
+            [Mock(id=i) for i in range(4)], batch_timeout=0.05, chunk_size=2)
+
+        assert result.failed == 4
+        assert mock_process_one.call_count <= 2
+        assert all(r.timeout for r in result.results[:2])
+        assert result.results[2:] == [
+            EmailResult(email_id=i, error='not_started', cancelled=True) for i in (2, 3)
+        ]
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_hung_email_does_not_block_later_chunks(self, mock_process_one):
+        """Test one blocking email times out alone while every later chunk still runs."""
+        mock_pool = Mock()
+        mock_pool.size = 4
+        release = threading.Event()
+
+        def process(email):
+            if email.id == 0:
+                release.wait(5)
+            return ok(status='success')
+
+        mock_process_one.side_effect = process
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        start = time.monotonic()
+        try:
+            result = processor.process_batch(
+                [Mock(id=i) for i in range(20)], email_timeout=0.1, chunk_size=4)
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 1.0
+        assert result.success == 19
+        assert result.results[0] == EmailResult(email_id=0, error='Timeout after 0.1s', timeout=True)
+        assert all(r.error is None for r in result.results[1:])
+
+
+class TestCircuitBreaker:
+    """Test fail-fast when most emails in a batch fail."""
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_circuit_opens_on_cascading_failures(self, mock_process_one):
+        """Test pending emails are cancelled once the failure rate trips the breaker."""
+        mock_pool = Mock()
+        mock_pool.size = 2
+
+        def process(email):
+            time.sleep(0.01)
+            return failed('Ollama unavailable')
+
+        mock_process_one.side_effect = process
+
+        processor = EmailBatchProcessor(Mock(), mock_pool, executor=ThreadPoolExecutor(max_workers=2))
+        try:
+            result = processor.process_batch(
+                [Mock(id=i) for i in range(100)], chunk_size=20, circuit_min_samples=10)
+        finally:
+            processor.shutdown(wait=True)
+
+        cancelled = [r for r in result.results if r.cancelled]
+        assert result.failed == 100
+        assert len(cancelled) >= 60
+        assert all(r.error == 'circuit_open' for r in cancelled)
+        assert mock_process_one.call_count < 40
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_cancelled_results_without_ids_are_shared(self, mock_process_one):
+        """Test id-less emails skipped by the breaker share one frozen result."""
+        mock_pool = Mock()
+        mock_pool.size = 2
+        mock_process_one.return_value = failed('Ollama unavailable')
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        result = processor.process_batch(
+            [object() for _ in range(50)], chunk_size=10, circuit_min_samples=5)
+
+        cancelled = [r for r in result.results if r.cancelled]
+        assert len(cancelled) >= 30
+        assert all(r is cancelled[0] for r in cancelled)
+        assert cancelled[0].email_id is None
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_circuit_stays_closed_below_threshold(self, mock_process_one):
+        """Test occasional failures do not cancel the batch."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+        mock_process_one.side_effect = lambda email: (
+            failed('bad email') if email.id % 4 == 0 else ok(status='success'))
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        result = processor.process_batch([Mock(id=i) for i in range(20)])
+
+        assert result.failed == 5
+        assert not any(r.cancelled for r in result.results)
+
+
+class TestAsyncProcessing:
+    """Test process_batch_async()."""
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_sync_engine_runs_in_threads(self, mock_process_one):
+        """Test a synchronous engine is processed via asyncio.to_thread."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+        mock_process_one.side_effect = lambda email: ok(status='success', id=email.id)
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        progress_callback = Mock()
+        result = asyncio.run(processor.process_batch_async(
+            [Mock(id=i) for i in range(5)], progress_callback=progress_callback))
+
+        assert result.total == 5
+        assert result.success == 5
+        assert [r.payload['id'] for r in result.results] == list(range(5))
+        progress_callback.assert_called_with(5, 5)
+
+    def test_async_engine_respects_pool_size(self):
+        """Test a coroutine engine is awaited with at most pool.size in flight."""
+        mock_pool = MagicMock()
+        mock_pool.size = 2
+        state = {'in_flight': 0, 'peak': 0}
+
+        class AsyncEngine:
+            async def analyze_email(self, email, conn):
+                state['in_flight'] += 1
+                state['peak'] = max(state['peak'], state['in_flight'])
+                await asyncio.sleep(0.01)
+                state['in_flight'] -= 1
+                if email.id == 3:
+                    await asyncio.sleep(1)
+                return {'priority': 'high'}
+
+        processor = EmailBatchProcessor(AsyncEngine(), mock_pool)
+        result = asyncio.run(processor.process_batch_async(
+            [Mock(id=i) for i in range(6)], email_timeout=0.2))
+
+        assert state['peak'] == 2
+        assert result.success == 5
+        assert result.results[3].timeout is True
+
+    def test_empty_batch(self):
+        """Test empty email list returns an empty result."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        result = asyncio.run(EmailBatchProcessor(Mock(), mock_pool).process_batch_async([]))
+
+        assert result.total == 0
+
+
+class TestCancelBatch:
+    """Test aborting a running batch with cancel_batch()."""
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_cancel_stops_batch_early(self, mock_process_one):
+        """Test cancel_batch returns without waiting for outstanding emails."""
+        mock_pool = Mock()
+        mock_pool.size = 2
+
+        def process(email):
+            time.sleep(0.05 if email.id == 0 else 0.5)
+            return ok(status='success', id=email.id)
+
+        mock_process_one.side_effect = process
+
+        processor = EmailBatchProcessor(Mock(), mock_pool, executor=ThreadPoolExecutor(max_workers=2))
+        threading.Timer(0.1, processor.cancel_batch).start()
+        try:
+            start = time.monotonic()
+            result = processor.process_batch([Mock(id=i) for i in range(20)])
+            elapsed = time.monotonic() - start
+        finally:
+            processor.shutdown(wait=True)
+
+        assert elapsed < 0.4
+        assert result.results[0].payload['id'] == 0
+        cancelled = [r for r in result.results if r.cancelled]
+        assert len(cancelled) == 19
+        assert all(r.error == 'cancelled' for r in cancelled)
+        assert [r.email_id for r in cancelled] == list(range(1, 20))
+
+    @patch('mailmind.core.email_batch_processor.EmailBatchProcessor._process_one')
+    def test_next_batch_runs_after_cancel(self, mock_process_one):
+        """Test the cancel flag is cleared when the next batch starts."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+        mock_process_one.return_value = ok(status='success')
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        processor.cancel_batch()
+        result = processor.process_batch([Mock(id=i) for i in range(3)])
+
+        assert result.success == 3
+
+    def test_process_one_skips_work_when_cancelled(self):
+        """Test _process_one returns a cancelled result without acquiring a connection."""
+        mock_engine = Mock()
+        mock_pool = MagicMock()
+        mock_pool.size = 3
+
+        processor = EmailBatchProcessor(mock_engine, mock_pool)
+        processor.cancel_batch()
+        result = processor._process_one(Mock(id=7))
+
+        assert result == EmailResult(email_id=7, error='cancelled', cancelled=True)
+        mock_pool.acquire.assert_not_called()
+        mock_engine.analyze_email.assert_not_called()
+
 
 class TestProcessOne:
     """Test _process_one method."""
@@ -294,8 +783,9 @@ class TestProcessOne:
         mock_engine.analyze_email.assert_called_once_with(email, mock_conn)
 
         # Verify result
-        assert result['status'] == 'success'
-        assert result['priority'] == 'high'
+        assert result.error is None
+        assert result.email_id == 123
+        assert result.payload == {'status': 'success', 'priority': 'high'}
 
     def test_process_one_exception_handling(self):
         """Test _process_one handles exceptions gracefully."""
@@ -314,26 +804,177 @@ class TestProcessOne:
         email = Mock(id=123)
         result = processor._process_one(email)
 
-        # Should return error dict instead of raising
-        assert 'error' in result
-        assert 'Analysis error' in result['error']
-        assert result['email_id'] == 123
+        # Should return an error result instead of raising
+        assert result.error is not None
+        assert 'Analysis error' in result.error
+        assert result.email_id == 123
+        assert result.payload is None
+
+
+class TestGroupedProcessing:
+    """Test emails_per_call grouping through engine.analyze_emails()."""
+
+    @pytest.fixture
+    def pool(self):
+        """Pool whose acquire() yields a mock connection."""
+        pool = MagicMock()
+        pool.size = 3
+        return pool
+
+    def test_groups_use_one_engine_call(self, pool):
+        """Test emails are analyzed in groups of emails_per_call."""
+        engine = Mock()
+        engine.analyze_emails.side_effect = lambda group, conn: [
+            {'priority': 'high', 'id': email.id} for email in group]
+
+        processor = EmailBatchProcessor(engine, pool, emails_per_call=4)
+        result = processor.process_batch([Mock(id=i) for i in range(10)])
+
+        assert engine.analyze_emails.call_count == 3
+        assert engine.analyze_email.call_count == 0
+        assert result.success == 10
+        assert [r.payload['id'] for r in result.results] == list(range(10))
+        assert [r.email_id for r in result.results] == list(range(10))
+
+    def test_group_failure_marks_every_email(self, pool):
+        """Test a failing group call fails only the emails in that group."""
+        engine = Mock()
+
+        def analyze(group, conn):
+            if group[0].id == 0:
+                raise RuntimeError("model crashed")
+            return [{'priority': 'low'} for _ in group]
+
+        engine.analyze_emails.side_effect = analyze
+
+        processor = EmailBatchProcessor(engine, pool, emails_per_call=2)
+        result = processor.process_batch([Mock(id=i) for i in range(4)])
+
+        assert result.failed == 2
+        assert [r.error for r in result.results[:2]] == ['model crashed', 'model crashed']
+        assert result.success == 2
+
+    def test_engine_without_group_api_falls_back(self, pool):
+        """Test grouping is disabled for engines without analyze_emails()."""
+        engine = Mock(spec=['analyze_email'])
+
+        processor = EmailBatchProcessor(engine, pool, emails_per_call=4)
+
+        assert processor.emails_per_call == 1
+
+
+class TestExecutorStats:
+    """Test executor utilization metrics."""
+
+    def test_get_stats(self):
+        """Test get_stats reports executor sizing and idle state."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        processor = EmailBatchProcessor(Mock(), mock_pool, executor=executor)
+        try:
+            executor.submit(lambda: None).result(timeout=5)
+            stats = processor.get_stats()
+        finally:
+            processor.shutdown(wait=True)
+
+        assert stats == {
+            'queue_depth': 0,
+            'active_workers': 1,
+            'max_workers': 2,
+            'in_flight_tasks': 0
+        }
+
+    def test_register_metrics_without_opentelemetry(self, monkeypatch):
+        """Test register_metrics is a no-op when opentelemetry is missing."""
+        monkeypatch.setattr('mailmind.core.email_batch_processor.OTEL_AVAILABLE', False)
+        mock_pool = Mock()
+        mock_pool.size = 3
+        meter = Mock()
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+
+        assert processor.register_metrics(meter) is False
+        meter.create_observable_gauge.assert_not_called()
+
+    def test_register_metrics_creates_gauges(self, monkeypatch):
+        """Test one observable gauge is registered per stat."""
+        pytest.importorskip("opentelemetry")
+        mock_pool = Mock()
+        mock_pool.size = 3
+        meter = Mock()
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+
+        assert processor.register_metrics(meter) is True
+        names = [c.args[0] for c in meter.create_observable_gauge.call_args_list]
+        assert names == [f"mailmind.batch.{name}" for name in processor.get_stats()]
+
+
+class TestWarmup:
+    """Test connection pool warm-up."""
+
+    @pytest.fixture
+    def pool(self):
+        """Initialized pool of three mock clients."""
+        pool = OllamaConnectionPool(size=3)
+        pool.clients = [Mock() for _ in range(3)]
+        for client in pool.clients:
+            pool.pool.put(client)
+        pool._initialized = True
+        return pool
+
+    def test_warmup_pings_every_connection(self, pool):
+        """Test warmup touches each pooled connection once and releases them."""
+        processor = EmailBatchProcessor(Mock(), pool)
+
+        assert processor.warmup() == 3
+        assert all(client.list.call_count == 1 for client in pool.clients)
+        assert pool.stats()['idle'] == 3
+
+    def test_warmup_counts_failed_pings(self, pool):
+        """Test a failing connection is logged and not counted."""
+        pool.clients[1].list.side_effect = ConnectionError("refused")
+        processor = EmailBatchProcessor(Mock(), pool)
+
+        assert processor.warmup() == 2
+        assert pool.stats()['idle'] == 3
+
+    def test_warmup_uninitialized_pool(self):
+        """Test warmup on an uninitialized pool does not raise."""
+        processor = EmailBatchProcessor(Mock(), OllamaConnectionPool(size=2))
+
+        assert processor.warmup() == 0
 
 
 class TestBatchProcessorLifecycle:
     """Test EmailBatchProcessor lifecycle management."""
 
     def test_shutdown(self):
-        """Test graceful shutdown."""
+        """Test graceful shutdown of an injected executor."""
         mock_engine = Mock()
         mock_pool = Mock()
         mock_pool.size = 3
+        executor = Mock()
 
-        processor = EmailBatchProcessor(mock_engine, mock_pool)
+        processor = EmailBatchProcessor(mock_engine, mock_pool, executor=executor)
+        processor.shutdown(wait=True)
 
-        with patch.object(processor.executor, 'shutdown') as mock_shutdown:
-            processor.shutdown(wait=True)
-            mock_shutdown.assert_called_once_with(wait=True)
+        executor.shutdown.assert_called_once_with(wait=True)
+
+    def test_shutdown_leaves_shared_executor_running(self):
+        """Test shutdown is a no-op for the shared executor."""
+        mock_pool = Mock()
+        mock_pool.size = 3
+
+        processor = EmailBatchProcessor(Mock(), mock_pool)
+        processor.shutdown(wait=True)
+
+        # A later processor can still run work on the same executor
+        again = EmailBatchProcessor(Mock(), mock_pool)
+        assert again.executor is processor.executor
+        assert again.executor.submit(lambda: 42).result(timeout=5) == 42
 
     def test_context_manager(self):
         """Test context manager usage."""
@@ -361,11 +1002,11 @@ class TestResultAggregation:
 
         # 3 successful, 2 failed
         mock_process_one.side_effect = [
-            {'status': 'success', 'priority': 'high'},
-            {'error': 'Failed'},
-            {'status': 'success', 'priority': 'low'},
-            {'error': 'Timeout'},
-            {'status': 'success', 'priority': 'medium'}
+            ok(status='success', priority='high'),
+            failed('Failed'),
+            ok(status='success', priority='low'),
+            failed('Timeout'),
+            ok(status='success', priority='medium')
         ]
 
         processor = EmailBatchProcessor(mock_engine, mock_pool)
@@ -379,8 +1020,8 @@ class TestResultAggregation:
 
         # Check results list
         assert len(result.results) == 5
-        assert result.results[0]['status'] == 'success'
-        assert 'error' in result.results[1]
-        assert result.results[2]['status'] == 'success'
-        assert 'error' in result.results[3]
-        assert result.results[4]['status'] == 'success'
+        assert result.results[0].payload['status'] == 'success'
+        assert result.results[1].error == 'Failed'
+        assert result.results[2].payload['status'] == 'success'
+        assert result.results[3].error == 'Timeout'
+        assert result.results[4].payload['status'] == 'success'
@@ -248,6 +248,33 @@ class TestEmailAnalysisCRUD:
         result = db_manager.get_email_analysis(message_id)
         assert result["subject"] == "Second"
 
+    def test_insert_batch_with_serialized_analysis(self, db_manager):
+        """Test that pre-serialized analysis JSON is stored without re-encoding."""
+        written = db_manager.insert_email_analysis_batch([
+            ("batch-msg-1", '{"priority":"High"}', {"model_version": "v1.0"}),
+            ("batch-msg-2", {"priority": "Low"}, {"model_version": "v1.0"}),
+        ])
+
+        assert written == 2
+        assert db_manager.get_email_analysis("batch-msg-1")["analysis_json"] == '{"priority":"High"}'
+        assert db_manager.get_email_analysis("batch-msg-2")["analysis"]["priority"] == "Low"
+
+    def test_get_stats_summary(self, db_manager):
+        """Test grouped priority counts and average processing time."""
+        for i, (priority, ms) in enumerate([("High", 100), ("High", 300), ("Low", None)]):
+            db_manager.insert_email_analysis(
+                f"stats-msg-{i}",
+                {"priority": priority},
+                {"priority": priority, "processing_time_ms": ms, "model_version": "v1.0"}
+            )
+
+        summary = db_manager.get_stats_summary()
+
+        assert summary["priority_counts"] == {"High": 2, "Medium": 0, "Low": 1}
+        assert summary["total_analyses"] == 3
+        assert summary["avg_processing_time_ms"] == 200.0
+        assert summary["avg_tokens_per_second"] == 0.0
+
 
 class TestPerformanceMetrics:
     """Test performance_metrics table operations."""
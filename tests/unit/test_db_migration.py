@@ -0,0 +1,76 @@
+"""
+Unit Tests for db_migration
+
+Tests the shared migration flow end to end with plain SQLite connections,
+so it runs without SQLCipher.
+"""
+
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from mailmind.core import db_migration
+from mailmind.core.db_migration import MigrationProgress, _fsync_path, _migrate_between
+
+
+@pytest.fixture
+def source_db(tmp_path):
+    """Create a small unencrypted database."""
+    db_path = str(tmp_path / "mailmind.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE email_analysis (id INTEGER PRIMARY KEY, subject TEXT)")
+    conn.executemany(
+        "INSERT INTO email_analysis (subject) VALUES (?)",
+        [(f"Subject {i}",) for i in range(25)]
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class TestMigrateBetween:
+    """Test _migrate_between through the finalize stage."""
+
+    def test_migration_completes_and_replaces_database(self, source_db, tmp_path):
+        """Test that the migrated copy is flushed and swapped into place."""
+        stages = []
+        backup_path = str(tmp_path / "backup.db")
+
+        with patch.object(db_migration, "_fsync_path", wraps=_fsync_path) as fsync_path:
+            success, message = _migrate_between(
+                source_db,
+                backup_path,
+                MigrationProgress(lambda stage, pct: stages.append(stage)),
+                open_source=sqlite3.connect,
+                open_target=sqlite3.connect,
+                target_key="",
+                target_label="unencrypted",
+                log_success=lambda msg: None,
+            )
+
+        assert success, message
+        assert fsync_path.call_count == 1
+        assert "finalize" in stages
+        assert stages[-1] == "complete"
+        assert os.path.exists(backup_path)
+
+        conn = sqlite3.connect(source_db)
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM email_analysis").fetchone()[0]
+        finally:
+            conn.close()
+        assert count == 25
+        assert not [name for name in os.listdir(tmp_path) if name.startswith("mailmind_unencrypted_")]
+
+    def test_fsync_path_opens_file_for_writing(self, tmp_path):
+        """Test that the flush uses a writable descriptor (required by Windows fsync)."""
+        path = tmp_path / "data.db"
+        path.write_bytes(b"data")
+
+        with patch.object(db_migration.os, "open", wraps=os.open) as os_open:
+            _fsync_path(str(path))
+
+        flags = os_open.call_args[0][1]
+        assert flags & os.O_RDWR
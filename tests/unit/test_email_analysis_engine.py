@@ -19,11 +19,14 @@ import pytest
 import json
 import tempfile
 import os
+import threading
+import time
 from unittest.mock import Mock, MagicMock, patch
 from src.mailmind.core.email_analysis_engine import (
     EmailAnalysisEngine,
     EmailAnalysisError,
-    analyze_email
+    analyze_email,
+    _find_json
 )
 
 
@@ -51,7 +54,9 @@ def mock_ollama():
 @pytest.fixture
 def analysis_engine(mock_ollama, temp_db):
     """Create EmailAnalysisEngine instance with mocked dependencies."""
-    return EmailAnalysisEngine(mock_ollama, db_path=temp_db)
+    engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db)
+    yield engine
+    engine.close()
 
 
 @pytest.fixture
@@ -73,6 +78,11 @@ Alice''',
     }
 
 
+def streamed(response):
+    """Make a client.generate side effect that streams response as one final chunk."""
+    return lambda **kwargs: iter([dict(response, done=True)])
+
+
 @pytest.fixture
 def sample_llm_response():
     """Sample LLM response with valid JSON."""
@@ -88,6 +98,7 @@ def sample_llm_response():
 }
 ```''',
         'total_duration': 2000000000,  # 2 seconds in nanoseconds
+        'eval_duration': 2000000000,
         'eval_count': 100
     }
 
@@ -146,6 +157,17 @@ class TestQuickPriorityHeuristic:
         priority = analysis_engine._quick_priority_heuristic(email)
         assert priority == 'High'
 
+    def test_mixed_case_body_deadline(self, analysis_engine):
+        """Test that body patterns match case-insensitively without lowering."""
+        email = {
+            'metadata': {'subject': 'Hello', 'from': 'test@example.com'},
+            'content': {'body': 'The DEADLINE for the report is 10/15.'},
+            'thread_context': {'is_reply': False}
+        }
+
+        priority = analysis_engine._quick_priority_heuristic(email)
+        assert priority == 'High'
+
     def test_medium_priority_thread_reply(self, analysis_engine):
         """Test that replies in active threads get medium priority."""
         email = {
@@ -169,6 +191,36 @@ class TestQuickPriorityHeuristic:
         assert priority == 'Low'
 
 
+class TestQuickPriorityFallback:
+    """Test when the quick priority heuristic runs during analysis."""
+
+    def _analyze(self, analysis_engine, mock_ollama, confidence):
+        mock_ollama.client.generate.side_effect = streamed({'response': json.dumps({
+            'priority': 'Low', 'confidence': confidence, 'summary': 'S',
+            'tags': [], 'sentiment': 'neutral', 'action_items': []
+        })})
+        email = {'subject': 'URGENT', 'body': 'Body', 'message_id': f'quick_{confidence}'}
+        with patch.object(analysis_engine, '_quick_priority_heuristic',
+                          wraps=analysis_engine._quick_priority_heuristic) as heuristic:
+            result = analysis_engine.analyze_email(email)
+        return result, heuristic
+
+    def test_heuristic_skipped_when_llm_confident(self, analysis_engine, mock_ollama):
+        """Test that a confident LLM answer does not pay for the keyword scan."""
+        result, heuristic = self._analyze(analysis_engine, mock_ollama, 0.9)
+
+        heuristic.assert_not_called()
+        assert result['priority'] == 'Low'
+
+    def test_heuristic_used_when_llm_unsure(self, analysis_engine, mock_ollama):
+        """Test that low confidence falls back to the heuristic priority."""
+        result, heuristic = self._analyze(analysis_engine, mock_ollama, 0.2)
+
+        heuristic.assert_called_once()
+        assert result['priority'] == 'High'
+        assert result['confidence'] == 0.5
+
+
 class TestPromptBuilding:
     """Test prompt construction."""
 
@@ -198,6 +250,20 @@ class TestPromptBuilding:
         assert 'JSON' in prompt
         assert 'priority' in prompt.lower()
 
+    def test_prompt_body_trimmed_to_context_window(self, analysis_engine, mock_ollama):
+        """Test that bodies larger than the context budget are cut before sending."""
+        mock_ollama.context_window = 1024
+        email = {
+            'metadata': {'from': 'a@example.com', 'subject': 'Long', 'date': '2025-10-13'},
+            'content': {'body': '~' * 50000, 'has_attachments': False, 'attachments': []},
+            'thread_context': {'is_reply': False}
+        }
+
+        prompt = analysis_engine._build_analysis_prompt(email)
+
+        assert prompt.count('~') == analysis_engine._max_body_chars()
+        assert prompt.endswith('no additional text:')
+
     def test_prompt_includes_thread_context(self, analysis_engine):
         """Test that thread context is included in prompt."""
         email = {
@@ -229,6 +295,38 @@ class TestPromptBuilding:
         assert 'data.xlsx' in prompt
 
 
+class TestPromptShapes:
+    """Test shape-specific prompt selection."""
+
+    @staticmethod
+    def _email(subject='Hello', body='Body', is_reply=False, attachments=()):
+        return {
+            'metadata': {'from': 'a@example.com', 'subject': subject, 'date': '2025-10-13'},
+            'content': {'body': body, 'has_attachments': bool(attachments), 'attachments': list(attachments)},
+            'thread_context': {'is_reply': is_reply, 'thread_length': 2}
+        }
+
+    def test_classify_shape(self, analysis_engine):
+        """Test cheap shape detection from subject, thread and footer."""
+        classify = analysis_engine._classify_shape
+        assert classify(self._email(subject='Invitation: Sync @ Mon 10am')) == 'calendar'
+        assert classify(self._email(attachments=['invite.ics (2KB)'])) == 'calendar'
+        assert classify(self._email(subject='Re: Plan', is_reply=True)) == 'reply'
+        assert classify(self._email(body='News...\n\nClick here to unsubscribe')) == 'newsletter'
+        assert classify(self._email()) == 'general'
+
+    def test_shape_prompt_is_shorter(self, analysis_engine):
+        """Test that specialized prompts are shorter than the general one and keep the fields."""
+        email = self._email(subject='Re: Plan', is_reply=True)
+
+        general = analysis_engine._build_analysis_prompt(email, shape='general')
+        reply = analysis_engine._build_analysis_prompt(email)
+
+        assert len(reply) < len(general)
+        for field in ('priority', 'summary', 'tags', 'sentiment', 'action_items'):
+            assert field in reply
+
+
 class TestResponseParsing:
     """Test AC2-AC6: Parsing LLM responses."""
 
@@ -270,6 +368,35 @@ class TestResponseParsing:
         assert analysis['priority'] == 'Medium'
         assert analysis['confidence'] == 0.75
 
+    def test_parse_ignores_braces_in_strings_and_trailing_text(self, analysis_engine):
+        """Test that the JSON scanner stops at the closing brace of the first object."""
+        response = ('Here you go: {"priority": "High", "confidence": 0.9, '
+                    '"summary": "Uses {braces} and \\"quotes\\"", "tags": [], '
+                    '"sentiment": "urgent", "action_items": []} Hope that helps }')
+
+        analysis = analysis_engine._parse_analysis_response(response)
+
+        assert analysis['priority'] == 'High'
+        assert analysis['summary'] == 'Uses {braces} and "quotes"'
+
+    def test_parse_with_simdjson_when_orjson_missing(self, analysis_engine, monkeypatch):
+        """Test the simdjson parsing path used when orjson is not installed."""
+        pytest.importorskip('simdjson')
+        from src.mailmind.core import email_analysis_engine as engine_module
+        monkeypatch.setattr(engine_module, 'ORJSON_AVAILABLE', False)
+        monkeypatch.setattr(engine_module, 'SIMDJSON_AVAILABLE', True)
+
+        analysis = analysis_engine._parse_analysis_response(
+            '{"priority": "High", "confidence": 0.9, "tags": ["a"], "action_items": []}')
+
+        assert analysis['priority'] == 'High'
+        assert analysis['tags'] == ['a']
+
+    def test_find_json_unbalanced_returns_none(self):
+        """Test that a truncated object is not reported as JSON."""
+        assert _find_json('{"priority": "High", "tags": [') is None
+        assert _find_json('no json here') is None
+
     def test_parse_invalid_json_fallback(self, analysis_engine):
         """Test fallback parsing when JSON is invalid."""
         response = "The email has HIGH priority and discusses budget issues."
@@ -298,6 +425,19 @@ class TestResponseParsing:
         assert 'budget' in analysis['tags']
         assert 'urgent' in analysis['tags']
 
+    def test_parse_dedupes_tags_and_action_items(self, analysis_engine):
+        """Test that duplicate tags/actions differing only in case or spacing are dropped."""
+        response = json.dumps({
+            'priority': 'Low', 'confidence': 0.8, 'summary': 'S', 'sentiment': 'neutral',
+            'tags': ['meeting', 'Meeting', ' meeting ', '', 'budget'],
+            'action_items': ['Send Report', 'send report', '  ', 'Book room']
+        })
+
+        analysis = analysis_engine._parse_analysis_response(response)
+
+        assert analysis['tags'] == ['meeting', 'budget']
+        assert analysis['action_items'] == ['Send Report', 'Book room']
+
     def test_parse_limits_tags_to_five(self, analysis_engine):
         """Test that tags are limited to 5."""
         response = '''{
@@ -329,6 +469,84 @@ class TestResponseParsing:
         assert len(analysis['action_items']) == 5
 
 
+class TestStreaming:
+    """Test streamed LLM generation with early stop."""
+
+    def test_stream_stops_when_json_closes(self, analysis_engine, mock_ollama):
+        """Test that generation stops at the object's closing brace, not one inside a string."""
+        chunks = ['{"priority": "High", ', '"summary": "a } b"', '}', ' trailing', ' text']
+        consumed = []
+
+        def stream():
+            for text in chunks:
+                consumed.append(text)
+                yield {'response': text, 'done': False}
+
+        mock_ollama.client.generate.side_effect = lambda **kwargs: stream()
+        tokens = []
+
+        response = analysis_engine._generate_json("prompt", on_token=tokens.append)
+
+        assert response['response'] == '{"priority": "High", "summary": "a } b"}'
+        assert response['eval_count'] == 3
+        assert consumed == chunks[:3]
+        assert tokens == chunks[:3]
+        assert mock_ollama.client.generate.call_args.kwargs['stream'] is True
+
+
+class TestModelSelection:
+    """Test model and num_ctx selection per prompt."""
+
+    def test_default_uses_full_window(self, analysis_engine, mock_ollama):
+        """Test that without options the configured model and window are used."""
+        assert analysis_engine._select_model("short prompt") == (mock_ollama.current_model, 8192)
+
+    def test_short_prompt_routed_to_small_model(self, mock_ollama, temp_db):
+        """Test short prompts use the small model with a fixed smaller context."""
+        engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db, short_email_model='llama3.1:8b-q4_0')
+        try:
+            assert engine._select_model("x" * 400) == ('llama3.1:8b-q4_0', 2048)
+            assert engine._select_model("x" * 20000) == (mock_ollama.current_model, 8192)
+            assert engine._cache_models() == (mock_ollama.current_model, 'llama3.1:8b-q4_0')
+        finally:
+            engine.close()
+
+    def test_dynamic_num_ctx(self, mock_ollama, temp_db):
+        """Test num_ctx is the next power of two that fits, capped at the window."""
+        engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db, dynamic_num_ctx=True)
+        try:
+            assert engine._select_model("x" * 4000)[1] == 2048  # 1000 + 600 tokens
+            assert engine._select_model("x" * 100000)[1] == 8192
+        finally:
+            engine.close()
+
+
+class TestEndpoints:
+    """Test multi-endpoint client handling."""
+
+    def test_endpoints_warmed_up_and_assigned_round_robin(self, mock_ollama, temp_db):
+        """Test each endpoint is pre-warmed once and worker threads are spread across them."""
+        clients = [Mock(), Mock()]
+        clients[1].list.side_effect = ConnectionError("down")
+
+        with patch.object(EmailAnalysisEngine, '_create_client', side_effect=clients):
+            engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db, max_concurrency=2,
+                                         ollama_endpoints=['http://a:11434', 'http://b:11434'])
+        try:
+            assert all(c.list.call_count == 1 for c in clients)
+
+            picked = []
+            threads = [threading.Thread(target=lambda: picked.append(engine._client())) for _ in range(2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert sorted(map(id, picked)) == sorted(map(id, clients))
+        finally:
+            engine.close()
+
+
 class TestCaching:
     """Test AC8: Result caching."""
 
@@ -356,6 +574,7 @@ class TestCaching:
         }
 
         analysis_engine._cache_analysis(message_id, email, analysis)
+        assert analysis_engine.flush(timeout=5)
 
         # Verify it's in database
         import sqlite3
@@ -367,6 +586,31 @@ class TestCaching:
 
         assert row is not None
 
+    def test_queued_writes_flushed_without_close(self, mock_ollama, temp_db):
+        """Test that queued cache writes land when the engine is dropped or the process exits."""
+        import gc
+        import sqlite3
+
+        engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db)
+        worker = engine._storage
+        assert engine._storage_finalizer.atexit
+        email = {'metadata': {'from': 'test@example.com', 'subject': 'Test',
+                              'date': '2025-10-13', 'message_id': 'dropped_msg'}}
+        analysis = {'priority': 'Low', 'confidence': 0.5, 'summary': 'S', 'tags': [],
+                    'sentiment': 'neutral', 'action_items': [], 'processing_time_ms': 10,
+                    'tokens_per_second': 1.0, 'model_version': 'llama3.1:8b-instruct-q4_K_M'}
+        engine._cache_analysis('dropped_msg', email, analysis)
+
+        del engine
+        gc.collect()
+
+        assert not worker.is_running()
+        conn = sqlite3.connect(temp_db)
+        row = conn.execute('SELECT 1 FROM email_analysis WHERE message_id = ?',
+                           ('dropped_msg',)).fetchone()
+        conn.close()
+        assert row is not None
+
     def test_cache_retrieval(self, analysis_engine, temp_db):
         """Test that cached analysis can be retrieved."""
         message_id = 'test_msg_456'
@@ -426,6 +670,8 @@ class TestCaching:
 
         # Store with old model version
         analysis_engine._cache_analysis(message_id, email, analysis)
+        analysis_engine.flush(timeout=5)
+        analysis_engine.clear_memory_cache()
 
         # Try to retrieve (current model is different)
         cached = analysis_engine._get_cached_analysis(message_id)
@@ -433,6 +679,71 @@ class TestCaching:
         # Should return None (cache invalidated)
         assert cached is None
 
+    def test_cache_retrieval_before_write_completes(self, analysis_engine):
+        """Test that a queued analysis is visible before the background write lands."""
+        message_id = 'test_msg_pending'
+        email = {
+            'metadata': {
+                'from': 'test@example.com',
+                'subject': 'Test',
+                'date': '2025-10-13',
+                'message_id': message_id
+            }
+        }
+        analysis = {
+            'priority': 'High',
+            'summary': 'Pending write',
+            'processing_time_ms': 900,
+            'model_version': 'llama3.1:8b-instruct-q4_K_M'
+        }
+
+        # Hold the storage worker so the write stays queued
+        with patch.object(analysis_engine.db, 'insert_email_analysis_batch',
+                          side_effect=lambda records: time.sleep(0.2)):
+            analysis_engine._cache_analysis(message_id, email, analysis)
+            cached = analysis_engine._get_cached_analysis(message_id)
+            analysis_engine.flush(timeout=5)
+
+        assert cached is not None
+        assert cached['summary'] == 'Pending write'
+
+    def test_memory_cache_skips_database(self, analysis_engine):
+        """Test that repeat lookups are served from the in-memory LRU."""
+        analysis = {'priority': 'Low', 'summary': 'Hot', 'model_version': 'llama3.1:8b-instruct-q4_K_M'}
+        analysis_engine._remember_analysis(('hot_msg', 'llama3.1:8b-instruct-q4_K_M'), analysis)
+
+        with patch.object(analysis_engine.db, 'get_email_analysis') as mock_get:
+            cached = analysis_engine._get_cached_analysis('hot_msg')
+
+        mock_get.assert_not_called()
+        assert cached['summary'] == 'Hot'
+        # Callers get a copy, so marking a hit does not alter the cached entry
+        cached['cache_hit'] = True
+        assert 'cache_hit' not in analysis_engine._get_cached_analysis('hot_msg')
+
+    def test_cache_database_error_is_a_miss(self, analysis_engine):
+        """Test that database errors read as a cache miss but other errors propagate."""
+        from mailmind.database import QueryError
+
+        with patch.object(analysis_engine.db, 'get_email_analysis', side_effect=QueryError("locked")):
+            assert analysis_engine._get_cached_analysis('db_error_msg') is None
+
+        with patch.object(analysis_engine.db, 'get_email_analysis', side_effect=KeyError("bug")):
+            with pytest.raises(KeyError):
+                analysis_engine._get_cached_analysis('db_error_msg')
+
+    def test_memory_cache_evicts_oldest(self, mock_ollama, temp_db):
+        """Test that the LRU is bounded by cache_size."""
+        engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db, cache_size=2)
+        try:
+            model = mock_ollama.current_model
+            for message_id in ('m1', 'm2', 'm3'):
+                engine._remember_analysis((message_id, model), {'model_version': model})
+
+            assert list(engine._mem_cache) == [('m2', model), ('m3', model)]
+        finally:
+            engine.close()
+
 
 class TestBatchProcessing:
     """Test AC9: Batch processing."""
@@ -453,7 +764,7 @@ class TestBatchProcessing:
             for i in range(3)
         ]
 
-        mock_ollama.client.generate.return_value = sample_llm_response
+        mock_ollama.client.generate.side_effect = streamed(sample_llm_response)
 
         # Create engine with mocked preprocessor
         analysis_engine.preprocessor = mock_preprocessor
@@ -471,7 +782,7 @@ class TestBatchProcessing:
 
     def test_batch_with_callback(self, analysis_engine, mock_ollama, sample_llm_response):
         """Test batch processing with progress callback."""
-        mock_ollama.client.generate.return_value = sample_llm_response
+        mock_ollama.client.generate.side_effect = streamed(sample_llm_response)
 
         progress_updates = []
 
@@ -488,6 +799,77 @@ class TestBatchProcessing:
         assert len(progress_updates) == 3
         assert progress_updates[-1] == (3, 3)  # Final update
 
+    def test_concurrent_batch_preserves_order(self, mock_ollama, temp_db):
+        """Test that parallel batch results come back in input order."""
+        def generate(model, prompt, options, stream):
+            # Finish later emails first to exercise out-of-order completion
+            time.sleep(0.05 if 'Body 0' in prompt else 0.0)
+            summary = 'first' if 'Body 0' in prompt else 'other'
+            return iter([{'response': json.dumps({
+                'priority': 'Low', 'confidence': 0.9, 'summary': summary,
+                'tags': [], 'sentiment': 'neutral', 'action_items': []
+            })}])
+
+        mock_ollama.client.generate.side_effect = generate
+        engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db, max_concurrency=3)
+        try:
+            progress_updates = []
+            emails = [
+                {'subject': f'Email {i}', 'body': f'Body {i}', 'message_id': f'par_{i}'}
+                for i in range(3)
+            ]
+
+            results = engine.analyze_batch(
+                emails, callback=lambda current, total, result: progress_updates.append(current))
+        finally:
+            engine.close()
+
+        assert results[0]['summary'] == 'first'
+        assert [r['summary'] for r in results[1:]] == ['other', 'other']
+        assert progress_updates == [1, 2, 3]
+
+    def test_batch_cache_hits_skip_llm(self, analysis_engine, mock_ollama, sample_llm_response):
+        """Test that cached emails and preprocessing failures never reach the LLM."""
+        mock_ollama.client.generate.side_effect = streamed(sample_llm_response)
+        model = mock_ollama.current_model
+        analysis_engine._remember_analysis(
+            ('cached_msg', model), {'priority': 'Low', 'summary': 'Cached', 'model_version': model})
+
+        real_preprocess = analysis_engine.preprocessor.preprocess_email
+
+        def preprocess(raw_email):
+            if raw_email.get('message_id') == 'broken_msg':
+                raise ValueError("unparseable")
+            return real_preprocess(raw_email)
+
+        analysis_engine.preprocessor.preprocess_email = preprocess
+        emails = [
+            {'subject': 'Cached', 'body': 'Body', 'message_id': 'cached_msg'},
+            {'subject': 'Broken', 'body': 'Body', 'message_id': 'broken_msg'},
+            {'subject': 'Fresh', 'body': 'Body', 'message_id': 'fresh_msg'},
+        ]
+
+        results = analysis_engine.analyze_batch(emails)
+
+        assert results[0]['summary'] == 'Cached'
+        assert results[0]['cache_hit'] is True
+        assert 'unparseable' in results[1]['error']
+        assert results[2]['cache_hit'] is False
+        assert mock_ollama.client.generate.call_count == 1
+
+    def test_analyze_emails_for_batch_processor(self, analysis_engine, mock_ollama, sample_llm_response):
+        """Test the grouped EmailBatchProcessor entry point delegates to analyze_batch."""
+        mock_ollama.client.generate.side_effect = streamed(sample_llm_response)
+        emails = [
+            {'subject': f'Email {i}', 'body': f'Body {i}', 'message_id': f'grp_{i}'}
+            for i in range(2)
+        ]
+
+        results = analysis_engine.analyze_emails(emails, conn=Mock())
+
+        assert len(results) == 2
+        assert all('priority' in r for r in results)
+
 
 class TestPerformanceMetrics:
     """Test AC7: Performance monitoring."""
@@ -495,13 +877,28 @@ class TestPerformanceMetrics:
     def test_calculate_tokens_per_sec(self, analysis_engine):
         """Test tokens per second calculation."""
         response = {
-            'total_duration': 2000000000,  # 2 seconds in nanoseconds
+            'total_duration': 3000000000,  # Includes load + prompt evaluation
+            'eval_duration': 2000000000,  # 2 seconds of generation in nanoseconds
             'eval_count': 100
         }
 
         tokens_per_sec = analysis_engine._calculate_tokens_per_sec(response)
 
         assert tokens_per_sec == 50.0  # 100 tokens / 2 seconds
+        assert analysis_engine._calculate_tokens_per_sec({'eval_count': 100}) == 0.0
+
+    def test_adjust_concurrency_backs_off_on_saturation(self, mock_ollama, temp_db):
+        """Test that batch concurrency drops when tokens/sec collapses and recovers."""
+        engine = EmailAnalysisEngine(mock_ollama, db_path=temp_db, max_concurrency=4)
+        try:
+            engine._recent_tps.extend([50.0] * 8)
+            assert engine._adjust_concurrency(3) == 4
+
+            engine._recent_tps.extend([10.0] * 32)
+            assert engine._adjust_concurrency(4) == 3
+            assert engine._adjust_concurrency(1) == 1
+        finally:
+            engine.close()
 
     def test_performance_logging(self, analysis_engine, temp_db):
         """Test that performance metrics are logged."""
@@ -513,6 +910,7 @@ class TestPerformanceMetrics:
         }
 
         analysis_engine._log_performance(analysis, operation='test_analysis')
+        assert analysis_engine.flush(timeout=5)
 
         # Verify in database
         import sqlite3
@@ -553,6 +951,37 @@ class TestPerformanceMetrics:
         assert stats['avg_processing_time_ms'] > 0
 
 
+    def test_get_analysis_stats_aggregates_and_caches(self, analysis_engine, mock_ollama):
+        """Test that stats come from one SQL summary and are reused within the TTL."""
+        for i, priority in enumerate(['High', 'High', 'Low']):
+            analysis_engine._cache_analysis(
+                f'stats_{i}',
+                {'metadata': {'subject': 'S', 'from': 'a@example.com', 'date': '2025-10-13'}},
+                {'priority': priority, 'confidence': 0.9, 'sentiment': 'neutral',
+                 'processing_time_ms': 1000 + i * 500,
+                 'model_version': mock_ollama.current_model}
+            )
+
+        stats = analysis_engine.get_analysis_stats()
+
+        assert stats['total_analyses'] == 3
+        assert stats['priority_distribution'] == {'High': 2, 'Medium': 0, 'Low': 1}
+        assert stats['avg_processing_time_ms'] == 1500.0
+
+        with patch.object(analysis_engine.db, 'get_stats_summary') as mock_summary:
+            assert analysis_engine.get_analysis_stats() == stats
+        mock_summary.assert_not_called()
+
+    def test_get_analysis_stats_bounded_flush(self, analysis_engine):
+        """Test that a backed-up storage worker delays stats by at most STATS_FLUSH_TIMEOUT."""
+        with patch.object(analysis_engine._storage, 'flush', return_value=False) as mock_flush:
+            stats = analysis_engine.get_analysis_stats()
+
+        mock_flush.assert_called_once_with(analysis_engine.STATS_FLUSH_TIMEOUT)
+        assert stats['total_analyses'] == 0
+        # Stats from a partial flush are not reused
+        assert analysis_engine._stats_cache is None
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
@@ -0,0 +1,103 @@
+"""
+Unit Tests for StorageWorker
+
+Tests background batched writes used by EmailAnalysisEngine.
+
+Test Coverage:
+- Rows are grouped by kind and written in batches
+- flush() blocks until queued rows are written
+- Writer failures are logged without stopping the worker
+- stop() drains pending rows
+"""
+
+import threading
+
+import pytest
+
+from mailmind.database import StorageWorker
+
+
+@pytest.fixture
+def recorded():
+    """Collect batches passed to writers."""
+    return {'a': [], 'b': []}
+
+
+@pytest.fixture
+def worker(recorded):
+    """StorageWorker with two recording writers."""
+    w = StorageWorker({
+        'a': recorded['a'].append,
+        'b': recorded['b'].append,
+    }, batch_size=8, flush_interval=0.01)
+    yield w
+    w.stop()
+
+
+class TestStorageWorker:
+    """Test StorageWorker batching and lifecycle."""
+
+    def test_flush_writes_all_rows(self, worker, recorded):
+        """Test that flush returns only after queued rows are written."""
+        for i in range(20):
+            worker.put('a', i)
+        worker.put('b', 'x')
+
+        assert worker.flush(timeout=5) is True
+
+        written_a = [row for batch in recorded['a'] for row in batch]
+        assert written_a == list(range(20))
+        assert [row for batch in recorded['b'] for row in batch] == ['x']
+
+    def test_batches_respect_batch_size(self, worker, recorded):
+        """Test that no batch exceeds batch_size."""
+        for i in range(50):
+            worker.put('a', i)
+        worker.flush(timeout=5)
+
+        assert all(len(batch) <= 8 for batch in recorded['a'])
+
+    def test_unknown_kind_rejected(self, worker):
+        """Test that put() rejects kinds without a writer."""
+        with pytest.raises(ValueError):
+            worker.put('missing', 1)
+
+    def test_writer_failure_does_not_stop_worker(self):
+        """Test that a failing batch is dropped and later batches still run."""
+        written = []
+        calls = {'count': 0}
+
+        def flaky(rows):
+            calls['count'] += 1
+            if calls['count'] == 1:
+                raise RuntimeError("disk full")
+            written.extend(rows)
+
+        w = StorageWorker({'a': flaky}, flush_interval=0.01)
+        try:
+            w.put('a', 1)
+            w.flush(timeout=5)
+            w.put('a', 2)
+            w.flush(timeout=5)
+        finally:
+            w.stop()
+
+        assert written == [2]
+
+    def test_stop_drains_pending_rows(self):
+        """Test that stop() writes rows queued before it."""
+        written = []
+        gate = threading.Event()
+
+        def slow(rows):
+            gate.wait(5)
+            written.extend(rows)
+
+        w = StorageWorker({'a': slow}, flush_interval=0.01)
+        w.put('a', 1)
+        gate.set()
+        w.stop()
+
+        assert written == [1]
+        assert w.is_running() is False
+        assert w.flush(timeout=1) is False